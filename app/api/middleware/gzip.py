@@ -0,0 +1,33 @@
+"""
+Compression middleware for the FastAPI application.
+
+This module contains the GZip middleware used by the application, which
+leaves server-sent event streams uncompressed.
+"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
+
+from app.api.responses import EVENT_STREAM_MEDIA_TYPE
+
+class EventStreamGZipMiddleware(GZipMiddleware):
+    """GZip middleware that never compresses server-sent event streams."""
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Pass event stream requests through untouched and compress the rest.
+        
+        Compressing an event stream buffers its events until the compressor
+        flushes, so clients that accept one are never compressed, whatever the
+        installed Starlette version does for text/event-stream responses.
+        
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] == "http" and EVENT_STREAM_MEDIA_TYPE in Headers(scope=scope).get("accept", ""):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
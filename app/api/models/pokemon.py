@@ -6,7 +6,17 @@ for Pokemon-related API endpoints.
 """
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared configuration for response models
+RESPONSE_MODEL_CONFIG = ConfigDict(populate_by_name=True)
+
+# Configuration for response models with a fully known, immutable field set
+FROZEN_MODEL_CONFIG = ConfigDict(
+    **RESPONSE_MODEL_CONFIG,
+    frozen=True,
+    extra="forbid",
+)
 
 # Request Models
 class ChatRequest(BaseModel):
@@ -17,6 +27,8 @@ class ChatRequest(BaseModel):
 # Response Models
 class PokemonStats(BaseModel):
     """Model for Pokemon base stats."""
+    model_config = FROZEN_MODEL_CONFIG
+    
     hp: int = Field(..., description="Hit Points stat")
     attack: int = Field(..., description="Attack stat")
     defense: int = Field(..., description="Defense stat")
@@ -26,8 +38,10 @@ class PokemonStats(BaseModel):
 
 class PokemonResearchDetails(BaseModel):
     """Model for detailed Pokemon research information."""
+    model_config = ConfigDict(**RESPONSE_MODEL_CONFIG, from_attributes=True)
+    
     name: str = Field(..., description="Name of the Pokemon")
-    base_stats: Dict[str, int] = Field(..., description="Base stats of the Pokemon")
+    base_stats: PokemonStats = Field(..., description="Base stats of the Pokemon")
     types: List[str] = Field(..., description="Types of the Pokemon")
     abilities: List[str] = Field(..., description="Abilities of the Pokemon")
     height: float = Field(..., description="Height in meters")
@@ -38,16 +52,27 @@ class PokemonResearchDetails(BaseModel):
 
 class BattleAnalysis(BaseModel):
     """Model for battle analysis results."""
+    model_config = FROZEN_MODEL_CONFIG
+    
     pokemon_1: str = Field(..., description="Name of the first Pokemon")
     pokemon_2: str = Field(..., description="Name of the second Pokemon")
     analysis: str = Field(..., description="Detailed analysis of the battle")
     reasoning: str = Field(..., description="Reasoning for determining the winner")
     winner: str = Field(..., description="Name of the Pokemon that would likely win the battle")
 
+class Reflection(BaseModel):
+    """Model for the supervisor agent's reflection on a user question."""
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    reasoning: str = Field(..., description="Reasoning behind the answer")
+    answer: Optional[str] = Field(None, description="Answer reached after reflection")
+
 class SupervisorResult(BaseModel):
     """Model for supervisor agent results."""
+    model_config = FROZEN_MODEL_CONFIG
+    
     answer: str = Field(..., description="Final answer after reflection and analysis")
-    reflection: Dict[str, str] = Field(..., description="Reflection on the question and answer process")
+    reflection: Reflection = Field(..., description="Reflection on the question and answer process")
     search_queries: Optional[List[str]] = Field(None, description="Queries sent to the search API")
     needs_search: bool = Field(False, description="Indicates if the query requires a search")
     is_pokemon_query: bool = Field(..., description="Indicates if the query is about Pokémon")
@@ -55,15 +80,27 @@ class SupervisorResult(BaseModel):
 
 class FinalAnswer(BaseModel):
     """Model for the final answer generated from search results."""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     answer: str = Field(..., description="Final answer generated from search results")
     sources: List[Dict[str, Any]] = Field(..., description="Sources used to generate the answer")
 
+class ChatResponsePayload(BaseModel):
+    """Model for the standard chat response payload."""
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    supervisor_result: SupervisorResult = Field(..., description="Result of the supervisor agent")
+    pokemon_research: Dict[str, PokemonResearchDetails] = Field(default_factory=dict, description="Research results keyed by Pokemon name")
+    battle_analysis: Optional[BattleAnalysis] = Field(None, description="Battle analysis if two Pokemon were researched")
+    final_answer: Optional[FinalAnswer] = Field(None, description="Final answer generated from search results")
+
 class ChatResponse(BaseModel):
     """Response model for the chat endpoint."""
-    response: Optional[Dict[str, Any]] = Field(None, description="Response containing supervisor result, Pokemon research, battle analysis, and final answer if applicable")
+    response: Optional[ChatResponsePayload] = Field(None, description="Response containing supervisor result, Pokemon research, battle analysis, and final answer if applicable")
     
     # Allow direct Pokemon data to be returned and provide example schema
     model_config = {
+        **RESPONSE_MODEL_CONFIG,
         "extra": "allow",
         "json_schema_extra": {
             "example": {
@@ -87,6 +124,8 @@ class ChatResponse(BaseModel):
 
 class BattleResponse(BaseModel):
     """Response model for the battle endpoint."""
-    pokemon1: Dict[str, Any] = Field(..., description="Research results for the first Pokemon")
-    pokemon2: Dict[str, Any] = Field(..., description="Research results for the second Pokemon")
-    battle_analysis: Dict[str, Any] = Field(..., description="Analysis of the battle between the two Pokemon")
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    pokemon1: PokemonResearchDetails = Field(..., description="Research results for the first Pokemon")
+    pokemon2: PokemonResearchDetails = Field(..., description="Research results for the second Pokemon")
+    battle_analysis: BattleAnalysis = Field(..., description="Analysis of the battle between the two Pokemon")
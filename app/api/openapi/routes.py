@@ -4,10 +4,38 @@ Routes for OpenAPI documentation.
 This module contains the routes for the OpenAPI documentation endpoints.
 """
 
-from fastapi import APIRouter, FastAPI
-from fastapi.responses import HTMLResponse
+import hashlib
+from typing import Awaitable, Callable
+
+from fastapi import APIRouter, FastAPI, Request, Response, status
 
 from app.api.openapi.swagger_ui import get_custom_swagger_ui_html, get_custom_redoc_html
+from app.api.responses import etag_matches
+
+def _conditional_handler(response: Response) -> Callable[[Request], Awaitable[Response]]:
+    """
+    Create a handler that serves a pre-rendered page with an ETag.
+    
+    Args:
+        response: The pre-rendered page
+        
+    Returns:
+        Callable: Route handler returning the page, or an empty 304 response if
+        the client already has it
+    """
+    body = response.body
+    media_type = response.media_type
+    # GZip may compress the body under the same tag, so caches key on the encoding too
+    headers = {"ETag": f'"{hashlib.sha1(body).hexdigest()}"', "Vary": "Accept-Encoding"}
+    
+    async def handler(request: Request) -> Response:
+        if etag_matches(request, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        # Middleware such as GZip rewrites the headers of the response it sends,
+        # so each request gets its own response around the shared body
+        return Response(content=body, media_type=media_type, headers=headers)
+    
+    return handler
 
 def create_docs_router(app: FastAPI = None) -> APIRouter:
     """
@@ -21,15 +49,13 @@ def create_docs_router(app: FastAPI = None) -> APIRouter:
     """
     router = APIRouter(tags=["Documentation"])
     
-    # Create closures that capture the app instance
-    def get_swagger_ui():
-        return get_custom_swagger_ui_html(app)
-    
-    def get_redoc():
-        return get_custom_redoc_html(app)
-    
-    # Add routes with the closures as handlers
-    router.add_api_route("/docs", get_swagger_ui, methods=["GET"], include_in_schema=False)
-    router.add_api_route("/redoc", get_redoc, methods=["GET"], include_in_schema=False)
+    # The documentation pages are static, so render and tag them once up front;
+    # handlers only take the request, so FastAPI has no dependencies to resolve
+    router.add_api_route(
+        "/docs", _conditional_handler(get_custom_swagger_ui_html(app)), methods=["GET"], include_in_schema=False
+    )
+    router.add_api_route(
+        "/redoc", _conditional_handler(get_custom_redoc_html(app)), methods=["GET"], include_in_schema=False
+    )
     
     return router
@@ -9,23 +9,10 @@ from fastapi.openapi.utils import get_openapi
 
 from app.core.config import settings
 
-def custom_openapi(app: FastAPI) -> dict:
-    """
-    Generate a custom OpenAPI schema for the application.
-    
-    Args:
-        app: FastAPI application instance
-        
-    Returns:
-        dict: Custom OpenAPI schema
-    """
-    if app.openapi_schema:
-        return app.openapi_schema
-    
-    openapi_schema = get_openapi(
-        title=settings.PROJECT_NAME,
-        version="1.0.0",
-        description="""## Pokemon AI Agents API
+# The patches below never change, so they are built once at import time and
+# assigned into the generated schema on the first call to custom_openapi
+
+_API_DESCRIPTION = """## Pokemon AI Agents API
 
 This API provides endpoints to interact with the Pokemon AI Agents system powered by LLMs. 
 
@@ -77,88 +64,215 @@ response = requests.get(
 )
 print(json.dumps(response.json(), indent=2))
 ```
-        """,
+        """
+
+# Endpoint paths patched by custom_openapi, fixed for the life of the process
+_CHAT_PATH = f"{settings.API_V1_STR}/pokemon/chat"
+_BATTLE_PATH = f"{settings.API_V1_STR}/pokemon/battle"
+
+_OPENAPI_TAGS = [
+    {
+        "name": "Pokemon",
+        "description": "Endpoints for Pokemon research and battle analysis using AI",
+        "externalDocs": {
+            "description": "Pokemon API Documentation",
+            "url": "https://pokeapi.co/docs/v2"
+        }
+    },
+    {
+        "name": "General",
+        "description": "General endpoints for the application including health checks and documentation"
+    },
+]
+
+# Generic request schema for the chat endpoint
+_CHAT_REQUEST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "message": {
+            "type": "string",
+            "description": "User's message or query"
+        }
+    },
+    "required": ["message"]
+}
+
+# Generic response schema for the chat endpoint
+_CHAT_RESPONSE_200_CONTENT = {
+    "application/json": {
+        "schema": {
+            "type": "object",
+            "properties": {
+                "response": {
+                    "type": "object",
+                    "properties": {
+                        "supervisor_result": {
+                            "type": "object"
+                        },
+                        "pokemon_research": {
+                            "type": "object"
+                        },
+                        "battle_analysis": {
+                            "type": "object",
+                            "nullable": True
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Generic response schema for the battle endpoint
+_BATTLE_RESPONSE_200_CONTENT = {
+    "application/json": {
+        "schema": {
+            "type": "object",
+            "properties": {
+                "pokemon1": {
+                    "type": "object",
+                    "description": "First Pokemon details"
+                },
+                "pokemon2": {
+                    "type": "object",
+                    "description": "Second Pokemon details"
+                },
+                "battle_analysis": {
+                    "type": "object",
+                    "properties": {
+                        "pokemon_1": {"type": "string"},
+                        "pokemon_2": {"type": "string"},
+                        "analysis": {"type": "string"},
+                        "reasoning": {"type": "string"},
+                        "winner": {"type": "string"}
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Error responses for the battle endpoint
+_BATTLE_404 = {
+    "description": "Pokemon not found",
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "detail": {"type": "string"}
+                }
+            }
+        }
+    }
+}
+
+_BATTLE_422 = {
+    "description": "Validation Error",
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "loc": {"type": "array"},
+                                "msg": {"type": "string"},
+                                "type": {"type": "string"}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+_BATTLE_500 = {
+    "description": "Internal server error",
+    "content": {
+        "application/json": {
+            "examples": {
+                "API Limit Exceeded": {
+                    "summary": "External API limit exceeded",
+                    "description": "When an external API rate limit is reached",
+                    "value": {
+                        "detail": "API rate limit exceeded. Please try again later."
+                    }
+                },
+                "Battle Analysis Error": {
+                    "summary": "Error during battle analysis",
+                    "description": "When the battle analysis fails",
+                    "value": {
+                        "detail": "An error occurred while analyzing the battle between the specified Pokemon."
+                    }
+                },
+                "Research Error": {
+                    "summary": "Error during Pokemon research",
+                    "description": "When Pokemon research fails",
+                    "value": {
+                        "detail": "An error occurred while researching Pokemon information."
+                    }
+                }
+            }
+        }
+    }
+}
+
+def custom_openapi(app: FastAPI) -> dict:
+    """
+    Generate a custom OpenAPI schema for the application.
+    
+    Args:
+        app: FastAPI application instance
+        
+    Returns:
+        dict: Custom OpenAPI schema
+    """
+    if app.openapi_schema:
+        return app.openapi_schema
+    
+    openapi_schema = get_openapi(
+        title=settings.PROJECT_NAME,
+        version="1.0.0",
+        description=_API_DESCRIPTION,
         routes=app.routes,
     )
     
     # Add custom tags metadata
-    openapi_schema["tags"] = [
-        {
-            "name": "Pokemon",
-            "description": "Endpoints for Pokemon research and battle analysis using AI",
-            "externalDocs": {
-                "description": "Pokemon API Documentation",
-                "url": "https://pokeapi.co/docs/v2"
-            }
-        },
-        {
-            "name": "General",
-            "description": "General endpoints for the application including health checks and documentation"
-        },
-    ]
+    openapi_schema["tags"] = _OPENAPI_TAGS
     
     # Add examples to schema
     if "paths" in openapi_schema:
         # Chat endpoint examples
-        if f"{settings.API_V1_STR}/pokemon/chat" in openapi_schema["paths"]:
-            chat_path = openapi_schema["paths"][f"{settings.API_V1_STR}/pokemon/chat"]
+        if _CHAT_PATH in openapi_schema["paths"]:
+            chat_path = openapi_schema["paths"][_CHAT_PATH]
             
             if "post" in chat_path:
                 post_op = chat_path["post"]
                 
                 # Remove all examples from chat endpoint request
                 if "requestBody" in post_op and "content" in post_op["requestBody"]:
-                    # Remove example field to avoid hardcoded message in schema
-                    if "example" in post_op["requestBody"]["content"]["application/json"]:
-                        del post_op["requestBody"]["content"]["application/json"]["example"]
+                    json_content = post_op["requestBody"]["content"]["application/json"]
                     
-                    # Remove examples field to avoid hardcoded Pokemon examples in UI
-                    if "examples" in post_op["requestBody"]["content"]["application/json"]:
-                        del post_op["requestBody"]["content"]["application/json"]["examples"]
+                    # Remove example fields to avoid hardcoded Pokemon examples in UI
+                    json_content.pop("example", None)
+                    json_content.pop("examples", None)
                     
                     # Modify schema to use a generic format
-                    if "schema" in post_op["requestBody"]["content"]["application/json"]:
-                        post_op["requestBody"]["content"]["application/json"]["schema"] = {
-                            "type": "object",
-                            "properties": {
-                                "message": {
-                                    "type": "string",
-                                    "description": "User's message or query"
-                                }
-                            },
-                            "required": ["message"]
-                        }
+                    if "schema" in json_content:
+                        json_content["schema"] = _CHAT_REQUEST_SCHEMA
                 
                 # Add generic schema for response
                 if "responses" in post_op and "200" in post_op["responses"]:
-                    post_op["responses"]["200"]["content"] = {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "response": {
-                                        "type": "object",
-                                        "properties": {
-                                            "supervisor_result": {
-                                                "type": "object"
-                                            },
-                                            "pokemon_research": {
-                                                "type": "object"
-                                            },
-                                            "battle_analysis": {
-                                                "type": "object",
-                                                "nullable": True
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
+                    post_op["responses"]["200"]["content"] = _CHAT_RESPONSE_200_CONTENT
         
         # Battle endpoint examples
-        if f"{settings.API_V1_STR}/pokemon/battle" in openapi_schema["paths"]:
-            battle_path = openapi_schema["paths"][f"{settings.API_V1_STR}/pokemon/battle"]
+        if _BATTLE_PATH in openapi_schema["paths"]:
+            battle_path = openapi_schema["paths"][_BATTLE_PATH]
             
             if "get" in battle_path:
                 get_op = battle_path["get"]
@@ -166,120 +280,25 @@ print(json.dumps(response.json(), indent=2))
                 # Remove all examples from battle endpoint parameters
                 if "parameters" in get_op:
                     for param in get_op["parameters"]:
-                        # Remove example field to avoid hardcoded Pokemon in schema
-                        if "example" in param:
-                            del param["example"]
-                        
-                        # Remove examples field to avoid hardcoded Pokemon examples in UI
-                        if "examples" in param:
-                            del param["examples"]
+                        # Remove example fields to avoid hardcoded Pokemon examples in UI
+                        param.pop("example", None)
+                        param.pop("examples", None)
                         
                         # Add generic schema property
                         if param["name"] in ["pokemon1", "pokemon2"]:
                             param["schema"] = {"type": "string"}
                 
-                # Add example responses
-                # Remove response examples from battle endpoint
-                if "responses" in get_op and "200" in get_op["responses"]:
-                    # Remove examples and replace with generic schema
-                    if "content" in get_op["responses"]["200"]:
-                        get_op["responses"]["200"]["content"] = {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "pokemon1": {
-                                            "type": "object",
-                                            "description": "First Pokemon details"
-                                        },
-                                        "pokemon2": {
-                                            "type": "object",
-                                            "description": "Second Pokemon details"
-                                        },
-                                        "battle_analysis": {
-                                            "type": "object",
-                                            "properties": {
-                                                "pokemon_1": {"type": "string"},
-                                                "pokemon_2": {"type": "string"},
-                                                "analysis": {"type": "string"},
-                                                "reasoning": {"type": "string"},
-                                                "winner": {"type": "string"}
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                
-                # Add error responses
                 if "responses" in get_op:
-                    get_op["responses"]["404"] = {
-                        "description": "Pokemon not found",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {"type": "string"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    
-                    get_op["responses"]["422"] = {
-                        "description": "Validation Error",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "array",
-                                            "items": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "loc": {"type": "array"},
-                                                    "msg": {"type": "string"},
-                                                    "type": {"type": "string"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
+                    # Replace response examples with a generic schema
+                    if "200" in get_op["responses"] and "content" in get_op["responses"]["200"]:
+                        get_op["responses"]["200"]["content"] = _BATTLE_RESPONSE_200_CONTENT
                     
-                    get_op["responses"]["500"] = {
-                        "description": "Internal server error",
-                        "content": {
-                            "application/json": {
-                                "examples": {
-                                    "API Limit Exceeded": {
-                                        "summary": "External API limit exceeded",
-                                        "description": "When an external API rate limit is reached",
-                                        "value": {
-                                            "detail": "API rate limit exceeded. Please try again later."
-                                        }
-                                    },
-                                    "Battle Analysis Error": {
-                                        "summary": "Error during battle analysis",
-                                        "description": "When the battle analysis fails",
-                                        "value": {
-                                            "detail": "An error occurred while analyzing the battle between the specified Pokemon."
-                                        }
-                                    },
-                                    "Research Error": {
-                                        "summary": "Error during Pokemon research",
-                                        "description": "When Pokemon research fails",
-                                        "value": {
-                                            "detail": "An error occurred while researching Pokemon information."
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
+                    # Add error responses
+                    get_op["responses"]["404"] = _BATTLE_404
+                    get_op["responses"]["422"] = _BATTLE_422
+                    get_op["responses"]["500"] = _BATTLE_500
+    
+    # Cache the schema so subsequent /openapi.json hits skip the rebuild
+    app.openapi_schema = openapi_schema
     
     return openapi_schema
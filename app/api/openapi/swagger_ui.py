@@ -7,41 +7,10 @@ This module contains the custom Swagger UI HTML template for the API documentati
 from fastapi import FastAPI
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.responses import HTMLResponse
+from typing import Optional
 
-def get_custom_swagger_ui_html(app: FastAPI) -> HTMLResponse:
-    """
-    Generate a custom Swagger UI HTML response.
-    
-    Args:
-        app: FastAPI application instance
-        
-    Returns:
-        HTMLResponse: Custom Swagger UI HTML response
-    """
-    # Get the default Swagger UI HTML response
-    swagger_ui = get_swagger_ui_html(
-        openapi_url=app.openapi_url,
-        title=f"{app.title} - Interactive API Documentation",
-        oauth2_redirect_url=app.swagger_ui_oauth2_redirect_url,
-        swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
-        swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css",
-        swagger_favicon_url="https://fastapi.tiangolo.com/img/favicon.png",
-        init_oauth=None,
-        swagger_ui_parameters={
-            "docExpansion": "list",  # Show operations as expanded by default
-            "defaultModelsExpandDepth": 3,  # Expand models to show all properties
-            "defaultModelExpandDepth": 3,  # Expand nested models
-            "tryItOutEnabled": True,  # Enable Try it out by default
-            "persistAuthorization": True,  # Remember auth between page refreshes
-            "filter": True,  # Enable filtering operations
-            "displayRequestDuration": True,  # Show request duration
-            "showExtensions": True,  # Show vendor extensions
-            "showCommonExtensions": True,  # Show common extensions
-        }
-    )
-    
-    # Add custom CSS to the HTML content
-    pokemon_css = """
+# Custom CSS and help section injected into the Swagger UI page
+POKEMON_CSS = """
     <style>
         /* Pokemon-themed color scheme */
         :root {
@@ -298,16 +267,72 @@ def get_custom_swagger_ui_html(app: FastAPI) -> HTMLResponse:
             <strong>Tip:</strong> Try different Pokemon combinations to see detailed battle analysis results!
         </div>
     </div>
+"""
+POKEMON_CSS_BYTES = POKEMON_CSS.encode("utf-8")
+
+# Swagger UI display options
+_SWAGGER_UI_PARAMETERS = {
+    "docExpansion": "list",  # Show operations as expanded by default
+    "defaultModelsExpandDepth": 3,  # Expand models to show all properties
+    "defaultModelExpandDepth": 3,  # Expand nested models
+    "tryItOutEnabled": True,  # Enable Try it out by default
+    "persistAuthorization": True,  # Remember auth between page refreshes
+    "filter": True,  # Enable filtering operations
+    "displayRequestDuration": True,  # Show request duration
+    "showExtensions": True,  # Show vendor extensions
+    "showCommonExtensions": True,  # Show common extensions
+}
+
+# Rendered documentation responses, built on the first request and reused afterwards
+_SWAGGER_RESPONSE: Optional[HTMLResponse] = None
+_REDOC_RESPONSE: Optional[HTMLResponse] = None
+
+def get_custom_swagger_ui_html(app: FastAPI) -> HTMLResponse:
     """
+    Generate a custom Swagger UI HTML response.
+    
+    Args:
+        app: FastAPI application instance
+        
+    Returns:
+        HTMLResponse: Custom Swagger UI HTML response
+    """
+    global _SWAGGER_RESPONSE
+    
+    # The page is identical for every request, so serve the cached response
+    if _SWAGGER_RESPONSE is not None:
+        return _SWAGGER_RESPONSE
+    
+    # Read the app settings once for the single render
+    openapi_url = app.openapi_url
+    title = app.title
+    oauth2_redirect_url = app.swagger_ui_oauth2_redirect_url
     
-    # Get the HTML content from the response
-    html_content = swagger_ui.body.decode("utf-8")
+    # Get the default Swagger UI HTML response
+    swagger_ui = get_swagger_ui_html(
+        openapi_url=openapi_url,
+        title=f"{title} - Interactive API Documentation",
+        oauth2_redirect_url=oauth2_redirect_url,
+        swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
+        swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css",
+        swagger_favicon_url="https://fastapi.tiangolo.com/img/favicon.png",
+        init_oauth=None,
+        swagger_ui_parameters=_SWAGGER_UI_PARAMETERS
+    )
     
     # Insert the custom CSS and HTML before the closing </body> tag
-    html_content = html_content.replace("</body>", f"{pokemon_css}</body>")
+    body_bytes = swagger_ui.body
+    idx = body_bytes.rfind(b"</body>")
+    if idx == -1:
+        # No closing tag to insert before, so append the block to the page
+        idx = len(body_bytes)
     
-    # Create a new response with the modified HTML content
-    return HTMLResponse(content=html_content)
+    # Create the response with the modified HTML content once
+    _SWAGGER_RESPONSE = HTMLResponse(
+        content=body_bytes[:idx] + POKEMON_CSS_BYTES + body_bytes[idx:],
+        media_type="text/html"
+    )
+    return _SWAGGER_RESPONSE
 
 def get_custom_redoc_html(app: FastAPI) -> HTMLResponse:
     """
@@ -319,10 +344,15 @@ def get_custom_redoc_html(app: FastAPI) -> HTMLResponse:
     Returns:
         HTMLResponse: Custom ReDoc HTML response
     """
-    return get_redoc_html(
-        openapi_url=app.openapi_url,
-        title=f"{app.title} - ReDoc",
-        redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js",
-        redoc_favicon_url="https://fastapi.tiangolo.com/img/favicon.png",
-        with_google_fonts=True
-    )
+    global _REDOC_RESPONSE
+    
+    if _REDOC_RESPONSE is None:
+        _REDOC_RESPONSE = get_redoc_html(
+            openapi_url=app.openapi_url,
+            title=f"{app.title} - ReDoc",
+            redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js",
+            redoc_favicon_url="https://fastapi.tiangolo.com/img/favicon.png",
+            with_google_fonts=True
+        )
+    
+    return _REDOC_RESPONSE
@@ -0,0 +1,112 @@
+"""
+Response classes for the FastAPI application.
+
+This module contains custom response classes and helpers for negotiating
+between JSON and MessagePack response bodies, for formatting server-sent
+events and for answering conditional requests.
+"""
+
+from typing import Any
+
+import orjson
+import ormsgpack
+from fastapi import Request
+from fastapi.responses import ORJSONResponse, Response
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+class MsgPackResponse(Response):
+    """Response that renders its content as MessagePack."""
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize the content with ormsgpack.
+
+        Args:
+            content: The content to serialize
+
+        Returns:
+            bytes: The MessagePack-encoded content
+        """
+        return ormsgpack.packb(content, option=ormsgpack.OPT_SERIALIZE_PYDANTIC)
+
+def accepts_msgpack(request: Request) -> bool:
+    """
+    Check whether the client asked for a MessagePack response.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        bool: True if the Accept header includes the MessagePack media type
+    """
+    return MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+def negotiated_response(request: Request, content: Any) -> Response:
+    """
+    Build a MessagePack or JSON response based on the Accept header.
+
+    JSON stays the default so browsers and existing clients are unaffected.
+
+    Args:
+        request: The incoming request
+        content: The content to return
+
+    Returns:
+        Response: A MsgPackResponse if requested, otherwise an ORJSONResponse
+    """
+    if accepts_msgpack(request):
+        return MsgPackResponse(content=content)
+    return ORJSONResponse(content=content)
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the If-None-Match header matches an entity tag.
+
+    Uses the weak comparison that If-None-Match calls for, so a tag the client
+    got back with a W/ prefix still matches, and accepts tag lists and "*".
+
+    Args:
+        request: The incoming request
+        etag: The current entity tag of the resource
+
+    Returns:
+        bool: True if the client already has the current version
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    opaque_tag = etag.removeprefix("W/")
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+def accepts_event_stream(request: Request) -> bool:
+    """
+    Check whether the client asked for a server-sent event stream.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        bool: True if the Accept header includes the event stream media type
+    """
+    return EVENT_STREAM_MEDIA_TYPE in request.headers.get("accept", "")
+
+def format_sse(event: str, data: Any) -> bytes:
+    """
+    Format a server-sent event with a JSON payload.
+
+    Args:
+        event: The event name
+        data: The event data, serialized as JSON
+
+    Returns:
+        bytes: The encoded event, terminated by a blank line
+    """
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + orjson.dumps(data) + b"\n\n"
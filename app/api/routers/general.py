@@ -4,116 +4,165 @@ General router for the FastAPI application.
 This module contains general routes for the application, such as the root endpoint.
 """
 
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from pathlib import Path
+from typing import Optional, Tuple
+import hashlib
 import os
 
+from app.api.responses import etag_matches
+
 # Create router
 router = APIRouter(
     tags=["General"],
     responses={404: {"description": "Not found"}},
 )
 
+# Location of the root page, resolved once at import time
+_STATIC_DIR = Path(__file__).resolve().parents[3] / "static"
+_INDEX_PATH = _STATIC_DIR / "index.html"
+
+# Root page written to static/index.html if the file does not exist yet
+_DEFAULT_INDEX_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Pokemon AI Agents API</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        h1 {
+            color: #e91e63;
+            border-bottom: 2px solid #e91e63;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #0277bd;
+            margin-top: 30px;
+        }
+        code {
+            background-color: #f5f5f5;
+            padding: 2px 5px;
+            border-radius: 3px;
+            font-family: 'Courier New', Courier, monospace;
+        }
+        pre {
+            background-color: #f5f5f5;
+            padding: 15px;
+            border-radius: 5px;
+            overflow-x: auto;
+        }
+        .endpoint {
+            background-color: #e3f2fd;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+            border-left: 5px solid #0277bd;
+        }
+        .method {
+            font-weight: bold;
+            color: #0277bd;
+        }
+    </style>
+</head>
+<body>
+    <h1>Pokemon AI Agents API</h1>
+    <p>Welcome to the Pokemon AI Agents API. This API provides endpoints to interact with the Pokemon AI Agents system.</p>
+
+    <h2>API Documentation</h2>
+    <p>For detailed API documentation, please visit the <a href="/docs">Swagger UI</a>.</p>
+
+    <h2>Available Endpoints</h2>
+
+    <div class="endpoint">
+        <p><span class="method">POST</span> <code>/api/v1/pokemon/chat</code></p>
+        <p>Process a chat message using the supervisor agent. This endpoint handles general queries as well as Pokémon-specific queries.</p>
+        <p>Example request:</p>
+        <pre>
+{
+    "message": "Your message here"
+}
+        </pre>
+    </div>
+
+    <div class="endpoint">
+        <p><span class="method">GET</span> <code>/api/v1/pokemon/battle?pokemon1=pokemon_name_1&pokemon2=pokemon_name_2</code></p>
+        <p>Analyze a battle between two Pokemon. This endpoint researches both Pokemon and analyzes a potential battle between them.</p>
+    </div>
+
+    <h2>GitHub Repository</h2>
+    <p>The source code for this API is available on <a href="https://github.com/yourusername/pokemon-ai-agents">GitHub</a>.</p>
+</body>
+</html>
+""".encode("utf-8")
+
+# Browser caching policy for the root page
+_INDEX_CACHE_CONTROL = "public, max-age=3600"
+
+# Cached root page validator as (mtime_ns, etag), refreshed when index.html changes
+_INDEX_HTML_CACHE: Optional[Tuple[int, str]] = None
+
+def _load_index_html() -> Tuple[Path, os.stat_result, str]:
+    """
+    Locate the root HTML page, hashing it only when it has changed.
+    
+    Returns:
+        Tuple[Path, os.stat_result, str]: The path to index.html, its stat
+        result and its strong ETag
+    """
+    global _INDEX_HTML_CACHE
+    
+    # Check if index.html exists, if not create a simple one
+    try:
+        stat_result = _INDEX_PATH.stat()
+    except FileNotFoundError:
+        os.makedirs(_STATIC_DIR, exist_ok=True)  # Create the directory if it doesn't exist
+        with open(_INDEX_PATH, "wb") as f:
+            f.write(_DEFAULT_INDEX_HTML)
+        stat_result = _INDEX_PATH.stat()
+    
+    # Recompute the ETag only if the file was modified since it was cached
+    if _INDEX_HTML_CACHE is None or _INDEX_HTML_CACHE[0] != stat_result.st_mtime_ns:
+        with open(_INDEX_PATH, "rb") as f:
+            etag = f'"{hashlib.sha1(f.read()).hexdigest()}"'
+        _INDEX_HTML_CACHE = (stat_result.st_mtime_ns, etag)
+    
+    return _INDEX_PATH, stat_result, _INDEX_HTML_CACHE[1]
+
 @router.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def root():
+async def root(request: Request):
     """
     Root endpoint to serve the HTML page.
     
+    Args:
+        request: The incoming request, checked for a matching If-None-Match header
+        
     Returns:
-        HTMLResponse: The HTML content for the root page
+        FileResponse: The HTML file for the root page, sent with sendfile where
+        available, or an empty 304 response if the client already has the
+        current version
     """
     try:
-        static_dir = Path(__file__).parent.parent.parent.parent / "static"
-        os.makedirs(static_dir, exist_ok=True)  # Create the directory if it doesn't exist
+        index_path, stat_result, etag = _load_index_html()
+        headers = {"ETag": etag, "Cache-Control": _INDEX_CACHE_CONTROL, "Vary": "Accept-Encoding"}
         
-        # Check if index.html exists, if not create a simple one
-        index_path = static_dir / "index.html"
-        if not index_path.exists():
-            with open(index_path, "w") as f:
-                f.write("""
-                <!DOCTYPE html>
-                <html lang="en">
-                <head>
-                    <meta charset="UTF-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                    <title>Pokemon AI Agents API</title>
-                    <style>
-                        body {
-                            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                            line-height: 1.6;
-                            color: #333;
-                            max-width: 800px;
-                            margin: 0 auto;
-                            padding: 20px;
-                        }
-                        h1 {
-                            color: #e91e63;
-                            border-bottom: 2px solid #e91e63;
-                            padding-bottom: 10px;
-                        }
-                        h2 {
-                            color: #0277bd;
-                            margin-top: 30px;
-                        }
-                        code {
-                            background-color: #f5f5f5;
-                            padding: 2px 5px;
-                            border-radius: 3px;
-                            font-family: 'Courier New', Courier, monospace;
-                        }
-                        pre {
-                            background-color: #f5f5f5;
-                            padding: 15px;
-                            border-radius: 5px;
-                            overflow-x: auto;
-                        }
-                        .endpoint {
-                            background-color: #e3f2fd;
-                            padding: 15px;
-                            border-radius: 5px;
-                            margin-bottom: 20px;
-                            border-left: 5px solid #0277bd;
-                        }
-                        .method {
-                            font-weight: bold;
-                            color: #0277bd;
-                        }
-                    </style>
-                </head>
-                <body>
-                    <h1>Pokemon AI Agents API</h1>
-                    <p>Welcome to the Pokemon AI Agents API. This API provides endpoints to interact with the Pokemon AI Agents system.</p>
-                    
-                    <h2>API Documentation</h2>
-                    <p>For detailed API documentation, please visit the <a href="/docs">Swagger UI</a>.</p>
-                    
-                    <h2>Available Endpoints</h2>
-                    
-                    <div class="endpoint">
-                        <p><span class="method">POST</span> <code>/api/v1/pokemon/chat</code></p>
-                        <p>Process a chat message using the supervisor agent. This endpoint handles general queries as well as Pokémon-specific queries.</p>
-                        <p>Example request:</p>
-                        <pre>
-                {
-                    "message": "Your message here"
-                }
-                        </pre>
-                    </div>
-                    
-                    <div class="endpoint">
-                        <p><span class="method">GET</span> <code>/api/v1/pokemon/battle?pokemon1=pokemon_name_1&pokemon2=pokemon_name_2</code></p>
-                        <p>Analyze a battle between two Pokemon. This endpoint researches both Pokemon and analyzes a potential battle between them.</p>
-                    </div>
-                    
-                    <h2>GitHub Repository</h2>
-                    <p>The source code for this API is available on <a href="https://github.com/yourusername/pokemon-ai-agents">GitHub</a>.</p>
-                </body>
-                </html>
-                """)
+        if etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
         
-        with open(index_path) as f:
-            return f.read()
+        return FileResponse(
+            index_path,
+            media_type="text/html",
+            headers=headers,
+            stat_result=stat_result
+        )
     
     except Exception as e:
         raise HTTPException(
@@ -4,19 +4,35 @@ Pokemon router for the FastAPI application.
 This module contains the routes for the Pokemon-related endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Body, status
-from typing import Dict, Any, List, Annotated, Optional
-import json
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Body, Request, status
+from fastapi.responses import Response, StreamingResponse
+from typing import Dict, Any, List, Annotated, Optional, Iterator, AsyncIterator
+import asyncio
 import datetime
+import logging
 
+import orjson
+from pydantic import ValidationError
+
+from langchain_core.messages import AIMessage, HumanMessage
 from langchain_openai import ChatOpenAI
 from langchain_community.utilities.tavily_search import TavilySearchAPIWrapper
 
-from app.core.dependencies import get_llm, get_search_wrapper
-from app.api.models.pokemon import ChatRequest, ChatResponse, BattleResponse
-from app.services.pokemon.research import research_pokemon, analyze_pokemon_battle
-from app.services.agents.supervisor import process_query, process_search_results
-from app.utils.helpers.tool_executor import execute_tools
+from app.core.config import settings
+from app.core.dependencies import get_llm, get_search_wrapper, get_tool_executor, get_chat_cache, get_supervisor_cache
+from app.api.models.pokemon import ChatRequest, ChatResponse, ChatResponsePayload, BattleResponse
+from app.api.responses import (
+    EVENT_STREAM_MEDIA_TYPE,
+    MsgPackResponse,
+    accepts_event_stream,
+    accepts_msgpack,
+    format_sse,
+    negotiated_response
+)
+from app.services.pokemon.cache import cached_research_batch, cached_battle
+from app.services.agents.supervisor import _loose_parse, process_query, process_search_results, stream_search_results
+from app.utils.helpers.semantic_cache import SemanticCache
+from app.utils.helpers.tool_executor import ToolExecutor, execute_tools
 from app.utils.helpers.langsmith_integration import (
     configure_langsmith, 
     create_langsmith_agent, 
@@ -35,21 +51,409 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+def _incomplete_output_detail(error: ValidationError) -> str:
+    """
+    Describe which fields of the agents' output failed response validation.
+    
+    Args:
+        error: The validation error raised for the agent output
+        
+    Returns:
+        str: Error detail naming the missing or invalid fields
+    """
+    fields = ", ".join(".".join(str(part) for part in err["loc"]) for err in error.errors())
+    return f"The agents returned incomplete data: {fields}"
+
+def _stream_battle_response(battle_response: BattleResponse) -> Iterator[bytes]:
+    """
+    Serialize a battle response as JSON, one top-level field at a time.
+    
+    Args:
+        battle_response: The validated battle response
+        
+    Yields:
+        bytes: Consecutive chunks of the JSON document
+    """
+    yield b'{"pokemon1":'
+    yield orjson.dumps(battle_response.pokemon1.model_dump(mode="json", exclude_none=True))
+    yield b',"pokemon2":'
+    yield orjson.dumps(battle_response.pokemon2.model_dump(mode="json", exclude_none=True))
+    yield b',"battle_analysis":'
+    yield orjson.dumps(battle_response.battle_analysis.model_dump(mode="json", exclude_none=True))
+    yield b'}'
+
+def _battle_http_response(http_request: Request, battle_response: BattleResponse) -> Response:
+    """
+    Return a validated battle response as MessagePack if requested, otherwise as streamed JSON.
+    
+    Args:
+        http_request: The incoming HTTP request, used for content negotiation
+        battle_response: The validated battle response
+        
+    Returns:
+        Response: A MsgPackResponse, or a StreamingResponse of the JSON document
+    """
+    if accepts_msgpack(http_request):
+        return MsgPackResponse(content=battle_response.model_dump(mode="json", exclude_none=True))
+    return StreamingResponse(
+        _stream_battle_response(battle_response),
+        media_type="application/json"
+    )
+
+def _schedule_auto_dataset(background_tasks: BackgroundTasks, query: str, result: Any) -> None:
+    """
+    Add a query and result to the LangSmith auto dataset after the response is sent.
+    
+    Args:
+        background_tasks: The background tasks of the current request
+        query: The user query
+        result: The agent's response
+    """
+    if result and settings.LANGSMITH_API_KEY:
+        background_tasks.add_task(add_to_auto_dataset, query, result)
+
+async def _chat_events(
+    request: ChatRequest,
+    llm: ChatOpenAI,
+    search_wrapper: TavilySearchAPIWrapper,
+    tool_executor: ToolExecutor,
+    background_tasks: BackgroundTasks,
+    supervisor_cache: Optional[SemanticCache] = None,
+    stream_tokens: bool = False
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run the chat pipeline, yielding progress events and finally the response.
+    
+    Args:
+        request: ChatRequest containing the user message
+        llm: The language model to use
+        search_wrapper: The search wrapper to use
+        tool_executor: The tool executor used for searches
+        background_tasks: Background tasks that run once the response is sent
+        supervisor_cache: The supervisor decision cache, or None if caching is unavailable
+        stream_tokens: Whether to stream the tokens of search-backed answers
+        
+    Yields:
+        Dict[str, Any]: Events with an ``event`` name and ``data``. The last event
+        is ``result``, whose data is the response content and whose ``cacheable``
+        flag says whether the content may be served to later requests.
+    """
+    # Configure LangSmith - this is now handled automatically in run_with_langsmith
+    
+    # Check if we should use the LangGraph implementation
+    # use_langgraph is now defined at the module level
+    
+    if use_langgraph:
+        yield {"event": "progress", "data": {"stage": "agent"}}
+        
+        # Create the LangSmith agent
+        agent = create_langsmith_agent(llm, search_wrapper)
+        
+        # Run the agent with LangSmith tracing in a worker thread so the event loop stays free
+        result = await asyncio.to_thread(
+            run_with_langsmith,
+            agent,
+            request.message,
+            metadata={
+                "source": "api", 
+                "endpoint": "chat",
+                "timestamp": str(datetime.datetime.now()),
+                "client_info": request.client_info if hasattr(request, "client_info") else None
+            },
+            auto_create_dataset=False
+        )
+        
+        # Add to the dataset for future evaluation without delaying the response
+        _schedule_auto_dataset(background_tasks, request.message, result)
+        
+        # Extract messages, Pokemon research, and battle analysis from the state
+        messages = result.get("messages", [])
+        pokemon_research_data = result.get("pokemon_research_data", {})
+        battle_analysis_result = result.get("battle_analysis_result")
+        search_results = result.get("search_results")
+        
+        # If we have Pokemon research, return it directly
+        if pokemon_research_data:
+            # For battle queries, include the battle analysis in the response
+            if battle_analysis_result:
+                pokemon_research_data["battle_analysis"] = battle_analysis_result
+            yield {"event": "result", "data": pokemon_research_data, "cacheable": True}
+            return
+        
+        # If we have search results, create a final answer
+        if search_results:
+            final_answer = await process_search_results(request.message, search_results, llm)
+        else:
+            final_answer = None
+        
+        # Create a supervisor result from the last AI message
+        last_ai_message = next((m for m in reversed(messages) if getattr(m, "type", None) == "ai"), None)
+        
+        supervisor_result = {
+            "answer": last_ai_message.content if last_ai_message else "",
+            "reflection": {"reasoning": "Processed using LangGraph"},
+            "is_pokemon_query": bool(pokemon_research_data),
+            "pokemon_names": list(pokemon_research_data.keys()) if pokemon_research_data else None,
+            "needs_search": bool(search_results)
+        }
+        
+        # The graph already ran the search, so return its answer without
+        # falling through to the supervisor path below
+        chat_response = ChatResponse(response=ChatResponsePayload(
+            supervisor_result=supervisor_result,
+            final_answer=final_answer
+        ))
+        yield {
+            "event": "result",
+            "data": chat_response.model_dump(mode="json", exclude_none=True),
+            "cacheable": not search_results,
+            "semantic": True
+        }
+        return
+    
+    # Process the query using the original supervisor agent
+    yield {"event": "progress", "data": {"stage": "supervisor"}}
+    supervisor_result = await process_query(request.message, llm, search_wrapper, supervisor_cache)
+    
+    # Report a supervisor failure as is; its error dict is not a supervisor result
+    if "error" in supervisor_result:
+        yield {"event": "result", "data": {"response": {"supervisor_result": supervisor_result}}, "cacheable": False}
+        return
+    
+    # Read the routing flags once
+    needs_search = supervisor_result.get("needs_search", False)
+    is_pokemon_query = supervisor_result.get("is_pokemon_query", False)
+    # Normalize the Pokemon names once, dropping duplicates; the supervisor
+    # schema already limits them to 2
+    pokemon_names = list(dict.fromkeys(
+        pokemon_name.casefold() for pokemon_name in supervisor_result.get("pokemon_names") or ()
+    ))
+    
+    # Initialize response
+    response = {
+        "supervisor_result": supervisor_result,
+        "pokemon_research": {},
+        "battle_analysis": None,
+        "final_answer": None
+    }
+    
+    # If search is needed, process the search results and generate a final answer
+    if needs_search:
+        # Create a mock state with the original question, passing the
+        # supervisor result through as a dict rather than serialized JSON
+        mock_state = [
+            HumanMessage(content=request.message),
+            AIMessage(content="", additional_kwargs={"structured": supervisor_result})
+        ]
+        
+        # Execute the search using the original question
+        yield {"event": "progress", "data": {"stage": "searching"}}
+        try:
+            search_results = await asyncio.to_thread(execute_tools, mock_state, tool_executor)
+        except Exception as e:
+            search_results = []
+            response["final_answer"] = {"answer": f"Error executing search: {str(e)}", "sources": []}
+        
+        # If search results were found, process them
+        if search_results and len(search_results) > 0:
+            # Extract the raw search results from the ToolMessage, falling
+            # back to parsing its content if no artifact was attached
+            search_data = getattr(search_results[0], "artifact", None)
+            if search_data is None:
+                search_data = search_results[0].content
+                if isinstance(search_data, str):
+                    try:
+                        search_data = _loose_parse(search_data)
+                    except ValueError:
+                        # Keep the raw text if it is not a structured payload
+                        pass
+            
+            try:
+                # Process the search results to generate a final answer,
+                # forwarding the answer tokens to streaming clients
+                if stream_tokens:
+                    final_answer = None
+                    async for event in stream_search_results(request.message, search_data, llm):
+                        if event["event"] == "final_answer":
+                            final_answer = event["data"]
+                        else:
+                            yield event
+                else:
+                    final_answer = await process_search_results(request.message, search_data, llm)
+                
+                # Ensure final_answer is a dictionary with answer and sources
+                if isinstance(final_answer, dict):
+                    if "answer" not in final_answer:
+                        final_answer["answer"] = "No answer was generated from the search results."
+                    if "sources" not in final_answer:
+                        final_answer["sources"] = []
+                else:
+                    # If final_answer is not a dictionary, convert it to one
+                    final_answer = {
+                        "answer": str(final_answer),
+                        "sources": []
+                    }
+                
+                # Add the final answer to the response
+                response["final_answer"] = final_answer
+            except Exception as e:
+                # Add error information to the response
+                response["final_answer"] = {"answer": f"Error processing search results: {str(e)}", "sources": []}
+        else:
+            response["final_answer"] = {"answer": "No search results were found for your query.", "sources": []}
+    
+    # If it's a Pokemon query, research the Pokemon
+    if is_pokemon_query:
+        # Research the Pokemon together in a single researcher call
+        yield {"event": "progress", "data": {"stage": "researching", "pokemon": pokemon_names}}
+        research_results = await asyncio.to_thread(cached_research_batch, pokemon_names, llm)
+        
+        # Research results are already normalized by the research service; names
+        # are only capitalized for the response keys
+        pokemon_research = {
+            pokemon_name.capitalize(): research_result
+            for pokemon_name, research_result in zip(pokemon_names, research_results)
+        }
+        
+        # If two Pokemon were researched successfully, analyze the battle
+        if len(pokemon_research) == 2 and not any("error" in result for result in research_results):
+            first_name, second_name = pokemon_research
+            yield {"event": "progress", "data": {"stage": "analyzing_battle"}}
+            battle_analysis = await asyncio.to_thread(cached_battle, first_name, second_name, pokemon_research, llm)
+            response["battle_analysis"] = battle_analysis
+        else:
+            response["battle_analysis"] = None
+        
+        # If there are Pokemon results, return only the Pokemon research data
+        if pokemon_research:
+            # For battle queries, include the battle analysis in the response
+            if response.get("battle_analysis"):
+                # Add the battle analysis as a top-level key in the response
+                yield {
+                    "event": "result",
+                    "data": {**pokemon_research, "battle_analysis": response["battle_analysis"]},
+                    "cacheable": True
+                }
+                return
+            yield {"event": "result", "data": pokemon_research, "cacheable": True}
+            return
+    
+    # Only return the simplified Pokemon data if it's a Pokemon query
+    # Otherwise, validate the standard response once and return it without null fields
+    # Search-backed answers depend on current information, so they are not cached,
+    # and only general answers may be served to similar messages
+    try:
+        chat_response = ChatResponse(response=ChatResponsePayload.model_validate(response))
+    except ValidationError as e:
+        yield {"event": "result", "data": {"error": _incomplete_output_detail(e)}, "cacheable": False}
+        return
+    yield {
+        "event": "result",
+        "data": chat_response.model_dump(mode="json", exclude_none=True),
+        "cacheable": not needs_search,
+        "semantic": not is_pokemon_query
+    }
+
+
+async def _cache_chat_content(
+    chat_cache: Optional[SemanticCache],
+    message: str,
+    content: Dict[str, Any],
+    cacheable: bool = True,
+    semantic: bool = False
+) -> None:
+    """
+    Cache a chat response for the message.
+    
+    Args:
+        chat_cache: The chat response cache, or None if caching is unavailable
+        message: The user's message
+        content: The response content
+        cacheable: Whether the content may be served to later requests
+        semantic: Whether the content may be served to similar messages; Pokemon
+            results are only served to the exact message, since near-identical
+            queries about different Pokemon would otherwise share an answer
+    """
+    # Research errors are transient, so only successful results are cached
+    if cacheable and chat_cache is not None and not any(
+        isinstance(value, dict) and "error" in value for value in content.values()
+    ):
+        await asyncio.to_thread(chat_cache.put, message, content, semantic)
+
+async def _stream_chat(
+    request: ChatRequest,
+    chat_cache: Optional[SemanticCache],
+    llm: ChatOpenAI,
+    search_wrapper: TavilySearchAPIWrapper,
+    tool_executor: ToolExecutor,
+    background_tasks: BackgroundTasks,
+    supervisor_cache: Optional[SemanticCache] = None
+) -> AsyncIterator[bytes]:
+    """
+    Run the chat pipeline, streaming its events as server-sent events.
+    
+    Args:
+        request: ChatRequest containing the user message
+        chat_cache: The chat response cache, or None if caching is unavailable
+        llm: The language model to use
+        search_wrapper: The search wrapper to use
+        tool_executor: The tool executor used for searches
+        background_tasks: Background tasks that run once the stream is finished
+        supervisor_cache: The supervisor decision cache, or None if caching is unavailable
+        
+    Yields:
+        bytes: Encoded ``progress`` and ``token`` events, then ``result`` and
+        ``done``, or an ``error`` event if the pipeline failed
+    """
+    try:
+        cached_content = None
+        if chat_cache is not None:
+            cached_content = await asyncio.to_thread(chat_cache.get, request.message)
+        
+        if cached_content is not None:
+            yield format_sse("result", cached_content)
+        else:
+            async for event in _chat_events(
+                request, llm, search_wrapper, tool_executor, background_tasks, supervisor_cache, stream_tokens=True
+            ):
+                if event["event"] == "result":
+                    await _cache_chat_content(
+                        chat_cache, request.message, event["data"], event["cacheable"], event.get("semantic", False)
+                    )
+                yield format_sse(event["event"], event["data"])
+        
+        yield format_sse("done", {})
+    except Exception as e:
+        yield format_sse("error", {"detail": f"An error occurred while processing the request: {str(e)}"})
+
+# Pre-serialized health check body, so probes skip serialization entirely
+_HEALTH_BODY = orjson.dumps({"status": "ok", "message": "Pokemon API is running"})
+
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check():
     """
     Health check endpoint to verify the API is running.
     
     Returns:
-        Dict with status message
+        JSON response with status message
     """
-    return {"status": "ok", "message": "Pokemon API is running"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
-@router.post("/chat", response_model=ChatResponse, status_code=status.HTTP_200_OK)
+@router.post(
+    "/chat",
+    response_model=None,
+    responses={200: {"model": ChatResponse}},
+    status_code=status.HTTP_200_OK
+)
 async def chat(
+    http_request: Request,
+    background_tasks: BackgroundTasks,
     request: ChatRequest = Body(..., description="User's message or query"),
     llm: ChatOpenAI = Depends(get_llm),
-    search_wrapper: TavilySearchAPIWrapper = Depends(get_search_wrapper)
+    search_wrapper: TavilySearchAPIWrapper = Depends(get_search_wrapper),
+    tool_executor: ToolExecutor = Depends(get_tool_executor),
+    chat_cache: Optional[SemanticCache] = Depends(get_chat_cache),
+    supervisor_cache: Optional[SemanticCache] = Depends(get_supervisor_cache)
 ):
     """
     Process a chat message using the supervisor agent.
@@ -59,201 +463,52 @@ async def chat(
     If the query mentions two Pokémon, it will also analyze a potential battle between them.
     
     Args:
+        http_request: The incoming HTTP request, used for content negotiation
+        background_tasks: Background tasks for analytics that run once the response is sent
         request: ChatRequest containing the user message
         
     Returns:
-        ChatResponse containing the agent's response with supervisor results, 
-        Pokémon research (if applicable), and battle analysis (if applicable)
+        ChatResponse (JSON, or MessagePack if requested via Accept) containing the agent's response with supervisor results, 
+        Pokémon research (if applicable), and battle analysis (if applicable).
+        Clients that accept text/event-stream instead receive progress events and search answer tokens
+        as server-sent events, followed by the same content in a ``result`` event.
         
 
     """
     try:
-        # Configure LangSmith - this is now handled automatically in run_with_langsmith
+        # Stream progress and answer tokens to clients that asked for server-sent events
+        if accepts_event_stream(http_request):
+            return StreamingResponse(
+                _stream_chat(request, chat_cache, llm, search_wrapper, tool_executor, background_tasks, supervisor_cache),
+                media_type=EVENT_STREAM_MEDIA_TYPE
+            )
         
-        # Check if we should use the LangGraph implementation
-        # use_langgraph is now defined at the module level
+        # Serve repeated and near-duplicate questions from the response cache
+        if chat_cache is not None:
+            cached_content = await asyncio.to_thread(chat_cache.get, request.message)
+            if cached_content is not None:
+                return negotiated_response(http_request, cached_content)
         
-        if use_langgraph:
-            # Create the LangSmith agent
-            agent = create_langsmith_agent(llm, search_wrapper)
-            
-            # Run the agent with LangSmith tracing and automatic dataset creation
-            result = run_with_langsmith(
-                agent,
-                request.message,
-                metadata={
-                    "source": "api", 
-                    "endpoint": "chat",
-                    "timestamp": str(datetime.datetime.now()),
-                    "client_info": request.client_info if hasattr(request, "client_info") else None
-                },
-                auto_create_dataset=True  # Automatically add to dataset for future evaluation
+        # Progress events are only sent to streaming clients
+        async for event in _chat_events(request, llm, search_wrapper, tool_executor, background_tasks, supervisor_cache):
+            pass
+        
+        # Agent output that failed validation is reported as a bad gateway;
+        # streaming clients receive the same detail in the result event
+        if "error" in event["data"]:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=event["data"]["error"]
             )
-            
-            # Extract messages, Pokemon research, and battle analysis from the state
-            messages = result.get("messages", [])
-            pokemon_research_data = result.get("pokemon_research_data", {})
-            battle_analysis_result = result.get("battle_analysis_result")
-            search_results = result.get("search_results")
-            
-            # If we have Pokemon research, return it directly
-            if pokemon_research_data:
-                # For battle queries, include the battle analysis in the response
-                if battle_analysis_result:
-                    pokemon_research_data["battle_analysis"] = battle_analysis_result
-                return pokemon_research_data
-            
-            # If we have search results, create a final answer
-            if search_results:
-                final_answer = process_search_results(request.message, search_results, llm)
-            else:
-                final_answer = None
-            
-            # Create a supervisor result from the last AI message
-            last_ai_message = None
-            for message in reversed(messages):
-                if hasattr(message, 'type') and message.type == "ai":
-                    last_ai_message = message
-                    break
-            
-            supervisor_result = {
-                "answer": last_ai_message.content if last_ai_message else "",
-                "reflection": {"reasoning": "Processed using LangGraph"},
-                "is_pokemon_query": bool(pokemon_research_data),
-                "pokemon_names": list(pokemon_research_data.keys()) if pokemon_research_data else None,
-                "needs_search": bool(search_results)
-            }
-        else:
-            # Process the query using the original supervisor agent
-            supervisor_result = process_query(request.message, llm, search_wrapper)
-        
-        # Initialize response
-        response = {
-            "supervisor_result": supervisor_result,
-            "pokemon_research": {},
-            "battle_analysis": None,
-            "final_answer": None
-        }
         
-        # If search is needed, process the search results and generate a final answer
-        if supervisor_result.get("needs_search", False):
-            # Create a mock state with the original question
-            from langchain_core.messages import AIMessage, HumanMessage
-            mock_state = [
-                HumanMessage(content=request.message),
-                AIMessage(content=json.dumps(supervisor_result))
-            ]
-            
-            # Execute the search using the original question
-            from app.utils.helpers.tool_executor import ToolExecutor
-            tool_executor = ToolExecutor([search_wrapper])
-            
-            try:
-                search_results = execute_tools(mock_state, tool_executor)
-            except Exception as e:
-                search_results = []
-                response["final_answer"] = {"answer": f"Error executing search: {str(e)}", "sources": []}
-            
-            # If search results were found, process them
-            if search_results and len(search_results) > 0:
-                # Extract the search results from the ToolMessage
-                search_data = search_results[0].content
-                
-                # If search_data is a string, try to parse it as JSON
-                if isinstance(search_data, str):
-                    try:
-                        # First, try to parse it directly
-                        parsed_data = json.loads(search_data)
-                        search_data = parsed_data
-                    except json.JSONDecodeError:
-                        # If that fails, try to extract the JSON part
-                        try:
-                            # Extract the part that looks like JSON
-                            import re
-                            json_match = re.search(r'\{"[^"]+":\s*\[.+\]\}', search_data)
-                            if json_match:
-                                json_str = json_match.group(0)
-                                parsed_data = json.loads(json_str)
-                                search_data = parsed_data
-                            else:
-                                # Try to fix single quotes to double quotes
-                                import ast
-                                try:
-                                    # Use ast.literal_eval to safely evaluate the string as a Python literal
-                                    python_obj = ast.literal_eval(search_data)
-                                    # Convert to proper JSON
-                                    search_data = python_obj
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                
-                try:
-                    # Process the search results to generate a final answer
-                    final_answer = process_search_results(request.message, search_data, llm)
-                    
-                    # Ensure final_answer is a dictionary with answer and sources
-                    if isinstance(final_answer, dict):
-                        if "answer" not in final_answer:
-                            final_answer["answer"] = "No answer was generated from the search results."
-                        if "sources" not in final_answer:
-                            final_answer["sources"] = []
-                    else:
-                        # If final_answer is not a dictionary, convert it to one
-                        final_answer = {
-                            "answer": str(final_answer),
-                            "sources": []
-                        }
-                    
-                    # Add the final answer to the response
-                    response["final_answer"] = final_answer
-                except Exception as e:
-                    # Add error information to the response
-                    response["final_answer"] = {"answer": f"Error processing search results: {str(e)}", "sources": []}
-            else:
-                response["final_answer"] = {"answer": "No search results were found for your query.", "sources": []}
-        
-        # If it's a Pokemon query, research the Pokemon
-        if supervisor_result.get("is_pokemon_query", False):
-            pokemon_names = supervisor_result.get("pokemon_names", [])
-            
-            # Research each Pokemon
-            pokemon_research = {}
-            for pokemon_name in pokemon_names[:2]:  # Limit to 2 Pokemon
-                research_result = research_pokemon(pokemon_name, llm)
-                
-                # Create the simplified Pokemon data structure
-                simplified_result = {
-                    "name": research_result.get("name", "").lower(),
-                    "pokemon_details": research_result.get("pokemon_details", []),
-                    "base_stats": research_result.get("base_stats", {}),
-                    "types": [t.lower() for t in research_result.get("types", [])],
-                    "abilities": [a.lower() for a in research_result.get("abilities", [])],
-                    "height": research_result.get("height", 0),
-                    "weight": research_result.get("weight", 0)
-                }
-                
-                pokemon_research[pokemon_name.capitalize()] = simplified_result
-            
-            # If two Pokemon are mentioned, analyze the battle
-            if len(pokemon_research) == 2:
-                battle_analysis = analyze_pokemon_battle(pokemon_research, llm)
-                response["battle_analysis"] = battle_analysis
-            else:
-                response["battle_analysis"] = None
-            
-            # If there are Pokemon results, return only the Pokemon research data
-            if pokemon_research:
-                # For battle queries, include the battle analysis in the response
-                if response.get("battle_analysis"):
-                    # Add the battle analysis as a top-level key in the response
-                    return {**pokemon_research, "battle_analysis": response["battle_analysis"]}
-                return pokemon_research
-        
-        # Only return the simplified Pokemon data if it's a Pokemon query
-        # Otherwise, return the standard response
-        return {"response": response}
+        await _cache_chat_content(
+            chat_cache, request.message, event["data"], event["cacheable"], event.get("semantic", False)
+        )
+        return negotiated_response(http_request, event["data"])
     
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -291,7 +546,7 @@ async def get_langsmith_runs(
             filter_criteria["pokemon_name"] = pokemon_name
             
         # Get recent runs with filtering
-        runs = get_recent_runs(limit=limit, filter_criteria=filter_criteria)
+        runs = await asyncio.to_thread(get_recent_runs, limit=limit, filter_criteria=filter_criteria)
         
         # Return the runs
         return {
@@ -309,8 +564,15 @@ async def get_langsmith_runs(
             detail=f"An error occurred while retrieving LangSmith runs: {str(e)}"
         )
 
-@router.get("/battle", response_model=BattleResponse, status_code=status.HTTP_200_OK)
+@router.get(
+    "/battle",
+    response_model=None,
+    responses={200: {"model": BattleResponse}},
+    status_code=status.HTTP_200_OK
+)
 async def battle(
+    http_request: Request,
+    background_tasks: BackgroundTasks,
     pokemon1: Annotated[str, Query(
         ..., 
         description="Name of the first Pokemon", 
@@ -334,6 +596,8 @@ async def battle(
     along with an analysis of which Pokemon would likely win in a battle based on these attributes.
     
     Args:
+        http_request: The incoming HTTP request, used for content negotiation
+        background_tasks: Background tasks for analytics that run once the response is sent
         pokemon1: Name of the first Pokemon (case-insensitive)
         pokemon2: Name of the second Pokemon (case-insensitive)
         
@@ -354,8 +618,9 @@ async def battle(
             # Create the LangSmith agent
             agent = create_langsmith_agent(llm, search_wrapper)
             
-            # Run the agent with LangSmith tracing
-            result = run_with_langsmith(
+            # Run the agent with LangSmith tracing in a worker thread
+            result = await asyncio.to_thread(
+                run_with_langsmith,
                 agent,
                 battle_query,
                 metadata={
@@ -365,23 +630,36 @@ async def battle(
                     "pokemon2": pokemon2,
                     "timestamp": str(datetime.datetime.now())
                 },
-                auto_create_dataset=True  # Automatically add to dataset for future evaluation
+                auto_create_dataset=False
             )
             
-            # If we have battle analysis in the result, return it
-            if result and "battle_analysis" in result:
-                return result
+            # Add to the dataset for future evaluation without delaying the response
+            _schedule_auto_dataset(background_tasks, battle_query, result)
+            
+            # If the graph researched both Pokemon and analyzed the battle, return
+            # its results in the same validated response as the fallback; the raw
+            # state also holds message objects that cannot be serialized
+            graph_research = (result or {}).get("pokemon_research_data") or {}
+            graph_analysis = (result or {}).get("battle_analysis_result")
+            if graph_analysis and len(graph_research) == 2:
+                graph_pokemon1, graph_pokemon2 = graph_research.values()
+                battle_response = BattleResponse.model_validate({
+                    "pokemon1": graph_pokemon1,
+                    "pokemon2": graph_pokemon2,
+                    "battle_analysis": graph_analysis
+                })
+                return _battle_http_response(http_request, battle_response)
                 
             # If LangGraph worked but didn't produce battle analysis, fall back to traditional approach
         except Exception as e:
             # Log the error but continue with the traditional approach
-            import logging
             logging.error(f"Error using LangGraph for battle analysis: {e}")
         
         # Traditional approach as fallback
-        # Research both Pokemon
-        pokemon1_research = research_pokemon(pokemon1, llm)
-        pokemon2_research = research_pokemon(pokemon2, llm)
+        # Research both Pokemon together in a single researcher call
+        pokemon1_research, pokemon2_research = await asyncio.to_thread(
+            cached_research_batch, [pokemon1, pokemon2], llm
+        )
         
         # Check for errors
         if "error" in pokemon1_research:
@@ -402,14 +680,26 @@ async def battle(
             pokemon2: pokemon2_research
         }
         
-        battle_analysis = analyze_pokemon_battle(pokemon_research, llm)
+        battle_analysis = await asyncio.to_thread(cached_battle, pokemon1, pokemon2, pokemon_research, llm)
+        if "error" in battle_analysis:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=battle_analysis["error"]
+            )
         
-        # Return the response
-        return {
-            "pokemon1": pokemon1_research,
-            "pokemon2": pokemon2_research,
-            "battle_analysis": battle_analysis
-        }
+        # Validate the agent output once, then stream the typed response
+        try:
+            battle_response = BattleResponse.model_validate({
+                "pokemon1": pokemon1_research,
+                "pokemon2": pokemon2_research,
+                "battle_analysis": battle_analysis
+            })
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=_incomplete_output_detail(e)
+            )
+        return _battle_http_response(http_request, battle_response)
     
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -6,54 +6,91 @@ used throughout the application.
 """
 
 import os
-from pydantic_settings import BaseSettings
+from typing import Any
+
+from pydantic import model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv(verbose=True)
 
 class Settings(BaseSettings):
-    """Application settings."""
+    """
+    Application settings.
+    
+    Every field is read from the environment (or the .env file) by
+    pydantic-settings, using the field name as the variable name.
+    """
+    
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=".env",
+        extra="ignore",
+        frozen=True,
+    )
     
     # API settings
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Pokemon AI Agents API"
-    API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
-    API_PORT: int = int(os.getenv("API_PORT", "8088"))
-    API_DEBUG: bool = os.getenv("API_DEBUG", "True").lower() == "true"
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8088
+    API_DEBUG: bool = True
+    # Number of server processes started by entrypoint.sh; 1 runs a single process with auto-reload
+    API_WORKERS: int = 1
     
     # Streamlit settings
-    STREAMLIT_HOST: str = os.getenv("STREAMLIT_HOST", "0.0.0.0")
-    STREAMLIT_PORT: int = int(os.getenv("STREAMLIT_PORT", "8501"))
+    STREAMLIT_HOST: str = "0.0.0.0"
+    STREAMLIT_PORT: int = 8501
     
     # CORS settings
     BACKEND_CORS_ORIGINS: list[str] = ["*"]
     
     # LLM settings
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    LLM_MODEL: str = os.getenv("LLM_MODEL", "gpt-4o")
+    OPENAI_API_KEY: str = ""
+    LLM_MODEL: str = "gpt-4o"
+    
+    # Chat response cache settings
+    CHAT_CACHE_TTL: int = 3600
+    CHAT_CACHE_SEMANTIC: bool = False
+    CHAT_CACHE_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    CHAT_CACHE_SIMILARITY_THRESHOLD: float = 0.92
     
     # Pokemon API settings
     POKEMON_API_BASE_URL: str = "https://pokeapi.co/api/v2/pokemon"
+    # SQLite file that keeps fetched Pokemon data across restarts; disabled if empty
+    POKEMON_CACHE_PATH: str = ""
     
     # Search API settings
-    TAVILY_API_KEY: str = os.getenv("TAVILY_API_KEY", "")
+    TAVILY_API_KEY: str = ""
     
     # LangSmith settings
-    LANGCHAIN_API_KEY: str = os.getenv("LANGCHAIN_API_KEY", "")
-    LANGSMITH_TRACING: bool = os.getenv("LANGSMITH_TRACING", "true").lower() == "true"
-    LANGSMITH_ENDPOINT: str = os.getenv("LANGSMITH_ENDPOINT", "https://api.smith.langchain.com")
-    LANGSMITH_API_KEY: str = os.getenv("LANGSMITH_API_KEY", "")
-    LANGSMITH_PROJECT: str = os.getenv("LANGSMITH_PROJECT", "pokemon-ai-agents")
+    LANGCHAIN_API_KEY: str = ""
+    LANGSMITH_TRACING: bool = True
+    LANGSMITH_ENDPOINT: str = "https://api.smith.langchain.com"
+    LANGSMITH_API_KEY: str = ""
+    LANGSMITH_PROJECT: str = "pokemon-ai-agents"
     
-    # LangChain environment variables (for compatibility)
-    LANGCHAIN_TRACING_V2: bool = LANGSMITH_TRACING
-    LANGCHAIN_ENDPOINT: str = LANGSMITH_ENDPOINT
-    LANGCHAIN_PROJECT: str = LANGSMITH_PROJECT
+    # LangChain environment variables (for compatibility); unless set explicitly,
+    # they default to the matching LangSmith settings
+    LANGCHAIN_TRACING_V2: bool = True
+    LANGCHAIN_ENDPOINT: str = "https://api.smith.langchain.com"
+    LANGCHAIN_PROJECT: str = "pokemon-ai-agents"
     
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
+    @model_validator(mode="before")
+    @classmethod
+    def _default_langchain_settings(cls, data: Any) -> Any:
+        """Default unset LangChain settings to the matching LangSmith settings."""
+        if isinstance(data, dict):
+            data = dict(data)
+            for langchain_key, langsmith_key in (
+                ("LANGCHAIN_TRACING_V2", "LANGSMITH_TRACING"),
+                ("LANGCHAIN_ENDPOINT", "LANGSMITH_ENDPOINT"),
+                ("LANGCHAIN_PROJECT", "LANGSMITH_PROJECT"),
+            ):
+                if langchain_key not in data and langsmith_key in data:
+                    data[langchain_key] = data[langsmith_key]
+        return data
         
     def validate(self):
         """Validate the settings."""
@@ -84,10 +121,10 @@ class Settings(BaseSettings):
 settings = Settings().validate()
 
 # Set LangChain environment variables for compatibility
-os.environ["LANGCHAIN_TRACING_V2"] = str(settings.LANGSMITH_TRACING).lower()
-os.environ["LANGCHAIN_ENDPOINT"] = settings.LANGSMITH_ENDPOINT
+os.environ["LANGCHAIN_TRACING_V2"] = str(settings.LANGCHAIN_TRACING_V2).lower()
+os.environ["LANGCHAIN_ENDPOINT"] = settings.LANGCHAIN_ENDPOINT
 os.environ["LANGCHAIN_API_KEY"] = settings.LANGSMITH_API_KEY
-os.environ["LANGCHAIN_PROJECT"] = settings.LANGSMITH_PROJECT
+os.environ["LANGCHAIN_PROJECT"] = settings.LANGCHAIN_PROJECT
 
 # Log configuration (without sensitive data)
 if os.getenv("DEBUG", "false").lower() == "true":
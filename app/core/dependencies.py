@@ -4,15 +4,81 @@ Dependency injection for FastAPI.
 This module contains dependencies that can be injected into FastAPI route functions.
 """
 
-from langchain_openai import ChatOpenAI
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import Depends, Request
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_community.utilities.tavily_search import TavilySearchAPIWrapper
 
 from app.core.config import settings
+from app.core.http import create_http_client, create_async_http_client
+from app.utils.helpers.semantic_cache import SemanticCache
+from app.utils.helpers.tool_executor import ToolExecutor
+
+@lru_cache(maxsize=1)
+def create_llm() -> ChatOpenAI:
+    """Create the language model instance, once per process, on pooled HTTP clients."""
+    return ChatOpenAI(
+        model=settings.LLM_MODEL,
+        http_client=create_http_client(timeout=600.0),
+        http_async_client=create_async_http_client(timeout=600.0)
+    )
 
-def get_llm():
-    """Get the language model instance."""
-    return ChatOpenAI(model=settings.LLM_MODEL)
+async def close_llm() -> None:
+    """Close the HTTP clients of the process-wide language model, if it was created."""
+    if create_llm.cache_info().currsize == 0:
+        return
+    llm = create_llm()
+    create_llm.cache_clear()
+    llm.http_client.close()
+    await llm.http_async_client.aclose()
 
-def get_search_wrapper():
-    """Get the search wrapper instance."""
+@lru_cache(maxsize=1)
+def create_search_wrapper() -> TavilySearchAPIWrapper:
+    """Create the search wrapper instance, once per process."""
     return TavilySearchAPIWrapper()
+
+def create_chat_cache() -> SemanticCache:
+    """Create a new chat response cache, with the semantic tier if enabled."""
+    embeddings = (
+        OpenAIEmbeddings(model=settings.CHAT_CACHE_EMBEDDING_MODEL)
+        if settings.CHAT_CACHE_SEMANTIC else None
+    )
+    return SemanticCache(
+        embeddings=embeddings,
+        threshold=settings.CHAT_CACHE_SIMILARITY_THRESHOLD,
+        ttl=settings.CHAT_CACHE_TTL
+    )
+
+def create_supervisor_cache() -> SemanticCache:
+    """Create a new supervisor decision cache, matching exact queries only."""
+    # No semantic tier: near-duplicate queries about different Pokemon would
+    # otherwise reuse each other's Pokemon names
+    return SemanticCache(ttl=settings.CHAT_CACHE_TTL)
+
+def get_llm(request: Request) -> ChatOpenAI:
+    """Get the language model instance created at startup, or the process-wide one if unavailable."""
+    llm = getattr(request.app.state, "llm", None)
+    return llm if llm is not None else create_llm()
+
+def get_search_wrapper(request: Request) -> TavilySearchAPIWrapper:
+    """Get the search wrapper instance created at startup, or the process-wide one if unavailable."""
+    search_wrapper = getattr(request.app.state, "search_wrapper", None)
+    return search_wrapper if search_wrapper is not None else create_search_wrapper()
+
+def get_tool_executor(
+    request: Request,
+    search_wrapper: TavilySearchAPIWrapper = Depends(get_search_wrapper)
+) -> ToolExecutor:
+    """Get the tool executor created at startup, or a new one around the search wrapper."""
+    tool_executor = getattr(request.app.state, "tool_executor", None)
+    return tool_executor if tool_executor is not None else ToolExecutor([search_wrapper])
+
+def get_chat_cache(request: Request) -> Optional[SemanticCache]:
+    """Get the chat response cache created at startup, or None if caching is unavailable."""
+    return getattr(request.app.state, "chat_cache", None)
+
+def get_supervisor_cache(request: Request) -> Optional[SemanticCache]:
+    """Get the supervisor decision cache created at startup, or None if caching is unavailable."""
+    return getattr(request.app.state, "supervisor_cache", None)
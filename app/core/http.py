@@ -0,0 +1,40 @@
+"""
+Outbound HTTP clients.
+
+This module contains the factories for the pooled HTTP clients used for outbound
+calls to PokeAPI and OpenAI. HTTP/2 is enabled when the h2 package is installed
+so concurrent requests to the same host share a single connection.
+"""
+
+import importlib.util
+
+import httpx
+
+# HTTP/2 support is provided by the optional h2 package (httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+def create_http_client(timeout: float = 10.0) -> httpx.Client:
+    """
+    Create a pooled HTTP client.
+    
+    Args:
+        timeout: Default timeout in seconds for requests made with the client
+        
+    Returns:
+        httpx.Client: A client with shared connection limits, using HTTP/2 if available
+    """
+    return httpx.Client(http2=HTTP2_ENABLED, limits=HTTP_LIMITS, timeout=timeout)
+
+def create_async_http_client(timeout: float = 10.0) -> httpx.AsyncClient:
+    """
+    Create a pooled asynchronous HTTP client.
+    
+    Args:
+        timeout: Default timeout in seconds for requests made with the client
+        
+    Returns:
+        httpx.AsyncClient: A client with shared connection limits, using HTTP/2 if available
+    """
+    return httpx.AsyncClient(http2=HTTP2_ENABLED, limits=HTTP_LIMITS, timeout=timeout)
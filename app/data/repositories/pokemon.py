@@ -2,16 +2,119 @@
 Pokemon repository for fetching Pokemon data from external APIs.
 
 This module contains functions for fetching Pokemon data from the PokeAPI.
+Fetched data is cached in memory for a day and, if configured, persisted to
+SQLite so restarts start with a warm cache.
 """
 
-from typing import Dict, Any
-import requests
+from typing import Dict, Any, Optional
+import sqlite3
+import threading
+import time
+
+import httpx
+import orjson
+from cachetools import TTLCache
 
 from app.core.config import settings
+from app.core.http import create_http_client
+
+# Shared HTTP client so PokeAPI connections are pooled and kept alive across calls
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the shared HTTP client, creating it if needed.
+    
+    Returns:
+        httpx.Client: The pooled client used for PokeAPI requests
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = create_http_client(timeout=10.0)
+        return _http_client
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and release its connections."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+# Pokemon data is effectively immutable, so fetched data is kept for a day
+POKEMON_CACHE_MAXSIZE = 2048
+POKEMON_CACHE_TTL = 86400
+
+_pokemon_cache: TTLCache = TTLCache(maxsize=POKEMON_CACHE_MAXSIZE, ttl=POKEMON_CACHE_TTL)
+_pokemon_cache_lock = threading.Lock()
+
+# Persistent cache connection, opened on first use and only used under the cache lock
+_cache_db: Optional[sqlite3.Connection] = None
+
+def _get_cache_db() -> sqlite3.Connection:
+    """Get the persistent cache connection, creating its table on first use."""
+    global _cache_db
+    if _cache_db is None:
+        connection = sqlite3.connect(settings.POKEMON_CACHE_PATH, check_same_thread=False)
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS pokemon_cache "
+                "(name TEXT PRIMARY KEY, fetched_at REAL NOT NULL, data BLOB NOT NULL)"
+            )
+        except sqlite3.Error:
+            connection.close()
+            raise
+        _cache_db = connection
+    return _cache_db
+
+def close_cache_db() -> None:
+    """Close the persistent cache connection, if open."""
+    global _cache_db
+    with _pokemon_cache_lock:
+        if _cache_db is not None:
+            _cache_db.close()
+            _cache_db = None
+
+def _load_persisted(pokemon_name: str) -> Optional[Dict[str, Any]]:
+    """Load unexpired Pokemon data from the persistent cache, if enabled."""
+    if not settings.POKEMON_CACHE_PATH:
+        return None
+    try:
+        with _pokemon_cache_lock:
+            row = _get_cache_db().execute(
+                "SELECT data FROM pokemon_cache WHERE name = ? AND fetched_at > ?",
+                (pokemon_name, time.time() - POKEMON_CACHE_TTL)
+            ).fetchone()
+    except sqlite3.Error as e:
+        print(f"Error reading the Pokemon cache: {e}")
+        return None
+    return orjson.loads(row[0]) if row else None
+
+def _persist(pokemon_name: str, pokemon_data: Dict[str, Any]) -> None:
+    """Store Pokemon data in the persistent cache, if enabled."""
+    if not settings.POKEMON_CACHE_PATH:
+        return
+    try:
+        with _pokemon_cache_lock:
+            connection = _get_cache_db()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO pokemon_cache (name, fetched_at, data) VALUES (?, ?, ?)",
+                    (pokemon_name, time.time(), orjson.dumps(pokemon_data))
+                )
+    except sqlite3.Error as e:
+        print(f"Error writing the Pokemon cache: {e}")
+
+def clear_pokemon_cache() -> None:
+    """Remove all Pokemon data from the in-memory cache."""
+    with _pokemon_cache_lock:
+        _pokemon_cache.clear()
 
 def fetch_pokemon_data(pokemon_name: str) -> Dict[str, Any]:
     """
-    Fetch Pokemon data from the PokeAPI.
+    Fetch Pokemon data, reusing cached data when available.
     
     Args:
         pokemon_name (str): The name of the Pokemon to fetch data for
@@ -19,12 +122,36 @@ def fetch_pokemon_data(pokemon_name: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary containing the Pokemon data
     """
-    try:
-        # Convert pokemon name to lowercase for API compatibility
-        pokemon_name = pokemon_name.lower().strip()
+    # Convert pokemon name to lowercase for API compatibility
+    pokemon_name = pokemon_name.lower().strip()
+    
+    with _pokemon_cache_lock:
+        pokemon_data = _pokemon_cache.get(pokemon_name)
+    if pokemon_data is None:
+        pokemon_data = _load_persisted(pokemon_name)
+        if pokemon_data is None:
+            pokemon_data = _fetch_from_api(pokemon_name)
+            if "error" in pokemon_data:
+                return pokemon_data
+            _persist(pokemon_name, pokemon_data)
+        with _pokemon_cache_lock:
+            _pokemon_cache[pokemon_name] = pokemon_data
+    
+    return pokemon_data
+
+def _fetch_from_api(pokemon_name: str) -> Dict[str, Any]:
+    """
+    Fetch Pokemon data from the PokeAPI.
+    
+    Args:
+        pokemon_name (str): The normalized name of the Pokemon to fetch data for
         
+    Returns:
+        Dict[str, Any]: A dictionary containing the Pokemon data
+    """
+    try:
         # Make the API request
-        response = requests.get(f"{settings.POKEMON_API_BASE_URL}/{pokemon_name}")
+        response = get_http_client().get(f"{settings.POKEMON_API_BASE_URL}/{pokemon_name}")
         response.raise_for_status()  # Raise an exception for HTTP errors
         
         # Parse the JSON response
@@ -49,7 +176,7 @@ def fetch_pokemon_data(pokemon_name: str) -> Dict[str, Any]:
         }
         
         return processed_data
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Error fetching Pokemon data: {e}")
         return {"error": f"Failed to fetch data for {pokemon_name}: {str(e)}"}
     except (KeyError, IndexError) as e:
@@ -6,12 +6,23 @@ These schemas are used for validation, serialization, and documentation purposes
 """
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Configuration shared by the agent schemas. Agent results are adjusted in place
+# after parsing, so assignments are not re-validated.
+SCHEMA_MODEL_CONFIG = ConfigDict(
+    extra="ignore",
+    validate_assignment=False,
+)
+
+# Configuration for agent schemas that are never modified after parsing
+FROZEN_SCHEMA_MODEL_CONFIG = ConfigDict(**SCHEMA_MODEL_CONFIG, frozen=True)
 
 # -------------------- Search and General Knowledge Schemas -------------------- #
 
 class Reflection(BaseModel):
     """Schema for agent's reflection on a user question."""
+    model_config = FROZEN_SCHEMA_MODEL_CONFIG
     
     reasoning: str = Field(
         description="Reasoning about how to process the user question"
@@ -23,6 +34,8 @@ class Reflection(BaseModel):
 
 class SupervisorAgent(BaseModel):
     """Schema for the supervisor agent's complete answer to a user question."""
+    model_config = SCHEMA_MODEL_CONFIG
+    
     answer: str = Field(
         description="Final answer after reflection and analysis"
     )
@@ -43,13 +56,21 @@ class SupervisorAgent(BaseModel):
     )
     pokemon_names: Optional[List[str]] = Field(
         default=None,
+        max_length=2,
         description="List of Pokémon names extracted from the query (maximum of 2), if it's a Pokémon-related query"
     )
+    
+    @field_validator("pokemon_names", mode="before")
+    @classmethod
+    def _keep_first_two_names(cls, value: Any) -> Any:
+        """Keep the first two names if the model returns more, instead of rejecting the answer."""
+        return value[:2] if isinstance(value, list) else value
 
 # -------------------- Pokemon Research Schemas -------------------- #
 
 class ResearchPokemon(BaseModel):
     """Schema for comprehensive Pokémon research results."""
+    model_config = SCHEMA_MODEL_CONFIG
     
     name: str = Field(
         description="Name of the Pokémon"
@@ -87,10 +108,19 @@ class ResearchPokemon(BaseModel):
         description="Detailed analysis including type advantages/disadvantages, role, abilities explanation, etc."
     )
 
+class ResearchPokemonBatch(BaseModel):
+    """Schema for research results of several Pokémon produced in a single call."""
+    model_config = FROZEN_SCHEMA_MODEL_CONFIG
+    
+    pokemon: List[ResearchPokemon] = Field(
+        description="One research result for each Pokémon, in the order they were given"
+    )
+
 # -------------------- Pokemon Expert Analysis Schemas -------------------- #
 
 class PokemonExpertAnalystAgent(BaseModel):
     """Schema for expert Pokémon analysis."""
+    model_config = SCHEMA_MODEL_CONFIG
     
     pokemon_1: str = Field(
         description="Name of the first Pokémon being analyzed"
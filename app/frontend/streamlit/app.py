@@ -4,7 +4,12 @@ Streamlit frontend for the Pokemon AI Agents API with ngrok support.
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import html
 import os
+import re
 import sys
 
 # ✅ Move `st.set_page_config()` to the first Streamlit command!
@@ -36,52 +41,123 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Fetch API URL from environment variables (ngrok-friendly)
-API_URL = os.getenv("API_URL", None)
-API_HOST = os.getenv("API_HOST", "localhost")
-API_PORT = os.getenv("API_PORT", "8088")
+API_PREFIX = "/api/v1"
 
-# Use ngrok if available, otherwise fall back to local API
-if API_URL is None:
-    API_URL = f"http://{API_HOST}:{API_PORT}"
+@st.cache_resource
+def get_api_client():
+    """
+    Resolve the API URL and create the HTTP session once for all reruns and sessions.
+    
+    The session is kept alive so API connections are reused across calls.
+    
+    Returns:
+        tuple: The API URL and the shared requests session
+    """
+    # Fetch API URL from environment variables (ngrok-friendly), otherwise fall back to local API
+    api_url = os.getenv("API_URL") or f"http://{os.getenv('API_HOST', 'localhost')}:{os.getenv('API_PORT', '8088')}"
+    
+    # Debugging: Log API connection info
+    print(f"\n\n===> Connecting to API at: {api_url}{API_PREFIX} <===\n\n", file=sys.stderr)
+    
+    # The session is shared by every browser session, so the pool is sized for
+    # concurrent users; idempotent GETs are retried on gateway errors
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        pool_block=False,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return api_url, session
 
-API_PREFIX = "/api/v1"
+API_URL, SESSION = get_api_client()
+
+# Endpoint URLs, fixed for the lifetime of the app
+CHAT_URL = f"{API_URL}{API_PREFIX}/pokemon/chat"
+BATTLE_URL = f"{API_URL}{API_PREFIX}/pokemon/battle"
+HEALTH_URL = f"{API_URL}{API_PREFIX}/pokemon/health"
 
 # External API URL for browser access (Swagger, ReDoc, etc.)
 EXTERNAL_API_URL = API_URL
 
-# Debugging: Log API connection info
-print(f"\n\n===> Connecting to API at: {API_URL}{API_PREFIX} <===\n\n", file=sys.stderr)
 st.write(f"🔗 Connecting to API at: {API_URL}{API_PREFIX}")
 
-# Header
-st.markdown("<h1 style='text-align: center; color: #e53935;'>Pokemon AI Agents</h1>", unsafe_allow_html=True)
-st.markdown("<p style='text-align: center;'>Research Pokemon and analyze battles using AI</p>", unsafe_allow_html=True)
+# Header, rendered as a single element
+st.markdown(
+    "<h1 style='text-align: center; color: #e53935;'>Pokemon AI Agents</h1>"
+    "<p style='text-align: center;'>Research Pokemon and analyze battles using AI</p>",
+    unsafe_allow_html=True
+)
 
 # Create UI tabs
 tab1, tab2, tab3, tab4 = st.tabs(["Chat", "Battle Analysis", "Debug", "API Docs"])
 
-def call_chat_api(message: str):
-    """Call the chat API endpoint."""
-    try:
-        response = requests.post(f"{API_URL}{API_PREFIX}/pokemon/chat", json={"message": message})
+# Progress messages for the stages reported by the chat event stream
+_STAGE_LABELS = {
+    "agent": "Running the agents...",
+    "supervisor": "Thinking...",
+    "searching": "Searching the web...",
+    "researching": "Researching {pokemon}...",
+    "analyzing_battle": "Analyzing the battle..."
+}
+
+def stream_chat_api(message: str, placeholder):
+    """
+    Call the chat API endpoint as an event stream, raising on request errors.
+    
+    Progress and the tokens of search-backed answers are shown in the
+    placeholder as they arrive; repeated questions are answered from the
+    API's chat cache.
+    
+    Args:
+        message (str): The user's message
+        placeholder: Streamlit placeholder for the progress and partial answer
+        
+    Returns:
+        The chat response from the final ``result`` event
+    """
+    result = None
+    event = None
+    answer = ""
+    with SESSION.post(
+        CHAT_URL,
+        json={"message": message},
+        headers={"Accept": "text/event-stream"},
+        stream=True
+    ) as response:
         response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        st.error(f"Error calling API: {str(e)}")
-        return None
+        for line in response.iter_lines():
+            if line.startswith(b"event: "):
+                event = line[7:].decode("utf-8")
+            elif line.startswith(b"data: "):
+                data = orjson.loads(line[6:])
+                if event == "progress":
+                    label = _STAGE_LABELS.get(data.get("stage"), "Working...")
+                    placeholder.info(label.format(pokemon=", ".join(data.get("pokemon", []))))
+                elif event == "token":
+                    answer += data["content"]
+                    placeholder.markdown(answer)
+                elif event == "result":
+                    result = data
+                elif event == "error":
+                    raise RuntimeError(data["detail"])
+    placeholder.empty()
+    return result
 
+# Battle responses are cached per arguments so reruns don't repeat the request
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
 def call_battle_api(pokemon1: str, pokemon2: str):
-    """Call the battle API endpoint."""
-    try:
-        response = requests.get(f"{API_URL}{API_PREFIX}/pokemon/battle", params={"pokemon1": pokemon1, "pokemon2": pokemon2})
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        st.error(f"Error calling API: {str(e)}")
-        return None
+    """Call the battle API endpoint, raising on request errors."""
+    response = SESSION.get(BATTLE_URL, params={"pokemon1": pokemon1, "pokemon2": pokemon2})
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 
+# Non-blank lines of a snippet, each rendered as its own paragraph
+_PARAGRAPH_RE = re.compile(r"[^\n]*\S[^\n]*")
+
 def display_formatted_snippet(snippet, key_prefix):
     """Display a formatted snippet with better handling for long text.
     
@@ -95,11 +171,13 @@ def display_formatted_snippet(snippet, key_prefix):
         tab1, tab2 = st.tabs(["Formatted View", "Raw Text"])
         
         with tab1:
-            # Split into paragraphs for better readability
-            paragraphs = snippet.split('\n')
-            for i, para in enumerate(paragraphs):
-                if para.strip():
-                    st.markdown(f"<div style='margin-bottom: 10px;'>{para}</div>", unsafe_allow_html=True)
+            # Wrap each paragraph for better readability, rendered as a single element;
+            # the snippet text is escaped since it comes from arbitrary web pages
+            paragraphs_html = _PARAGRAPH_RE.sub(
+                lambda match: f"<div style='margin-bottom: 10px;'>{html.escape(match.group(0))}</div>",
+                snippet
+            )
+            st.markdown(paragraphs_html, unsafe_allow_html=True)
         
         with tab2:
             st.text_area("", snippet, height=350, key=f"{key_prefix}_raw")
@@ -121,7 +199,9 @@ def submit_chat_form():
     st.session_state.chat_submitted = True
 
 # Chat Tab
-with tab1:
+@st.fragment
+def chat_tab():
+    """Render the Chat tab; interacting with it only reruns this tab."""
     st.header("Chat with Pokemon AI")
     
     # Use a form to capture Enter key press
@@ -129,13 +209,27 @@ with tab1:
         user_message = st.text_input("Ask something about Pokemon:", placeholder="e.g., Tell me about Pikachu", key="chat_input")
         submit_button = st.form_submit_button("Send", on_click=submit_chat_form)
     
+    # Progress, the streamed answer and the result are all drawn in this one slot
+    output = st.empty()
+    
     # Process the form submission
     if st.session_state.chat_submitted and user_message:
         if user_message:
-            with st.spinner("Thinking..."):
-                result = call_chat_api(user_message)
+            # Only call the API when the message changed since the last answer
+            if st.session_state.get("chat_last_msg") == user_message:
+                result = st.session_state["chat_last_result"]
+            else:
+                try:
+                    result = stream_chat_api(user_message, output)
+                except Exception as e:
+                    output.error(f"Error calling API: {str(e)}")
+                    result = None
                 if result:
-                    # Display the result in a more readable format
+                    st.session_state["chat_last_msg"] = user_message
+                    st.session_state["chat_last_result"] = result
+            if result:
+                # Display the result in a more readable format, replacing the progress in place
+                with output.container():
                     if isinstance(result, dict):
                         # Check if there are search results
                         if "sources" in result and result["sources"]:
@@ -152,13 +246,16 @@ with tab1:
                             st.json(result)
                     else:
                         st.json(result)
-                    
-                    # Reset the submission state to allow for another submission
-                    st.session_state.chat_submitted = False
+            
+            # Reset the submission state to allow for another submission
+            st.session_state.chat_submitted = False
         else:
             st.warning("Please enter a message.")
             st.session_state.chat_submitted = False
 
+with tab1:
+    chat_tab()
+
 # Initialize battle form submission state
 if 'battle_submitted' not in st.session_state:
     st.session_state.battle_submitted = False
@@ -168,7 +265,9 @@ def submit_battle_form():
     st.session_state.battle_submitted = True
 
 # Battle Analysis Tab
-with tab2:
+@st.fragment
+def battle_tab():
+    """Render the Battle Analysis tab; interacting with it only reruns this tab."""
     st.header("Pokemon Battle Analysis")
     
     # Use a form to capture Enter key press
@@ -183,26 +282,43 @@ with tab2:
     # Process the form submission
     if st.session_state.battle_submitted and pokemon1 and pokemon2:
         if pokemon1 and pokemon2:
-            with st.spinner("Analyzing battle..."):
-                result = call_battle_api(pokemon1, pokemon2)
+            # Only call the API when the matchup changed since the last analysis
+            battle_key = (pokemon1.strip().lower(), pokemon2.strip().lower())
+            if st.session_state.get("battle_last_key") == battle_key:
+                result = st.session_state["battle_last_result"]
+            else:
+                with st.spinner("Analyzing battle..."):
+                    try:
+                        result = call_battle_api(pokemon1, pokemon2)
+                    except Exception as e:
+                        st.error(f"Error calling API: {str(e)}")
+                        result = None
                 if result:
-                    # Display the result in a more readable format
-                    with st.expander("View Battle Analysis", expanded=True):
-                        st.json(result)
-                    
-                    # Reset the submission state to allow for another submission
-                    st.session_state.battle_submitted = False
+                    st.session_state["battle_last_key"] = battle_key
+                    st.session_state["battle_last_result"] = result
+            if result:
+                # Display the result in a more readable format
+                with st.expander("View Battle Analysis", expanded=True):
+                    st.json(result)
+            
+            # Reset the submission state to allow for another submission
+            st.session_state.battle_submitted = False
         else:
             st.warning("Please enter both Pokemon names.")
             st.session_state.battle_submitted = False
 
+with tab2:
+    battle_tab()
+
 # Debug Tab
-with tab3:
+@st.fragment
+def debug_tab():
+    """Render the Debug tab; interacting with it only reruns this tab."""
     st.header("API Connection Debug")
     st.write(f"Attempting to connect to API at: {API_URL}{API_PREFIX}")
     if st.button("Test API Connection"):
         try:
-            response = requests.get(f"{API_URL}/docs")
+            response = SESSION.get(HEALTH_URL, timeout=2)
             st.success(f"Connection successful! Status code: {response.status_code}")
         except Exception as e:
             st.error(f"Connection failed: {str(e)}")
@@ -212,16 +328,19 @@ with tab3:
     st.subheader("Environment Variables")
     st.json({
         "API_URL": API_URL,
-        "API_HOST": API_HOST,
-        "API_PORT": API_PORT
+        "API_HOST": os.getenv("API_HOST", "localhost"),
+        "API_PORT": os.getenv("API_PORT", "8088")
     })
 
+with tab3:
+    debug_tab()
+
 # API Documentation Tab
 with tab4:
     st.header("API Documentation")
     st.markdown(f"""
-    - **Chat Endpoint**: `{API_URL}/api/v1/pokemon/chat`
-    - **Battle Endpoint**: `{API_URL}/api/v1/pokemon/battle`
+    - **Chat Endpoint**: `{CHAT_URL}`
+    - **Battle Endpoint**: `{BATTLE_URL}`
     - **Swagger UI**: [Open Swagger Docs]({API_URL}/docs)
     - **ReDoc**: [Open ReDoc Docs]({API_URL}/redoc)
     """)
@@ -4,17 +4,59 @@ Main FastAPI application.
 This module contains the main FastAPI application and its configuration.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
+import logging
 import os
 
 from app.core.config import settings
+from app.core.dependencies import (
+    close_llm, create_llm, create_search_wrapper, create_chat_cache, create_supervisor_cache
+)
+from app.data.repositories.pokemon import close_http_client, close_cache_db
+from app.utils.helpers.tool_executor import ToolExecutor
+from app.api.middleware.gzip import EventStreamGZipMiddleware
 from app.api.routers import general, pokemon
 from app.api.openapi.schema import custom_openapi
 from app.api.openapi.routes import create_docs_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the shared LLM, search and tool clients and the response caches once at startup.
+    
+    If a client cannot be created (e.g. a missing API key), it is left unset
+    and the dependencies fall back to creating one per request.
+    
+    Args:
+        app: FastAPI application instance
+    """
+    try:
+        app.state.llm = create_llm()
+        app.state.search_wrapper = create_search_wrapper()
+        app.state.tool_executor = ToolExecutor([app.state.search_wrapper])
+        app.state.chat_cache = create_chat_cache()
+        app.state.supervisor_cache = create_supervisor_cache()
+    except Exception as e:
+        logging.warning(f"Could not pre-create shared clients at startup: {e}")
+    
+    try:
+        yield
+    finally:
+        # Drop the shared clients and close their connection pools on shutdown
+        app.state.llm = None
+        app.state.search_wrapper = None
+        app.state.tool_executor = None
+        app.state.chat_cache = None
+        app.state.supervisor_cache = None
+        close_http_client()
+        close_cache_db()
+        await close_llm()
+
 # Create the FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -22,6 +64,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url=None,  # Disable default docs URL
     redoc_url=None,  # Disable default redoc URL
+    default_response_class=ORJSONResponse,  # Serialize JSON responses with orjson
+    lifespan=lifespan,  # Create shared clients once at startup
     contact={
         "name": "Pokemon AI Agents Team",
         "url": "https://github.com/yourusername/pokemon-ai-agents",
@@ -33,10 +77,14 @@ app = FastAPI(
     },
 )
 
-# Add CORS middleware
+# Compress larger responses; added before CORS so it runs inside it.
+# Event streams are not compressed so their events are not buffered.
+app.add_middleware(EventStreamGZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Add CORS middleware; origins are matched per request, so pass them as a set
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_origins=frozenset(settings.BACKEND_CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
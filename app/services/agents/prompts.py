@@ -7,15 +7,23 @@ This module contains prompt templates used by the various AI agents in the syste
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import datetime
 
+# OpenAI caches identical prompt prefixes automatically. A stable key per agent
+# routes requests that share a prefix to the same cache; it is sent in the
+# request body so it works regardless of the client library version.
+SUPERVISOR_PROMPT_CACHE = {"prompt_cache_key": "pokemon-ai-agents-supervisor"}
+RESEARCHER_PROMPT_CACHE = {"prompt_cache_key": "pokemon-ai-agents-researcher"}
+EXPERT_PROMPT_CACHE = {"prompt_cache_key": "pokemon-ai-agents-expert"}
+
 # Supervisor Prompt Template
+# The static instructions come first and the current time after the messages,
+# so the instruction prefix is identical on every request and can hit the
+# provider's prompt cache.
 supervisor_prompt_template = ChatPromptTemplate.from_messages(
     [
         (
             "system",
             """
             You are the supervisor agent - an expert at precise information retrieval and analysis.
-            
-            Current time: {time}
 
             Follow these instructions carefully:
             1. You are an AI agent that intelligently processes user queries with extreme precision and specificity.
@@ -43,6 +51,7 @@ supervisor_prompt_template = ChatPromptTemplate.from_messages(
             """
         ),
         MessagesPlaceholder(variable_name="messages"),
+        ("system", "Current time: {time}"),
         ("system", "Answer the user's question above using the required format")
     ]
 ).partial(
@@ -50,6 +59,8 @@ supervisor_prompt_template = ChatPromptTemplate.from_messages(
 )
 
 # Researcher Agent Template
+# As with the supervisor, the current time follows the messages so the
+# instructions stay a byte-identical prefix across requests.
 researcher_agent_template = ChatPromptTemplate.from_messages(
     [
         (
@@ -81,11 +92,10 @@ researcher_agent_template = ChatPromptTemplate.from_messages(
 
 
             Never omit any information that is available in the provided data. Your goal is to be thorough and comprehensive.
-
-            📅 Current time: {time}
             """
         ),
         MessagesPlaceholder(variable_name="messages"),
+        ("system", "Current time: {time}")
     ]
 ).partial(
     time=lambda: datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -106,9 +116,9 @@ expert_agent_template = ChatPromptTemplate.from_messages([
     7. Provide a clear winner prediction based on your analysis
     
     Your analysis MUST be specific to the exact Pokémon in the data. Do not invent or reference any other Pokémon.
-    
-    📅 Current time: {time}
-    """)
+    """),
+    MessagesPlaceholder(variable_name="messages"),
+    ("system", "Current time: {time}")
 ]).partial(
     time=lambda: datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
 )
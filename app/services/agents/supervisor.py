@@ -4,59 +4,114 @@ Supervisor agent service.
 This module contains functions for processing user queries using the supervisor agent.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, Iterator, List, Optional
+import ast
+import asyncio
 import re
-import json
+from itertools import islice
+from urllib.parse import urlparse
 
+import orjson
+
+from cachetools import LRUCache
 from langchain_core.output_parsers.openai_tools import PydanticToolsParser
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 from langchain_community.utilities.tavily_search import TavilySearchAPIWrapper
 
 from app.data.schemas.pokemon import SupervisorAgent
-from app.services.agents.prompts import supervisor_prompt_template
-from app.utils.helpers.tool_executor import ToolExecutor, execute_tools
+from app.services.agents.prompts import supervisor_prompt_template, SUPERVISOR_PROMPT_CACHE
+from app.utils.helpers.semantic_cache import SemanticCache
+
+# Tool definition in the format expected by OpenAI, built once from the schema
+SUPERVISOR_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "SupervisorAgent",
+        "description": "Supervisor agent that processes user queries with precision",
+        "parameters": SupervisorAgent.model_json_schema()
+    }
+}
+SUPERVISOR_TOOL_CHOICE = {"type": "function", "function": {"name": "SupervisorAgent"}}
+
+_SUPERVISOR_PARSER = PydanticToolsParser(tools=[SupervisorAgent])
+
+# Capitalized words that may be Pokemon names, minus common words that might be
+# mistaken for them
+_POKEMON_NAME_RE = re.compile(r"\b[A-Z][a-z]+\b")
+_COMMON_WORDS = frozenset({
+    "The", "And", "But", "For", "With", "About", "What", "Who", "How", "When", "Where", "Why"
+})
+
+# Number of search result items passed to the model and returned as sources
+MAX_SEARCH_RESULTS = 5
+
+# Single-quoted keys in search payloads that are neither JSON nor Python literals
+_SINGLE_QUOTED_KEY_RE = re.compile(r"'([^']+)'\s*:")
+
+# Compiled chains keyed by id(llm); the model is kept alongside its chain so the
+# id cannot be reused by another object while the entry is cached
+_SUPERVISOR_CHAINS: LRUCache = LRUCache(maxsize=8)
+
+def supervisor_chain(llm: ChatOpenAI) -> Runnable:
+    """
+    Get the supervisor agent chain for a language model, building it on first use.
+    
+    Args:
+        llm (ChatOpenAI): The language model to use
+        
+    Returns:
+        Runnable: The prompt, tool-bound model and parser chain
+    """
+    cached = _SUPERVISOR_CHAINS.get(id(llm))
+    if cached is not None and cached[0] is llm:
+        return cached[1]
+    
+    chain = (
+        supervisor_prompt_template
+        | llm.bind(tools=[SUPERVISOR_TOOL], tool_choice=SUPERVISOR_TOOL_CHOICE, extra_body=SUPERVISOR_PROMPT_CACHE)
+        | _SUPERVISOR_PARSER
+    )
+    _SUPERVISOR_CHAINS[id(llm)] = (llm, chain)
+    return chain
 
-def process_query(query: str, llm: ChatOpenAI, search_wrapper: TavilySearchAPIWrapper) -> Dict[str, Any]:
+async def process_query(
+    query: str,
+    llm: ChatOpenAI,
+    search_wrapper: TavilySearchAPIWrapper,
+    cache: Optional[SemanticCache] = None
+) -> Dict[str, Any]:
     """
     Process a user query using the supervisor agent.
     
+    Repeated queries are answered from the cache without calling the
+    language model. The routing decision does not go stale the way
+    search-backed answers do, so it is cached even when the final answer is not.
+    
     Args:
         query (str): The user's query
         llm (ChatOpenAI): The language model to use
         search_wrapper (TavilySearchAPIWrapper): The search wrapper to use
+        cache (Optional[SemanticCache]): Cache of supervisor responses keyed by query
         
     Returns:
         Dict[str, Any]: The supervisor agent's response
     """
-    # Define tools in the format expected by OpenAI
-    supervisor_tool = {
-        "type": "function",
-        "function": {
-            "name": "SupervisorAgent",
-            "description": "Supervisor agent that processes user queries with precision",
-            "parameters": SupervisorAgent.model_json_schema()
-        }
-    }
+    # A cache with a semantic tier embeds the query, so lookups run off the event loop
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get, query)
+        if cached is not None:
+            return cached
     
     # Create the human message
     human_message = HumanMessage(content=query)
     
-    # Create the parser
-    parser = PydanticToolsParser(tools=[SupervisorAgent])
-    
-    # Create the tool executor
-    tool_executor = ToolExecutor([search_wrapper])
-    
-    # Create the chain for the supervisor agent
-    chain = (
-        supervisor_prompt_template
-        | llm.bind(tools=[supervisor_tool], tool_choice={"type": "function", "function": {"name": "SupervisorAgent"}})
-        | parser
-    )
+    # Get the chain for the supervisor agent
+    chain = supervisor_chain(llm)
     
     # Invoke the chain with the message
-    result = chain.invoke(input={"messages": [human_message]})
+    result = await chain.ainvoke(input={"messages": [human_message]})
     
     # Extract Pokemon names from the query if it's a Pokemon query
     if result and len(result) > 0:
@@ -72,7 +127,13 @@ def process_query(query: str, llm: ChatOpenAI, search_wrapper: TavilySearchAPIWr
             result[0].needs_search = True
             result[0].search_queries = None
     
-    return result[0].model_dump() if result and len(result) > 0 else {"error": "Failed to process query"}
+    if not result:
+        return {"error": "Failed to process query"}
+    
+    response = result[0].model_dump()
+    if cache is not None:
+        await asyncio.to_thread(cache.put, query, response)
+    return response
 
 def extract_pokemon_names(query: str) -> List[str]:
     """
@@ -86,27 +147,66 @@ def extract_pokemon_names(query: str) -> List[str]:
     """
     # This is a simple implementation and might need to be improved
     # to handle more complex cases
-    pokemon_pattern = r'\b([A-Z][a-z]+)\b'
-    matches = re.findall(pokemon_pattern, query)
+    return [
+        match.group() for match in _POKEMON_NAME_RE.finditer(query)
+        if match.group() not in _COMMON_WORDS
+    ]
+
+
+def _loose_parse(text: str) -> Any:
+    """
+    Parse JSON, falling back to Python literal syntax and single-quoted keys.
     
-    # Filter out common words that might be mistaken for Pokemon names
-    common_words = ["The", "And", "But", "For", "With", "About", "What", "Who", "How", "When", "Where", "Why"]
-    pokemon_names = [name for name in matches if name not in common_words]
+    Args:
+        text (str): The text to parse
+        
+    Returns:
+        Any: The parsed value
+        
+    Raises:
+        ValueError: If the text cannot be parsed
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
     
-    return pokemon_names
+    # Use ast.literal_eval to safely evaluate the string as a Python literal
+    try:
+        return ast.literal_eval(text)
+    except Exception:
+        pass
+    
+    # Replace single quotes with double quotes for keys as a last resort
+    return orjson.loads(_SINGLE_QUOTED_KEY_RE.sub(r'"\1":', text))
 
+def _iter_search_items(search_results: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the search result items of every query.
+    
+    Args:
+        search_results (Dict[str, Any]): Search results keyed by query, each a list of items
+        
+    Yields:
+        Dict[str, Any]: Each search result item, in order
+    """
+    for results in search_results.values():
+        if isinstance(results, list):
+            for item in results:
+                if isinstance(item, dict):
+                    yield item
 
-def process_search_results(query: str, search_results: Any, llm: ChatOpenAI) -> Dict[str, Any]:
+def _prepare_search_answer(query: str, search_results: Any) -> Dict[str, Any]:
     """
-    Process search results and generate a final answer.
+    Format search results into the messages used to generate a final answer.
     
     Args:
         query (str): The original user query
         search_results (Any): The search results from Tavily (can be Dict or str)
-        llm (ChatOpenAI): The language model to use
         
     Returns:
-        Dict[str, Any]: The final answer and sources based on the search results
+        Dict[str, Any]: The messages and sources for the LLM, or a final answer
+        and empty sources if the search results could not be used
     """
     # Check if search_results is None or empty
     if not search_results:
@@ -118,32 +218,8 @@ def process_search_results(query: str, search_results: Any, llm: ChatOpenAI) ->
     # If search_results is a string, try to parse it as JSON
     if isinstance(search_results, str):
         try:
-            # First try standard JSON parsing
-            try:
-                search_results = json.loads(search_results)
-            except json.JSONDecodeError:
-                # Try to fix single quotes in the JSON string
-                import ast
-                try:
-                    # Use ast.literal_eval to safely evaluate the string as a Python literal
-                    search_results = ast.literal_eval(search_results)
-                except Exception:
-                    # Try a more aggressive approach - replace single quotes with double quotes
-                    # but only for the keys and string values
-                    import re
-                    try:
-                        # Fix the query key first
-                        fixed_json = re.sub(r"\{\s*'([^']+)'\s*:", '{"\\1":', search_results)
-                        # Fix the url and content keys
-                        fixed_json = re.sub(r"'url'\s*:", '"url":', fixed_json)
-                        fixed_json = re.sub(r"'content'\s*:", '"content":', fixed_json)
-                        search_results = json.loads(fixed_json)
-                    except Exception:
-                        return {
-                            "answer": "There was an error processing the search results for your query.",
-                            "sources": []
-                        }
-        except Exception:
+            search_results = _loose_parse(search_results)
+        except ValueError:
             return {
                 "answer": "There was an error processing the search results for your query.",
                 "sources": []
@@ -153,67 +229,46 @@ def process_search_results(query: str, search_results: Any, llm: ChatOpenAI) ->
     formatted_results = []
     sources = []
     
-    # Extract the search results
-    # The search_results structure is a dict where the key is the query and the value is the search results
+    # Extract the search results, stopping once enough items have been formatted
     try:
-        for query_key, results in search_results.items():
-            # Results is a list of search result items
-            if isinstance(results, list):
-                for item in results:
-                    if isinstance(item, dict):
-                        # Extract title from URL if not present
-                        title = item.get('title', None)
-                        if not title and 'url' in item:
-                            from urllib.parse import urlparse
-                            parsed_url = urlparse(item['url'])
-                            title = parsed_url.netloc
-                        
-                        content = item.get('content', 'No content')
-                        url = item.get('url', 'No URL')
-                        
-                        # Try to clean up content if it's a JSON string
-                        if isinstance(content, str) and content.startswith('{') and content.endswith('}'):
-                            try:
-                                # First try standard JSON parsing
-                                try:
-                                    content_json = json.loads(content)
-                                except json.JSONDecodeError:
-                                    # If that fails, try to handle single quotes
-                                    import ast
-                                    try:
-                                        content_json = ast.literal_eval(content)
-                                    except Exception:
-                                        # Try a more aggressive approach with regex
-                                        import re
-                                        try:
-                                            # Replace single quotes with double quotes for keys
-                                            fixed_content = re.sub(r"'([^']+)'\s*:", '"\\1":', content)
-                                            content_json = json.loads(fixed_content)
-                                        except Exception:
-                                            content_json = None
-                                
-                                if isinstance(content_json, dict):
-                                    # Format JSON content more readably
-                                    if 'location' in content_json and 'current' in content_json:
-                                        location = content_json.get('location', {})
-                                        current = content_json.get('current', {})
-                                        condition = current.get('condition', {})
-                                        content = f"Location: {location.get('name', 'Unknown')}, {location.get('country', 'Unknown')}\n"
-                                        content += f"Temperature: {current.get('temp_c', 'Unknown')}°C / {current.get('temp_f', 'Unknown')}°F\n"
-                                        content += f"Condition: {condition.get('text', 'Unknown')}\n"
-                                        content += f"Wind: {current.get('wind_kph', 'Unknown')} km/h {current.get('wind_dir', '')}\n"
-                                        content += f"Humidity: {current.get('humidity', 'Unknown')}%\n"
-                                        content += f"Last Updated: {current.get('last_updated', 'Unknown')}\n"
-                            except Exception:
-                                # Keep original content if parsing fails
-                                pass
-                        
-                        formatted_results.append(f"Source: {title or 'No title'}\nURL: {url}\nContent: {content}\n")
-                        sources.append({
-                            "title": title or 'No title',
-                            "url": url,
-                            "snippet": content[:1000] + "..." if len(content) > 1000 else content
-                        })
+        for item in islice(_iter_search_items(search_results), MAX_SEARCH_RESULTS):
+            # Extract title from URL if not present
+            title = item.get('title', None)
+            if not title and 'url' in item:
+                parsed_url = urlparse(item['url'])
+                title = parsed_url.netloc
+            
+            content = item.get('content', 'No content')
+            url = item.get('url', 'No URL')
+            
+            # Try to clean up content if it's a JSON string
+            if isinstance(content, str) and content.startswith('{') and content.endswith('}'):
+                try:
+                    content_json = _loose_parse(content)
+                    if isinstance(content_json, dict):
+                        # Format JSON content more readably
+                        if 'location' in content_json and 'current' in content_json:
+                            location = content_json.get('location', {})
+                            current = content_json.get('current', {})
+                            condition = current.get('condition', {})
+                            content = "".join((
+                                f"Location: {location.get('name', 'Unknown')}, {location.get('country', 'Unknown')}\n",
+                                f"Temperature: {current.get('temp_c', 'Unknown')}°C / {current.get('temp_f', 'Unknown')}°F\n",
+                                f"Condition: {condition.get('text', 'Unknown')}\n",
+                                f"Wind: {current.get('wind_kph', 'Unknown')} km/h {current.get('wind_dir', '')}\n",
+                                f"Humidity: {current.get('humidity', 'Unknown')}%\n",
+                                f"Last Updated: {current.get('last_updated', 'Unknown')}\n"
+                            ))
+                except Exception:
+                    # Keep original content if parsing fails
+                    pass
+            
+            formatted_results.append(f"Source: {title or 'No title'}\nURL: {url}\nContent: {content}\n")
+            sources.append({
+                "title": title or 'No title',
+                "url": url,
+                "snippet": content[:1000] + "..." if len(content) > 1000 else content
+            })
     except Exception:
         return {
             "answer": "There was an error processing the search results for your query.",
@@ -235,7 +290,7 @@ def process_search_results(query: str, search_results: Any, llm: ChatOpenAI) ->
         
         Here are the search results:
         
-        {' '.join(formatted_results[:5])}
+        {' '.join(formatted_results)}
         
         Based on these search results, provide a comprehensive and accurate answer to the user's question.
         Include specific details from the search results such as numbers, dates, and facts.
@@ -249,11 +304,64 @@ def process_search_results(query: str, search_results: Any, llm: ChatOpenAI) ->
         content=f"Please provide a comprehensive answer to my question: {query}"
     )
     
+    return {
+        "messages": [system_message, human_message],
+        "sources": sources
+    }
+
+async def process_search_results(query: str, search_results: Any, llm: ChatOpenAI) -> Dict[str, Any]:
+    """
+    Process search results and generate a final answer.
+    
+    Args:
+        query (str): The original user query
+        search_results (Any): The search results from Tavily (can be Dict or str)
+        llm (ChatOpenAI): The language model to use
+        
+    Returns:
+        Dict[str, Any]: The final answer and sources based on the search results
+    """
+    prepared = _prepare_search_answer(query, search_results)
+    if "messages" not in prepared:
+        return prepared
+    
     # Get the response from the LLM
-    response = llm.invoke([system_message, human_message])
+    response = await llm.ainvoke(prepared["messages"])
     
     # Return a dictionary with the answer and sources
     return {
         "answer": response.content,
-        "sources": sources
+        "sources": prepared["sources"]
+    }
+
+async def stream_search_results(query: str, search_results: Any, llm: ChatOpenAI) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Process search results and stream the final answer as it is generated.
+    
+    Yields ``{"event": "token", "data": {"content": ...}}`` for each chunk of the
+    answer, followed by a single ``{"event": "final_answer", "data": ...}`` with
+    the complete answer and sources.
+    
+    Args:
+        query (str): The original user query
+        search_results (Any): The search results from Tavily (can be Dict or str)
+        llm (ChatOpenAI): The language model to use
+        
+    Yields:
+        Dict[str, Any]: Streaming events with an event name and data
+    """
+    prepared = _prepare_search_answer(query, search_results)
+    if "messages" not in prepared:
+        yield {"event": "final_answer", "data": prepared}
+        return
+    
+    chunks = []
+    async for chunk in llm.astream(prepared["messages"]):
+        if chunk.content:
+            chunks.append(chunk.content)
+            yield {"event": "token", "data": {"content": chunk.content}}
+    
+    yield {
+        "event": "final_answer",
+        "data": {"answer": "".join(chunks), "sources": prepared["sources"]}
     }
@@ -0,0 +1,184 @@
+"""
+Pokemon research cache.
+
+This module contains in-memory caches for Pokemon research results and battle
+analyses, so repeat lookups of the same Pokemon or matchup skip the API and
+LLM round-trip. Concurrent misses for the same key are coalesced so only one
+lookup runs while the other callers wait for its result.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Any, Hashable, List, MutableMapping
+
+from cachetools import LRUCache, TTLCache
+from langchain_openai import ChatOpenAI
+
+from app.services.pokemon.research import research_pokemon, research_pokemon_batch, analyze_pokemon_battle
+from app.services.pokemon.type_chart import predict_battle
+
+# Pokemon data is effectively static, so research results are kept for a day
+RESEARCH_CACHE_MAXSIZE = 1024
+RESEARCH_CACHE_TTL = 86400
+
+_RESEARCH_CACHE: TTLCache = TTLCache(maxsize=RESEARCH_CACHE_MAXSIZE, ttl=RESEARCH_CACHE_TTL)
+_RESEARCH_CACHE_LOCK = threading.Lock()
+_RESEARCH_INFLIGHT: Dict[str, Future] = {}
+
+# Bump when the battle analysis prompt changes so stale analyses are not served
+BATTLE_ANALYSIS_VERSION = 1
+BATTLE_CACHE_MAXSIZE = 4096
+
+_BATTLE_CACHE: LRUCache = LRUCache(maxsize=BATTLE_CACHE_MAXSIZE)
+_BATTLE_CACHE_LOCK = threading.Lock()
+_BATTLE_INFLIGHT: Dict[Hashable, Future] = {}
+
+def _single_flight(
+    cache: MutableMapping,
+    lock: threading.Lock,
+    inflight: Dict[Hashable, Future],
+    key: Hashable,
+    compute: Callable[[], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Return a cached result, or compute it once for all concurrent callers.
+
+    Args:
+        cache: The result cache
+        lock: The lock guarding the cache and the in-flight table
+        inflight: Futures for lookups that are currently running, keyed like the cache
+        key: The cache key
+        compute: Function that produces the result on a miss
+
+    Returns:
+        Dict[str, Any]: The cached, shared or freshly computed result
+    """
+    with lock:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        future = inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = inflight[key] = Future()
+
+    # Another caller is already computing this key, so wait for its result
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = compute()
+    except BaseException as e:
+        with lock:
+            inflight.pop(key, None)
+        future.set_exception(e)
+        raise
+
+    with lock:
+        if "error" not in result:
+            cache[key] = result
+        inflight.pop(key, None)
+    future.set_result(result)
+
+    return result
+
+def cached_research(pokemon_name: str, llm: ChatOpenAI) -> Dict[str, Any]:
+    """
+    Research a Pokemon, reusing a cached result when one is available.
+
+    The cache is keyed by the normalized Pokemon name only; the language model
+    is a dependency, not part of the data. Error results are not cached.
+
+    Args:
+        pokemon_name (str): The name of the Pokemon to research
+        llm (ChatOpenAI): The language model to use on a cache miss
+
+    Returns:
+        Dict[str, Any]: Research results for the Pokemon
+    """
+    return _single_flight(
+        _RESEARCH_CACHE,
+        _RESEARCH_CACHE_LOCK,
+        _RESEARCH_INFLIGHT,
+        pokemon_name.lower().strip(),
+        lambda: research_pokemon(pokemon_name, llm)
+    )
+
+def cached_research_batch(pokemon_names: List[str], llm: ChatOpenAI) -> List[Dict[str, Any]]:
+    """
+    Research several Pokemon, reusing cached results and batching the misses.
+
+    Pokemon that are not cached are researched together in a single researcher
+    agent call. A single miss goes through cached_research so concurrent
+    lookups of the same Pokemon are still coalesced.
+
+    Args:
+        pokemon_names (List[str]): The names of the Pokemon to research
+        llm (ChatOpenAI): The language model to use on a cache miss
+
+    Returns:
+        List[Dict[str, Any]]: Research results in the same order as the names
+    """
+    keys = [pokemon_name.lower().strip() for pokemon_name in pokemon_names]
+    with _RESEARCH_CACHE_LOCK:
+        cached = {key: _RESEARCH_CACHE.get(key) for key in keys}
+
+    missing = list({key: pokemon_name for pokemon_name, key in zip(pokemon_names, keys) if cached[key] is None}.items())
+    if len(missing) == 1:
+        key, pokemon_name = missing[0]
+        cached[key] = cached_research(pokemon_name, llm)
+    elif missing:
+        researched = research_pokemon_batch([pokemon_name for _, pokemon_name in missing], llm)
+        with _RESEARCH_CACHE_LOCK:
+            for key, pokemon_name in missing:
+                result = cached[key] = researched[pokemon_name]
+                if "error" not in result:
+                    _RESEARCH_CACHE[key] = result
+
+    return [cached[key] for key in keys]
+
+def clear_research_cache() -> None:
+    """Remove all cached research results."""
+    with _RESEARCH_CACHE_LOCK:
+        _RESEARCH_CACHE.clear()
+
+def cached_battle(
+    pokemon1: str,
+    pokemon2: str,
+    pokemon_research: Dict[str, Dict[str, Any]],
+    llm: ChatOpenAI
+) -> Dict[str, Any]:
+    """
+    Analyze a battle between two Pokemon, reusing a cached analysis when available.
+
+    The cache is keyed by the unordered pair of lowercased names, so a matchup
+    is analyzed once regardless of which Pokemon is listed first. Clear-cut
+    matchups are settled by the type chart heuristic without calling the
+    language model. Error results are not cached.
+
+    Args:
+        pokemon1 (str): The name of the first Pokemon
+        pokemon2 (str): The name of the second Pokemon
+        pokemon_research: Research results for both Pokemon, keyed by name
+        llm (ChatOpenAI): The language model to use on a cache miss
+
+    Returns:
+        Dict[str, Any]: Battle analysis results
+    """
+    result = _single_flight(
+        _BATTLE_CACHE,
+        _BATTLE_CACHE_LOCK,
+        _BATTLE_INFLIGHT,
+        (BATTLE_ANALYSIS_VERSION, frozenset((pokemon1.lower(), pokemon2.lower()))),
+        lambda: predict_battle(pokemon_research) or analyze_pokemon_battle(pokemon_research, llm)
+    )
+
+    # Report the Pokemon in the order they were requested
+    if "error" not in result and result["pokemon_1"].lower() != pokemon1.lower():
+        return {**result, "pokemon_1": result["pokemon_2"], "pokemon_2": result["pokemon_1"]}
+    return result
+
+def clear_battle_cache() -> None:
+    """Remove all cached battle analyses."""
+    with _BATTLE_CACHE_LOCK:
+        _BATTLE_CACHE.clear()
@@ -13,8 +13,54 @@ from langchain_openai import ChatOpenAI
 
 from app.core.config import settings
 from app.data.repositories.pokemon import fetch_pokemon_data
-from app.data.schemas.pokemon import ResearchPokemon, PokemonExpertAnalystAgent
-from app.services.agents.prompts import researcher_agent_template, expert_agent_template
+from app.data.schemas.pokemon import ResearchPokemon, ResearchPokemonBatch, PokemonExpertAnalystAgent
+from app.services.agents.prompts import (
+    researcher_agent_template, expert_agent_template, RESEARCHER_PROMPT_CACHE, EXPERT_PROMPT_CACHE
+)
+
+def _simplify(research: ResearchPokemon) -> Dict[str, Any]:
+    """
+    Convert a research result into the normalized dictionary returned by the API.
+    
+    Names, types and abilities come from the API data and are already lowercase;
+    missing optional fields are replaced with empty values, so callers can use
+    the result as-is.
+    
+    Args:
+        research (ResearchPokemon): The research result from the researcher agent
+        
+    Returns:
+        Dict[str, Any]: Normalized research results for the Pokemon
+    """
+    return {
+        "name": research.name,
+        "pokemon_details": research.pokemon_details,
+        "research_queries": research.research_queries,
+        "base_stats": research.base_stats or {},
+        "types": research.types or [],
+        "abilities": research.abilities or [],
+        "height": research.height or 0,
+        "weight": research.weight or 0,
+        "analysis": research.analysis
+    }
+
+def _apply_api_data(research: ResearchPokemon, pokemon_data: Dict[str, Any]) -> None:
+    """
+    Copy the data from the API response into a research result.
+    
+    PokeAPI names, types and abilities are lowercase, so this also normalizes
+    whatever casing the researcher agent used.
+    
+    Args:
+        research (ResearchPokemon): The research result from the researcher agent
+        pokemon_data (Dict[str, Any]): The Pokemon data from the API
+    """
+    research.name = pokemon_data["name"]
+    research.base_stats = pokemon_data["base_stats"]
+    research.types = pokemon_data["types"]
+    research.abilities = pokemon_data["abilities"]
+    research.height = pokemon_data["height"]
+    research.weight = pokemon_data["weight"]
 
 def research_pokemon(pokemon_name: str, llm: ChatOpenAI) -> Dict[str, Any]:
     """
@@ -81,7 +127,7 @@ def research_pokemon(pokemon_name: str, llm: ChatOpenAI) -> Dict[str, Any]:
     # Create the chain for the researcher agent
     chain = (
         researcher_agent_template
-        | llm.bind(tools=[researcher_tool], tool_choice={"type": "function", "function": {"name": "ResearchPokemon"}})
+        | llm.bind(tools=[researcher_tool], tool_choice={"type": "function", "function": {"name": "ResearchPokemon"}}, extra_body=RESEARCHER_PROMPT_CACHE)
         | parser
     )
     
@@ -91,13 +137,103 @@ def research_pokemon(pokemon_name: str, llm: ChatOpenAI) -> Dict[str, Any]:
     # Ensure all data from the API is included in the result
     if result and len(result) > 0:
         # Copy the data directly from the API response to ensure it's included
-        result[0].base_stats = pokemon_data["base_stats"]
-        result[0].types = pokemon_data["types"]
-        result[0].abilities = pokemon_data["abilities"]
-        result[0].height = pokemon_data["height"]
-        result[0].weight = pokemon_data["weight"]
+        _apply_api_data(result[0], pokemon_data)
+    
+    return _simplify(result[0]) if result and len(result) > 0 else {"error": "Failed to research Pokemon"}
+
+def research_pokemon_batch(pokemon_names: List[str], llm: ChatOpenAI) -> Dict[str, Dict[str, Any]]:
+    """
+    Research several Pokemon using the API and a single researcher agent call.
+    
+    Args:
+        pokemon_names (List[str]): The names of the Pokemon to research
+        llm (ChatOpenAI): The language model to use
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Research results keyed by the requested names
+    """
+    # Fetch Pokemon data from the API, keeping errors for Pokemon that failed
+    results: Dict[str, Dict[str, Any]] = {}
+    pokemon_data: Dict[str, Dict[str, Any]] = {}
+    for pokemon_name in pokemon_names:
+        data = fetch_pokemon_data(pokemon_name)
+        if "error" in data:
+            results[pokemon_name] = {"error": data["error"]}
+        else:
+            pokemon_data[pokemon_name] = data
+    
+    # Nothing to batch with a single Pokemon
+    if len(pokemon_data) == 1:
+        (pokemon_name,) = pokemon_data
+        results[pokemon_name] = research_pokemon(pokemon_name, llm)
+    elif pokemon_data:
+        researcher_tool = {
+            "type": "function",
+            "function": {
+                "name": "ResearchPokemonBatch",
+                "description": "Researcher agent that processes data for several Pokemon",
+                "parameters": ResearchPokemonBatch.model_json_schema()
+            }
+        }
+        
+        # Create a system message with the data for every Pokemon and clear instructions
+        data_sections = "\n\n".join(
+            f"Here is the Pokemon data for {pokemon_name}:\n{json.dumps(data, indent=2)}"
+            for pokemon_name, data in pokemon_data.items()
+        )
+        system_message = SystemMessage(
+            content=f"""{data_sections}
+
+            As a Pokemon Researcher Agent, your task is to research EACH of these Pokemon and
+            return one entry per Pokemon, in the order given, using the ResearchPokemon format:
+            1. Extract and organize ALL relevant details from its data
+            2. You MUST include the following information for each Pokemon:
+            - Name: The exact name of the Pokemon
+            - Base Stats: All stats including HP, Attack, Defense, Special Attack, Special Defense, and Speed
+            - Types: All types the Pokemon has
+            - Abilities: All abilities the Pokemon has
+            - Height: The height in meters
+            - Weight: The weight in kilograms
+
+            3. Provide a comprehensive analysis including:
+            - Base stats interpretation (what the Pokemon excels at)
+            - Type advantages and disadvantages
+            - How its abilities can be utilized effectively
+            - Recommended battle role based on stats and abilities
+            - Suggested moves and items that complement its strengths
+
+            Ensure each entry includes ALL the detailed information available in its data. Do not omit any stats, types, or abilities.
+            """
+        )
+        
+        human_message = HumanMessage(
+            content=f"Please analyze the Pokemon {', '.join(pokemon_data)} based on the provided data and return a comprehensive research report for each of them with all relevant details."
+        )
+        
+        # Create the chain for the researcher agent
+        parser = PydanticToolsParser(tools=[ResearchPokemonBatch])
+        chain = (
+            researcher_agent_template
+            | llm.bind(tools=[researcher_tool], tool_choice={"type": "function", "function": {"name": "ResearchPokemonBatch"}}, extra_body=RESEARCHER_PROMPT_CACHE)
+            | parser
+        )
+        
+        result = chain.invoke(input={"messages": [system_message, human_message]})
+        researched = result[0].pokemon if result else []
+        
+        # Match the research results to the requested Pokemon by name, falling back to position
+        researched_by_name = {research.name.lower(): research for research in researched}
+        for position, (pokemon_name, data) in enumerate(pokemon_data.items()):
+            research = researched_by_name.get(data["name"])
+            if research is None and position < len(researched):
+                research = researched[position]
+            if research is None:
+                results[pokemon_name] = {"error": "Failed to research Pokemon"}
+                continue
+            _apply_api_data(research, data)
+            results[pokemon_name] = _simplify(research)
     
-    return result[0].model_dump() if result and len(result) > 0 else {"error": "Failed to research Pokemon"}
+    return {pokemon_name: results[pokemon_name] for pokemon_name in pokemon_names}
 
 def analyze_pokemon_battle(pokemon_research_results: Dict[str, Dict[str, Any]], llm: ChatOpenAI) -> Dict[str, Any]:
     """
@@ -164,7 +300,7 @@ def analyze_pokemon_battle(pokemon_research_results: Dict[str, Dict[str, Any]],
     # Create the chain for the expert agent
     chain = (
         expert_agent_template
-        | llm.bind(tools=[expert_tool], tool_choice={"type": "function", "function": {"name": "PokemonExpertAnalystAgent"}})
+        | llm.bind(tools=[expert_tool], tool_choice={"type": "function", "function": {"name": "PokemonExpertAnalystAgent"}}, extra_body=EXPERT_PROMPT_CACHE)
         | parser
     )
     
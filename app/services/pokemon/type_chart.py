@@ -0,0 +1,137 @@
+"""
+Pokemon type chart.
+
+This module contains the type effectiveness chart and a deterministic battle
+heuristic based on base stat totals and type matchups, used to settle clear-cut
+battles without a language model call.
+"""
+
+from typing import Dict, Any, Iterable, Optional
+
+import numpy as np
+
+TYPES = (
+    "normal", "fire", "water", "electric", "grass", "ice",
+    "fighting", "poison", "ground", "flying", "psychic", "bug",
+    "rock", "ghost", "dragon", "dark", "steel", "fairy"
+)
+
+_TYPE_INDEX = {type_name: index for index, type_name in enumerate(TYPES)}
+
+# Attacking type -> defending types whose damage multiplier is not 1
+_NON_NEUTRAL_MATCHUPS = {
+    "normal": {"rock": 0.5, "ghost": 0.0, "steel": 0.5},
+    "fire": {"fire": 0.5, "water": 0.5, "grass": 2.0, "ice": 2.0, "bug": 2.0, "rock": 0.5, "dragon": 0.5, "steel": 2.0},
+    "water": {"fire": 2.0, "water": 0.5, "grass": 0.5, "ground": 2.0, "rock": 2.0, "dragon": 0.5},
+    "electric": {"water": 2.0, "electric": 0.5, "grass": 0.5, "ground": 0.0, "flying": 2.0, "dragon": 0.5},
+    "grass": {
+        "fire": 0.5, "water": 2.0, "grass": 0.5, "poison": 0.5, "ground": 2.0,
+        "flying": 0.5, "bug": 0.5, "rock": 2.0, "dragon": 0.5, "steel": 0.5
+    },
+    "ice": {"fire": 0.5, "water": 0.5, "grass": 2.0, "ice": 0.5, "ground": 2.0, "flying": 2.0, "dragon": 2.0, "steel": 0.5},
+    "fighting": {
+        "normal": 2.0, "ice": 2.0, "poison": 0.5, "flying": 0.5, "psychic": 0.5, "bug": 0.5,
+        "rock": 2.0, "ghost": 0.0, "dark": 2.0, "steel": 2.0, "fairy": 0.5
+    },
+    "poison": {"grass": 2.0, "poison": 0.5, "ground": 0.5, "rock": 0.5, "ghost": 0.5, "steel": 0.0, "fairy": 2.0},
+    "ground": {"fire": 2.0, "electric": 2.0, "grass": 0.5, "poison": 2.0, "flying": 0.0, "bug": 0.5, "rock": 2.0, "steel": 2.0},
+    "flying": {"electric": 0.5, "grass": 2.0, "fighting": 2.0, "bug": 2.0, "rock": 0.5, "steel": 0.5},
+    "psychic": {"fighting": 2.0, "poison": 2.0, "psychic": 0.5, "dark": 0.0, "steel": 0.5},
+    "bug": {
+        "fire": 0.5, "grass": 2.0, "fighting": 0.5, "poison": 0.5, "flying": 0.5,
+        "psychic": 2.0, "ghost": 0.5, "dark": 2.0, "steel": 0.5, "fairy": 0.5
+    },
+    "rock": {"fire": 2.0, "ice": 2.0, "fighting": 0.5, "ground": 0.5, "flying": 2.0, "bug": 2.0, "steel": 0.5},
+    "ghost": {"normal": 0.0, "psychic": 2.0, "ghost": 2.0, "dark": 0.5},
+    "dragon": {"dragon": 2.0, "steel": 0.5, "fairy": 0.0},
+    "dark": {"fighting": 0.5, "psychic": 2.0, "ghost": 2.0, "dark": 0.5, "fairy": 0.5},
+    "steel": {"fire": 0.5, "water": 0.5, "electric": 0.5, "ice": 2.0, "rock": 2.0, "steel": 0.5, "fairy": 2.0},
+    "fairy": {"fire": 0.5, "fighting": 2.0, "poison": 0.5, "dragon": 2.0, "dark": 2.0, "steel": 0.5}
+}
+
+# Damage multiplier indexed by [attacking type, defending type]
+EFFECTIVENESS = np.ones((len(TYPES), len(TYPES)), dtype=np.float32)
+for _attacker, _matchups in _NON_NEUTRAL_MATCHUPS.items():
+    for _defender, _multiplier in _matchups.items():
+        EFFECTIVENESS[_TYPE_INDEX[_attacker], _TYPE_INDEX[_defender]] = _multiplier
+del _attacker, _matchups, _defender, _multiplier
+
+# Minimum relative score difference for the heuristic to call a winner
+CONFIDENCE_MARGIN = 0.25
+
+def _type_indices(types: Iterable[str]) -> np.ndarray:
+    """Convert type names to chart indices, ignoring unknown types."""
+    return np.array(
+        [_TYPE_INDEX[t.lower()] for t in types if t.lower() in _TYPE_INDEX],
+        dtype=np.intp
+    )
+
+def type_multiplier(attacker_types: Iterable[str], defender_types: Iterable[str]) -> float:
+    """
+    Get the best damage multiplier the attacker's types have against the defender.
+
+    Args:
+        attacker_types: Types of the attacking Pokemon
+        defender_types: Types of the defending Pokemon
+
+    Returns:
+        float: The multiplier of the attacker's most effective type, or 1.0 if
+        either side has no known types
+    """
+    attackers = _type_indices(attacker_types)
+    defenders = _type_indices(defender_types)
+    if attackers.size == 0 or defenders.size == 0:
+        return 1.0
+    return float(EFFECTIVENESS[np.ix_(attackers, defenders)].prod(axis=1).max())
+
+def predict_battle(
+    pokemon_research: Dict[str, Dict[str, Any]],
+    margin: float = CONFIDENCE_MARGIN
+) -> Optional[Dict[str, Any]]:
+    """
+    Predict a battle from base stat totals and type matchups.
+
+    Each Pokemon scores its base stat total times its best type multiplier
+    against the opponent. A winner is only called when the scores differ by
+    more than the margin, relative to the higher score.
+
+    Args:
+        pokemon_research: Research results for both Pokemon, keyed by name
+        margin: Minimum relative score difference to call a winner
+
+    Returns:
+        Optional[Dict[str, Any]]: Battle analysis results in the same format as
+        the expert agent, or None if the data is incomplete or the battle is close
+    """
+    if len(pokemon_research) != 2:
+        return None
+
+    (name1, research1), (name2, research2) = pokemon_research.items()
+    if not all(r.get("base_stats") and r.get("types") for r in (research1, research2)):
+        return None
+
+    total1 = sum(research1["base_stats"].values())
+    total2 = sum(research2["base_stats"].values())
+    multiplier1 = type_multiplier(research1["types"], research2["types"])
+    multiplier2 = type_multiplier(research2["types"], research1["types"])
+    score1 = total1 * multiplier1
+    score2 = total2 * multiplier2
+
+    best = max(score1, score2)
+    if best <= 0 or abs(score1 - score2) / best <= margin:
+        return None
+
+    winner, loser = (name1, name2) if score1 > score2 else (name2, name1)
+    return {
+        "pokemon_1": name1,
+        "pokemon_2": name2,
+        "analysis": (
+            f"{name1} has a base stat total of {total1} and its best type deals x{multiplier1:g} damage to {name2}. "
+            f"{name2} has a base stat total of {total2} and its best type deals x{multiplier2:g} damage to {name1}."
+        ),
+        "reasoning": (
+            f"Weighting base stat totals by type effectiveness gives {name1} a score of {score1:.0f} "
+            f"and {name2} a score of {score2:.0f}, a clear advantage for {winner} over {loser}."
+        ),
+        "winner": winner
+    }
@@ -15,8 +15,11 @@ from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode
 
-from app.data.schemas.pokemon import SupervisorAgent, ResearchPokemon, PokemonExpertAnalystAgent
-from app.services.agents.prompts import supervisor_prompt_template, researcher_agent_template, expert_agent_template
+from app.data.schemas.pokemon import ResearchPokemon, PokemonExpertAnalystAgent
+from app.services.agents.prompts import (
+    researcher_agent_template, expert_agent_template, RESEARCHER_PROMPT_CACHE, EXPERT_PROMPT_CACHE
+)
+from app.services.agents.supervisor import supervisor_chain
 from app.utils.helpers.tool_executor import ToolExecutor, execute_tools
 from app.data.repositories.pokemon import fetch_pokemon_data
 from app.core.config import settings
@@ -51,25 +54,8 @@ def supervisor_node(state: State, llm: ChatOpenAI) -> Dict[str, Any]:
     if not human_message:
         return {"next": END}
     
-    # Define tools in the format expected by OpenAI
-    supervisor_tool = {
-        "type": "function",
-        "function": {
-            "name": "SupervisorAgent",
-            "description": "Supervisor agent that processes user queries with precision",
-            "parameters": SupervisorAgent.model_json_schema()
-        }
-    }
-    
-    # Create the parser
-    parser = PydanticToolsParser(tools=[SupervisorAgent])
-    
-    # Create the chain for the supervisor agent
-    chain = (
-        supervisor_prompt_template
-        | llm.bind(tools=[supervisor_tool], tool_choice={"type": "function", "function": {"name": "SupervisorAgent"}})
-        | parser
-    )
+    # Get the chain for the supervisor agent
+    chain = supervisor_chain(llm)
     
     # Invoke the chain with the message
     result = chain.invoke(input={"messages": [human_message]})
@@ -259,7 +245,7 @@ def pokemon_research_node(state: State, llm: ChatOpenAI) -> Dict[str, Any]:
         # Create the chain for the researcher agent
         chain = (
             researcher_agent_template
-            | llm.bind(tools=[researcher_tool], tool_choice={"type": "function", "function": {"name": "ResearchPokemon"}})
+            | llm.bind(tools=[researcher_tool], tool_choice={"type": "function", "function": {"name": "ResearchPokemon"}}, extra_body=RESEARCHER_PROMPT_CACHE)
             | parser
         )
         
@@ -357,7 +343,7 @@ def battle_analysis_node(state: State, llm: ChatOpenAI) -> Dict[str, Any]:
     # Create the chain for the expert agent
     chain = (
         expert_agent_template
-        | llm.bind(tools=[expert_tool], tool_choice={"type": "function", "function": {"name": "PokemonExpertAnalystAgent"}})
+        | llm.bind(tools=[expert_tool], tool_choice={"type": "function", "function": {"name": "PokemonExpertAnalystAgent"}}, extra_body=EXPERT_PROMPT_CACHE)
         | parser
     )
     
@@ -352,12 +352,50 @@ def schedule_auto_evaluation(frequency_hours: int = 24) -> None:
     logger.info("To implement scheduled evaluations, add a proper task scheduler to the project")
 
 
-def get_recent_runs(limit: int = 10) -> List[Dict[str, Any]]:
+def _metadata_filter(key: str, value: str) -> str:
+    """Build a LangSmith filter expression matching a run metadata value."""
+    value = value.replace('"', '\\"')
+    return f'and(eq(metadata_key, "{key}"), eq(metadata_value, "{value}"))'
+
+
+def _build_runs_filter(filter_criteria: Optional[Dict[str, str]]) -> Optional[str]:
+    """
+    Build a LangSmith filter expression from the analytics filter criteria.
+    
+    Args:
+        filter_criteria: Optional ``endpoint`` and ``pokemon_name`` values to match
+        
+    Returns:
+        Optional[str]: The filter expression, or None if there is nothing to filter on
+    """
+    if not filter_criteria:
+        return None
+    
+    clauses = []
+    if filter_criteria.get("endpoint"):
+        clauses.append(_metadata_filter("endpoint", filter_criteria["endpoint"]))
+    if filter_criteria.get("pokemon_name"):
+        # Battle runs record the Pokemon as pokemon1 and pokemon2
+        clauses.append(
+            f'or({_metadata_filter("pokemon1", filter_criteria["pokemon_name"])}, '
+            f'{_metadata_filter("pokemon2", filter_criteria["pokemon_name"])})'
+        )
+    
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else f"and({', '.join(clauses)})"
+
+
+def get_recent_runs(limit: int = 10, filter_criteria: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
     """
     Get recent runs from LangSmith.
     
+    Filtering and the limit are applied by LangSmith, so only the requested
+    runs are fetched.
+    
     Args:
         limit: Maximum number of runs to return
+        filter_criteria: Optional ``endpoint`` and ``pokemon_name`` values to match
         
     Returns:
         List of recent runs
@@ -377,6 +415,7 @@ def get_recent_runs(limit: int = 10) -> List[Dict[str, Any]]:
         runs = client.list_runs(
             project_name=settings.LANGSMITH_PROJECT,
             execution_order=1,  # Most recent first
+            filter=_build_runs_filter(filter_criteria),
             limit=limit
         )
         
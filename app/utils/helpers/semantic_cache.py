@@ -0,0 +1,117 @@
+"""
+Semantic response cache.
+
+This module contains a two-tier cache for chat responses: an exact tier keyed by
+a hash of the normalized message, and an optional semantic tier that matches
+near-duplicate messages by embedding similarity.
+"""
+
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
+from langchain_core.embeddings import Embeddings
+
+class SemanticCache:
+    """Two-tier cache for chat responses keyed by the user's message."""
+
+    def __init__(
+        self,
+        embeddings: Optional[Embeddings] = None,
+        threshold: float = 0.92,
+        maxsize: int = 1024,
+        ttl: float = 3600
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embeddings: Embedding model for the semantic tier; exact matching only if None
+            threshold: Minimum cosine similarity for a semantic hit
+            maxsize: Maximum number of cached responses
+            ttl: Time in seconds a response stays cached
+        """
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self._responses: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._vectors: Dict[str, np.ndarray] = {}
+        # Embeddings computed on a miss, reused when the response is stored
+        self._pending_vectors: LRUCache = LRUCache(maxsize=256)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(message: str) -> str:
+        """Hash the normalized message into an exact-match key."""
+        return hashlib.sha256(message.strip().lower().encode("utf-8")).hexdigest()
+
+    def _embed(self, message: str) -> np.ndarray:
+        """Embed a message as a unit vector."""
+        vector = np.asarray(self.embeddings.embed_query(message.strip()), dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def get(self, message: str) -> Optional[Any]:
+        """
+        Look up the cached response for a message.
+
+        Args:
+            message: The user's message
+
+        Returns:
+            Optional[Any]: The cached response for the same or a similar message, or None
+        """
+        key = self._key(message)
+        with self._lock:
+            response = self._responses.get(key)
+        if response is not None or self.embeddings is None:
+            return response
+
+        vector = self._embed(message)
+        with self._lock:
+            self._pending_vectors[key] = vector
+
+            # Drop vectors whose responses have expired or been evicted
+            for stale_key in self._vectors.keys() - self._responses.keys():
+                del self._vectors[stale_key]
+            if not self._vectors:
+                return None
+
+            keys = list(self._vectors)
+            similarities = np.stack([self._vectors[k] for k in keys]) @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                return self._responses.get(keys[best])
+        return None
+
+    def put(self, message: str, response: Any, semantic: bool = True) -> None:
+        """
+        Store the response for a message.
+
+        Args:
+            message: The user's message
+            response: The response to cache
+            semantic: Whether similar messages may be served the response; if False,
+                only the same message is
+        """
+        key = self._key(message)
+        with self._lock:
+            vector = self._pending_vectors.pop(key, None)
+            if not semantic:
+                vector = None
+                # Replace any earlier semantic entry for the message
+                self._vectors.pop(key, None)
+        if semantic and vector is None and self.embeddings is not None:
+            vector = self._embed(message)
+
+        with self._lock:
+            self._responses[key] = response
+            if vector is not None:
+                self._vectors[key] = vector
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._responses.clear()
+            self._vectors.clear()
+            self._pending_vectors.clear()
@@ -70,8 +70,17 @@ def execute_tools(state: List[BaseMessage], tool_executor) -> List[ToolMessage]:
     
     parsed_tool_calls = None
     
+    # Structured results handed over in-process skip the JSON round-trip
+    structured = getattr(tool_invocation, 'additional_kwargs', {}).get("structured")
+    
     if hasattr(tool_invocation, 'tool_calls') and tool_invocation.tool_calls:
         parsed_tool_calls = tool_invocation.tool_calls
+    elif isinstance(structured, dict):
+        if structured.get("needs_search", False) or structured.get("search_queries"):
+            parsed_tool_calls = [structured]
+        else:
+            print("No search indicators found in structured content")
+            return []
     elif hasattr(tool_invocation, 'content') and isinstance(tool_invocation.content, str):
         try:
             content = tool_invocation.content
@@ -180,8 +189,10 @@ def execute_tools(state: List[BaseMessage], tool_executor) -> List[ToolMessage]:
         for id_, mapped_output in outputs_map.items():
             print(f"Creating ToolMessage for ID: {id_}")
             print(f"Mapped output: {mapped_output}")
+            # Keep the raw output as the artifact so callers need not re-parse the content
             tool_messages.append(ToolMessage(
-                content=mapped_output,
+                content=str(mapped_output),
+                artifact=mapped_output,
                 tool_call_id=id_
             ))
     except Exception as e:
@@ -7,7 +7,12 @@ SERVICE=${SERVICE:-api}
 # Run the specified service
 if [ "$SERVICE" = "api" ]; then
     echo "Starting Pokemon AI Agents API..."
-    exec uvicorn app.main:app --host 0.0.0.0 --port 8088 --reload
+    # Auto-reload only supports a single process, so it is used when running one worker
+    if [ "${API_WORKERS:-1}" -gt 1 ]; then
+        exec uvicorn app.main:app --host 0.0.0.0 --port 8088 --loop uvloop --http httptools --workers "$API_WORKERS"
+    else
+        exec uvicorn app.main:app --host 0.0.0.0 --port 8088 --loop uvloop --http httptools --reload
+    fi
 elif [ "$SERVICE" = "streamlit" ]; then
     echo "Starting Pokemon AI Agents Streamlit Frontend..."
     exec streamlit run app/frontend/streamlit/app.py --server.port 8501 --server.address 0.0.0.0
@@ -11,11 +11,23 @@ from langchain_openai import ChatOpenAI
 
 from app.main import app
 from app.core.dependencies import get_llm, get_search_wrapper
+from app.services.pokemon.cache import clear_research_cache, clear_battle_cache
 
 # Create mock LLM and search wrapper
 mock_llm = MagicMock(spec=ChatOpenAI)
 mock_search_wrapper = MagicMock()
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Clear the in-memory Pokemon caches so tests do not share results.
+    """
+    clear_research_cache()
+    clear_battle_cache()
+    yield
+    clear_research_cache()
+    clear_battle_cache()
+
 @pytest.fixture
 def test_client():
     """
@@ -0,0 +1,48 @@
+"""
+Tests for the compression middleware.
+
+This module contains tests for the event stream aware GZip middleware.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from app.api.middleware.gzip import EventStreamGZipMiddleware
+
+@pytest.fixture
+def gzip_client():
+    """
+    Create a test client for an app that returns a large plain text body.
+    
+    Returns:
+        TestClient: A test client for the app wrapped in the middleware
+    """
+    app = FastAPI()
+    
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse("x" * 2048)
+    
+    app.add_middleware(EventStreamGZipMiddleware, minimum_size=1024)
+    return TestClient(app)
+
+class TestEventStreamGZipMiddleware:
+    """Tests for the event stream aware GZip middleware."""
+    
+    def test_compresses_regular_responses(self, gzip_client):
+        """Test that large responses are compressed for clients that accept gzip."""
+        response = gzip_client.get("/large", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.headers["content-encoding"] == "gzip"
+    
+    def test_skips_event_stream_requests(self, gzip_client):
+        """Test that requests for an event stream are never compressed."""
+        response = gzip_client.get(
+            "/large",
+            headers={"Accept-Encoding": "gzip", "Accept": "text/event-stream"}
+        )
+        
+        assert "content-encoding" not in response.headers
+        assert response.text == "x" * 2048
@@ -12,14 +12,33 @@ from app.api.models.pokemon import (
     PokemonStats, 
     PokemonResearchDetails,
     BattleAnalysis,
+    Reflection,
     SupervisorResult,
+    FinalAnswer,
+    ChatResponsePayload,
     ChatResponse,
     BattleResponse
 )
+from app.data.schemas.pokemon import ResearchPokemon
 
 class TestPokemonModels:
     """Tests for the Pokemon API models."""
     
+    def test_response_models_built_at_import(self):
+        """Test response model validators are complete before first use."""
+        for model in (
+            PokemonStats,
+            PokemonResearchDetails,
+            BattleAnalysis,
+            Reflection,
+            SupervisorResult,
+            FinalAnswer,
+            ChatResponsePayload,
+            ChatResponse,
+            BattleResponse
+        ):
+            assert model.__pydantic_complete__
+    
     def test_chat_request_valid(self):
         """Test ChatRequest with valid data."""
         data = {"message": "Test message"}
@@ -82,7 +101,25 @@ class TestPokemonModels:
         
         with pytest.raises(ValidationError):
             PokemonStats(**data)
-    
+
+    def test_pokemon_stats_frozen_and_strict_fields(self):
+        """Test PokemonStats rejects unknown keys and assignment."""
+        data = {
+            "hp": 35,
+            "attack": 55,
+            "defense": 40,
+            "special_attack": 50,
+            "special_defense": 50,
+            "speed": 90
+        }
+        stats = PokemonStats(**data)
+
+        with pytest.raises(ValidationError):
+            stats.hp = 100
+
+        with pytest.raises(ValidationError):
+            PokemonStats(**data, accuracy=100)
+
     def test_pokemon_research_details_valid(self):
         """Test PokemonResearchDetails with valid data."""
         data = {
@@ -105,7 +142,7 @@ class TestPokemonModels:
         details = PokemonResearchDetails(**data)
         
         assert details.name == "pikachu"
-        assert details.base_stats["hp"] == 35
+        assert details.base_stats.hp == 35
         assert details.types == ["electric"]
         assert details.abilities == ["static", "lightning-rod"]
         assert details.height == 0.4
@@ -167,6 +204,46 @@ class TestPokemonModels:
         with pytest.raises(ValidationError):
             PokemonResearchDetails(**data)
     
+    def test_pokemon_research_details_from_attributes(self, research_pikachu_result):
+        """Test PokemonResearchDetails built from a ResearchPokemon instance."""
+        research = ResearchPokemon(**research_pikachu_result)
+        details = PokemonResearchDetails.model_validate(research)
+
+        assert isinstance(details.base_stats, PokemonStats)
+        assert details.base_stats.speed == 90
+
+        # Incomplete base stats are rejected
+        research.base_stats = {"hp": 35}
+        with pytest.raises(ValidationError):
+            PokemonResearchDetails.model_validate(research)
+
+    def test_pokemon_research_details_ignores_extra_fields(self):
+        """Test PokemonResearchDetails drops unknown keys and serializes without nulls."""
+        data = {
+            "name": "pikachu",
+            "base_stats": {
+                "hp": 35,
+                "attack": 55,
+                "defense": 40,
+                "special_attack": 50,
+                "special_defense": 50,
+                "speed": 90
+            },
+            "types": ["electric"],
+            "abilities": ["static"],
+            "height": 0.4,
+            "weight": 6.0,
+            "pokemon_details": [],
+            "research_queries": [],
+            "sprite_url": "https://example.com/25.png"
+        }
+        details = PokemonResearchDetails(**data)
+        dumped = details.model_dump_json(exclude_none=True)
+    
+        assert not hasattr(details, "sprite_url")
+        assert "sprite_url" not in dumped
+        assert "analysis" not in dumped
+    
     def test_battle_analysis_valid(self):
         """Test BattleAnalysis with valid data."""
         data = {
@@ -212,7 +289,9 @@ class TestPokemonModels:
         result = SupervisorResult(**data)
         
         assert result.answer == "This is the answer"
-        assert result.reflection["reasoning"] == "This is the reasoning"
+        assert isinstance(result.reflection, Reflection)
+        assert result.reflection.reasoning == "This is the reasoning"
+        assert result.reflection.answer == "This is the reflection answer"
         assert result.is_pokemon_query is True
         assert result.pokemon_names == ["pikachu", "bulbasaur"]
         assert result.search_queries is None  # Optional field
@@ -233,6 +312,19 @@ class TestPokemonModels:
         assert result.search_queries == ["query 1", "query 2"]
         assert result.pokemon_names is None  # Optional field
     
+    def test_supervisor_result_reasoning_only_reflection(self):
+        """Test SupervisorResult accepts a reflection without an answer."""
+        data = {
+            "answer": "This is the answer",
+            "reflection": {"reasoning": "Processed using LangGraph", "thoughts": "ignored"},
+            "is_pokemon_query": False
+        }
+        result = SupervisorResult(**data)
+        
+        assert result.reflection.reasoning == "Processed using LangGraph"
+        assert result.reflection.answer is None
+        assert not hasattr(result.reflection, "thoughts")
+    
     def test_supervisor_result_invalid(self):
         """Test SupervisorResult with invalid data."""
         # Missing required field
@@ -265,7 +357,9 @@ class TestPokemonModels:
         response = ChatResponse(**data)
         
         assert response.response is not None
-        assert response.response["supervisor_result"]["answer"] == "This is the answer"
+        assert response.response.supervisor_result.answer == "This is the answer"
+        assert response.response.pokemon_research == {}
+        assert response.response.battle_analysis is None
     
     def test_chat_response_with_extra_fields(self):
         """Test ChatResponse with extra fields (allowed by model_config)."""
@@ -303,7 +397,11 @@ class TestPokemonModels:
                     "speed": 90
                 },
                 "types": ["electric"],
-                "abilities": ["static", "lightning-rod"]
+                "abilities": ["static", "lightning-rod"],
+                "height": 0.4,
+                "weight": 6.0,
+                "pokemon_details": ["Pikachu is an Electric-type Pokémon."],
+                "research_queries": ["How does Pikachu evolve?"]
             },
             "pokemon2": {
                 "name": "bulbasaur",
@@ -316,7 +414,11 @@ class TestPokemonModels:
                     "speed": 45
                 },
                 "types": ["grass", "poison"],
-                "abilities": ["overgrow", "chlorophyll"]
+                "abilities": ["overgrow", "chlorophyll"],
+                "height": 0.7,
+                "weight": 6.9,
+                "pokemon_details": ["Bulbasaur is a Grass/Poison-type Pokémon."],
+                "research_queries": ["How does Bulbasaur evolve?"]
             },
             "battle_analysis": {
                 "pokemon_1": "pikachu",
@@ -328,9 +430,9 @@ class TestPokemonModels:
         }
         response = BattleResponse(**data)
         
-        assert response.pokemon1["name"] == "pikachu"
-        assert response.pokemon2["name"] == "bulbasaur"
-        assert response.battle_analysis["winner"] == "bulbasaur"
+        assert response.pokemon1.name == "pikachu"
+        assert response.pokemon2.base_stats.speed == 45
+        assert response.battle_analysis.winner == "bulbasaur"
     
     def test_battle_response_invalid(self):
         """Test BattleResponse with invalid data."""
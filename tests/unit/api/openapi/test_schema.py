@@ -0,0 +1,36 @@
+"""
+Tests for the OpenAPI schema customization.
+
+This module contains tests for the custom OpenAPI schema generation.
+"""
+
+import pytest
+from unittest.mock import patch
+from fastapi.openapi.utils import get_openapi
+
+from app.main import app
+from app.api.openapi.schema import custom_openapi
+
+class TestCustomOpenAPI:
+    """Tests for the custom OpenAPI schema."""
+    
+    def test_custom_openapi_is_cached(self):
+        """Test that the schema is built once and then reused."""
+        app.openapi_schema = None
+        
+        with patch('app.api.openapi.schema.get_openapi', wraps=get_openapi) as mock_get_openapi:
+            first = custom_openapi(app)
+            second = custom_openapi(app)
+        
+        # Assertions
+        assert first is second
+        assert app.openapi_schema is first
+        mock_get_openapi.assert_called_once()
+    
+    def test_openapi_endpoint(self, test_client):
+        """Test that the OpenAPI endpoint serves the custom schema."""
+        response = test_client.get("/openapi.json")
+        
+        assert response.status_code == 200
+        tag_names = [tag["name"] for tag in response.json()["tags"]]
+        assert "Pokemon" in tag_names
@@ -0,0 +1,80 @@
+"""
+Tests for the Swagger UI customization.
+
+This module contains tests for the custom documentation pages.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from fastapi.responses import HTMLResponse
+
+from app.main import app
+from app.api.openapi import swagger_ui
+from app.api.openapi.swagger_ui import get_custom_swagger_ui_html, get_custom_redoc_html
+
+class TestSwaggerUI:
+    """Tests for the custom documentation pages."""
+    
+    def test_docs_endpoint(self, test_client):
+        """Test that the Swagger UI page includes the Pokemon customization."""
+        response = test_client.get("/docs")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "swagger-help" in response.text
+        assert response.text.rstrip().endswith("</html>")
+    
+    def test_redoc_endpoint(self, test_client):
+        """Test that the ReDoc page is served."""
+        response = test_client.get("/redoc")
+        
+        assert response.status_code == 200
+        assert "redoc" in response.text
+    
+    def test_docs_endpoint_not_modified(self, test_client):
+        """Test that a repeat request with the page's ETag gets an empty 304."""
+        first = test_client.get("/docs")
+        etag = first.headers["etag"]
+        
+        second = test_client.get("/docs", headers={"If-None-Match": etag})
+        
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+        assert "Accept-Encoding" in first.headers["vary"]
+        
+        # Tags that came back weak, e.g. after compression, still match
+        redoc_etag = test_client.get("/redoc").headers["etag"]
+        weak = test_client.get("/redoc", headers={"If-None-Match": f'"other", W/{redoc_etag}'})
+        assert weak.status_code == 304
+    
+    @patch('app.api.openapi.swagger_ui._SWAGGER_RESPONSE', None)
+    @patch('app.api.openapi.swagger_ui.get_swagger_ui_html', wraps=swagger_ui.get_swagger_ui_html)
+    def test_swagger_ui_html_is_cached(self, mock_get_swagger_ui_html):
+        """Test that the Swagger UI page is rendered only once."""
+        first = get_custom_swagger_ui_html(app)
+        second = get_custom_swagger_ui_html(app)
+        
+        assert first is second
+        mock_get_swagger_ui_html.assert_called_once()
+    
+    @patch('app.api.openapi.swagger_ui._REDOC_RESPONSE', None)
+    @patch('app.api.openapi.swagger_ui.get_redoc_html', wraps=swagger_ui.get_redoc_html)
+    def test_redoc_html_is_cached(self, mock_get_redoc_html):
+        """Test that the ReDoc page is rendered only once."""
+        first = get_custom_redoc_html(app)
+        second = get_custom_redoc_html(app)
+        
+        assert first is second
+        mock_get_redoc_html.assert_called_once()
+    
+    @patch('app.api.openapi.swagger_ui._SWAGGER_RESPONSE', None)
+    @patch('app.api.openapi.swagger_ui.get_swagger_ui_html')
+    def test_swagger_ui_html_without_body_tag(self, mock_get_swagger_ui_html):
+        """Test that the custom block is appended when the page has no closing body tag."""
+        mock_get_swagger_ui_html.return_value = HTMLResponse("<html><div id=\"swagger-ui\"></div>")
+        
+        body = get_custom_swagger_ui_html(app).body
+        
+        assert body == b"<html><div id=\"swagger-ui\"></div>" + swagger_ui.POKEMON_CSS_BYTES
@@ -4,78 +4,111 @@ Tests for the general router.
 This module contains tests for the general router endpoints.
 """
 
+import os
+
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
 from fastapi import status
-from pathlib import Path
 
 from app.main import app
 
+@pytest.fixture
+def project_root(tmp_path):
+    """
+    Point the general router at a temporary project root with an empty cache.
+
+    Returns:
+        Path: The temporary project root containing the static directory
+    """
+    static_dir = tmp_path / "static"
+    with patch('app.api.routers.general._INDEX_HTML_CACHE', None), \
+         patch('app.api.routers.general._STATIC_DIR', static_dir), \
+         patch('app.api.routers.general._INDEX_PATH', static_dir / "index.html"):
+        yield tmp_path
+
 class TestGeneralRouter:
     """Tests for the general router."""
-    
-    @patch('app.api.routers.general.Path')
-    @patch('app.api.routers.general.open', new_callable=mock_open, read_data="<html>Test HTML</html>")
-    def test_root_endpoint_existing_file(self, mock_file, mock_path, test_client):
+
+    def test_root_endpoint_existing_file(self, project_root, test_client):
         """Test the root endpoint when index.html exists."""
-        # Setup mock path
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value.parent.parent.parent.parent.__truediv__.return_value = mock_path_instance
-        mock_path_instance.__truediv__.return_value = mock_path_instance
-        
+        static_dir = project_root / "static"
+        static_dir.mkdir()
+        (static_dir / "index.html").write_text("<html>Test HTML</html>")
+
         # Make request
         response = test_client.get("/")
-        
+
         # Assertions
         assert response.status_code == status.HTTP_200_OK
         assert response.text == "<html>Test HTML</html>"
-        
-        # Verify mock was called correctly
-        mock_path_instance.exists.assert_called_once()
-        mock_file.assert_called_once()
-    
-    @patch('app.api.routers.general.Path')
-    @patch('app.api.routers.general.os.makedirs')
-    @patch('app.api.routers.general.open', new_callable=mock_open)
-    def test_root_endpoint_create_file(self, mock_file, mock_makedirs, mock_path, test_client):
+
+    def test_root_endpoint_create_file(self, project_root, test_client):
         """Test the root endpoint when index.html doesn't exist."""
-        # Setup mock path
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = False
-        mock_path.return_value.parent.parent.parent.parent.__truediv__.return_value = mock_path_instance
-        mock_path_instance.__truediv__.return_value = mock_path_instance
-        
-        # Setup mock file to return different content when read
-        mock_file.return_value.__enter__.return_value.read.return_value = "<!DOCTYPE html>"
-        
         # Make request
         response = test_client.get("/")
-        
+
         # Assertions
         assert response.status_code == status.HTTP_200_OK
         assert "<!DOCTYPE html>" in response.text
-        
-        # Verify mocks were called correctly
-        mock_path_instance.exists.assert_called_once()
-        mock_makedirs.assert_called_once()
-        assert mock_file.call_count == 2  # Once for writing, once for reading
-        
+
         # Verify the file was written with HTML content
-        write_call = mock_file.return_value.__enter__.return_value.write.call_args[0][0]
-        assert "<!DOCTYPE html>" in write_call
-        assert "Pokemon AI Agents API" in write_call
-    
-    @patch('app.api.routers.general.Path')
-    def test_root_endpoint_error(self, mock_path, test_client):
+        written = (project_root / "static" / "index.html").read_text()
+        assert "<!DOCTYPE html>" in written
+        assert "Pokemon AI Agents API" in written
+
+    def test_root_endpoint_cached(self, project_root, test_client):
+        """Test the root endpoint re-hashes index.html only when it changes."""
+        static_dir = project_root / "static"
+        static_dir.mkdir()
+        index_path = static_dir / "index.html"
+        index_path.write_text("<html>First</html>")
+        os.utime(index_path, ns=(1_000_000_000, 1_000_000_000))
+
+        with patch('app.api.routers.general.open', wraps=open) as mock_file:
+            assert test_client.get("/").text == "<html>First</html>"
+            assert test_client.get("/").text == "<html>First</html>"
+            mock_file.assert_called_once()
+
+            # A modified file is picked up on the next request
+            index_path.write_text("<html>Second</html>")
+            os.utime(index_path, ns=(2_000_000_000, 2_000_000_000))
+            assert test_client.get("/").text == "<html>Second</html>"
+            assert mock_file.call_count == 2
+
+    def test_root_endpoint_etag(self, project_root, test_client):
+        """Test the root endpoint answers a matching If-None-Match with 304."""
+        static_dir = project_root / "static"
+        static_dir.mkdir()
+        (static_dir / "index.html").write_text("<html>Test HTML</html>")
+
+        response = test_client.get("/")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=3600"
+
+        # Matching ETag returns an empty 304
+        response = test_client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+        # A weak tag in a list of tags also matches
+        response = test_client.get("/", headers={"If-None-Match": f'"stale", W/{etag}'})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        # Stale ETag returns the full page
+        response = test_client.get("/", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text == "<html>Test HTML</html>"
+
+    @patch('app.api.routers.general._load_index_html')
+    def test_root_endpoint_error(self, mock_load, test_client):
         """Test the root endpoint when an error occurs."""
-        # Setup mock path to raise an exception
-        mock_path.side_effect = Exception("Test error")
-        
+        # Setup mock loader to raise an exception
+        mock_load.side_effect = Exception("Test error")
+
         # Make request
         response = test_client.get("/")
-        
+
         # Assertions
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         response_data = response.json()
@@ -4,16 +4,20 @@ Tests for the Pokemon router.
 This module contains tests for the Pokemon router endpoints.
 """
 
+import orjson
 import pytest
 from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
-from fastapi import status
+from fastapi import BackgroundTasks, status
 
 from app.main import app
 import app.api.routers.pokemon
 from app.core.config import settings
 from app.api.models.pokemon import ChatRequest
-from app.core.dependencies import get_llm, get_search_wrapper
+from app.api.routers.pokemon import _schedule_auto_dataset
+from app.services.agents.supervisor import _loose_parse
+from app.core.dependencies import get_llm, get_search_wrapper, get_chat_cache
+from app.utils.helpers.semantic_cache import SemanticCache
 from tests.unit.api.conftest import mock_llm, mock_search_wrapper
 
 class TestPokemonRouter:
@@ -26,6 +30,43 @@ class TestPokemonRouter:
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == {"status": "ok", "message": "Pokemon API is running"}
     
+    @patch('app.api.routers.pokemon.process_query')
+    def test_chat_response_compressed(self, mock_process_query, test_client):
+        """Test that large responses are gzip-compressed and small ones are not."""
+        with patch('app.api.routers.pokemon.use_langgraph', False):
+            mock_process_query.return_value = {
+                "answer": "Pokemon were created by Satoshi Tajiri. " * 50,
+                "reflection": {"reasoning": "Some reasoning"},
+                "is_pokemon_query": False
+            }
+            
+            response = test_client.post(
+                f"{settings.API_V1_STR}/pokemon/chat",
+                json={"message": "Who created Pokemon?"},
+                headers={"Accept-Encoding": "gzip"}
+            )
+            health = test_client.get(f"{settings.API_V1_STR}/pokemon/health", headers={"Accept-Encoding": "gzip"})
+            
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.json()["response"]["supervisor_result"]["answer"].startswith("Pokemon were created")
+            assert "content-encoding" not in health.headers
+    
+    @patch('app.api.routers.pokemon.get_recent_runs')
+    def test_analytics_runs(self, mock_get_runs, test_client):
+        """Test that the analytics endpoint passes the limit and filters to LangSmith."""
+        mock_get_runs.return_value = [{"id": "run-1", "name": "chat"}]
+        
+        response = test_client.get(
+            f"{settings.API_V1_STR}/pokemon/analytics/runs?limit=5&endpoint=battle&pokemon_name=pikachu"
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["count"] == 1
+        mock_get_runs.assert_called_once_with(
+            limit=5, filter_criteria={"endpoint": "battle", "pokemon_name": "pikachu"}
+        )
+    
     @patch('app.api.routers.pokemon.process_query')
     def test_chat_general_query(self, mock_process_query, test_client):
         """Test the chat endpoint with a general query."""
@@ -54,16 +95,21 @@ class TestPokemonRouter:
             assert response_data["response"]["supervisor_result"]["answer"] == "This is a general answer."
             assert not response_data["response"]["supervisor_result"]["is_pokemon_query"]
             
+            # Null fields are omitted from the payload
+            assert "battle_analysis" not in response_data["response"]
+            assert "final_answer" not in response_data["response"]
+            
             # Verify mock was called correctly
             # Use any instance of the mocks from the fixture
             mock_process_query.assert_called_once_with(
                 "What is the capital of France?", 
                 mock_llm, 
-                mock_search_wrapper
+                mock_search_wrapper,
+                None
             )
     
     @patch('app.api.routers.pokemon.process_query')
-    @patch('app.api.routers.pokemon.research_pokemon')
+    @patch('app.services.pokemon.cache.research_pokemon')
     def test_chat_pokemon_query_single(self, mock_research, mock_process_query, test_client):
         """Test the chat endpoint with a query about a single Pokemon."""
         # Patch the use_langgraph variable at the module level
@@ -116,10 +162,11 @@ class TestPokemonRouter:
             mock_process_query.assert_called_once()
             mock_research.assert_called_once_with("pikachu", mock_llm)
     
+    @patch('app.services.pokemon.cache.predict_battle', return_value=None)
     @patch('app.api.routers.pokemon.process_query')
-    @patch('app.api.routers.pokemon.research_pokemon')
-    @patch('app.api.routers.pokemon.analyze_pokemon_battle')
-    def test_chat_pokemon_query_battle(self, mock_battle, mock_research, mock_process_query, test_client):
+    @patch('app.services.pokemon.cache.research_pokemon_batch')
+    @patch('app.services.pokemon.cache.analyze_pokemon_battle')
+    def test_chat_pokemon_query_battle(self, mock_battle, mock_research, mock_process_query, mock_predict, test_client):
         """Test the chat endpoint with a query about a battle between two Pokemon."""
         # Patch the use_langgraph variable at the module level
         with patch('app.api.routers.pokemon.use_langgraph', False):
@@ -172,12 +219,12 @@ class TestPokemonRouter:
             }
             
             # Configure the mock to return different values based on input
-            def research_side_effect(pokemon_name, _):
-                if pokemon_name.lower() == "pikachu":
-                    return pikachu_research
-                elif pokemon_name.lower() == "bulbasaur":
-                    return bulbasaur_research
-                return {"error": "Pokemon not found"}
+            def research_side_effect(pokemon_names, _):
+                research = {"pikachu": pikachu_research, "bulbasaur": bulbasaur_research}
+                return {
+                    pokemon_name: research.get(pokemon_name.lower(), {"error": "Pokemon not found"})
+                    for pokemon_name in pokemon_names
+                }
         
             mock_research.side_effect = research_side_effect
             
@@ -214,11 +261,11 @@ class TestPokemonRouter:
             
             # Verify mocks were called correctly
             mock_process_query.assert_called_once()
-            assert mock_research.call_count == 2
+            mock_research.assert_called_once_with(["pikachu", "bulbasaur"], mock_llm)
             mock_battle.assert_called_once()
     
-    @patch('app.api.routers.pokemon.research_pokemon')
-    @patch('app.api.routers.pokemon.analyze_pokemon_battle')
+    @patch('app.services.pokemon.cache.research_pokemon_batch')
+    @patch('app.services.pokemon.cache.analyze_pokemon_battle')
     def test_battle_endpoint(self, mock_battle, mock_research, test_client):
         """Test the battle endpoint."""
         # Setup mocks
@@ -259,12 +306,12 @@ class TestPokemonRouter:
         }
         
         # Configure the mock to return different values based on input
-        def research_side_effect(pokemon_name, _):
-            if pokemon_name.lower() == "pikachu":
-                return pikachu_research
-            elif pokemon_name.lower() == "bulbasaur":
-                return bulbasaur_research
-            return {"error": f"Failed to fetch data for {pokemon_name}"}
+        def research_side_effect(pokemon_names, _):
+            research = {"pikachu": pikachu_research, "bulbasaur": bulbasaur_research}
+            return {
+                pokemon_name: research.get(pokemon_name.lower(), {"error": f"Failed to fetch data for {pokemon_name}"})
+                for pokemon_name in pokemon_names
+            }
         
         mock_research.side_effect = research_side_effect
         
@@ -289,30 +336,34 @@ class TestPokemonRouter:
         assert "pokemon1" in response_data
         assert "pokemon2" in response_data
         assert "battle_analysis" in response_data
-        assert response_data["battle_analysis"]["winner"] == "bulbasaur"
+        assert response_data["battle_analysis"]["winner"] == "Bulbasaur"
+        assert response_data["pokemon1"]["base_stats"]["speed"] == 90
+        assert response.headers["content-type"] == "application/json"
         
-        # Verify mocks were called correctly
-        assert mock_research.call_count == 2
-        mock_battle.assert_called_once()
+        # Verify mocks were called correctly; the type chart settles this matchup
+        mock_research.assert_called_once_with(["Pikachu", "Bulbasaur"], mock_llm)
+        mock_battle.assert_not_called()
     
-    @patch('app.api.routers.pokemon.research_pokemon')
+    @patch('app.services.pokemon.cache.research_pokemon_batch')
     def test_battle_endpoint_pokemon_not_found(self, mock_research, test_client):
         """Test the battle endpoint when a Pokemon is not found."""
         # Setup mock to return error for nonexistent_pokemon and success for Bulbasaur
-        def research_side_effect(pokemon_name, _):
-            if pokemon_name.lower() == "nonexistent_pokemon":
-                return {"error": "Failed to fetch data for nonexistent_pokemon"}
-            else:
-                return {
-                    "name": "bulbasaur",
-                    "pokemon_details": ["Bulbasaur is a Grass/Poison-type Pokémon."],
-                    "base_stats": {"hp": 45},
-                    "types": ["grass", "poison"],
-                    "abilities": ["overgrow"],
-                    "height": 0.7,
-                    "weight": 6.9,
-                    "research_queries": []
-                }
+        def research_side_effect(pokemon_names, _):
+            bulbasaur_research = {
+                "name": "bulbasaur",
+                "pokemon_details": ["Bulbasaur is a Grass/Poison-type Pokémon."],
+                "base_stats": {"hp": 45},
+                "types": ["grass", "poison"],
+                "abilities": ["overgrow"],
+                "height": 0.7,
+                "weight": 6.9,
+                "research_queries": []
+            }
+            return {
+                pokemon_name: {"error": "Failed to fetch data for nonexistent_pokemon"}
+                if pokemon_name.lower() == "nonexistent_pokemon" else bulbasaur_research
+                for pokemon_name in pokemon_names
+            }
         
         mock_research.side_effect = research_side_effect
         
@@ -328,7 +379,61 @@ class TestPokemonRouter:
         assert "Failed to fetch data for nonexistent_pokemon" in response_data["detail"]
         
         # Verify mock was called with nonexistent_pokemon
-        mock_research.assert_any_call("nonexistent_pokemon", mock_llm)
+        mock_research.assert_called_once_with(["nonexistent_pokemon", "Bulbasaur"], mock_llm)
+    
+    @patch('app.api.routers.pokemon.cached_battle')
+    @patch('app.api.routers.pokemon.cached_research_batch')
+    def test_battle_endpoint_analysis_error(self, mock_research, mock_battle, test_client):
+        """Test that a failed battle analysis is reported as a bad gateway error."""
+        research = {
+            "name": "bulbasaur",
+            "pokemon_details": [],
+            "research_queries": [],
+            "base_stats": {"hp": 45, "attack": 49, "defense": 49, "special_attack": 65, "special_defense": 65, "speed": 45},
+            "types": ["grass", "poison"],
+            "abilities": ["overgrow"],
+            "height": 0.7,
+            "weight": 6.9
+        }
+        mock_research.return_value = [research, research]
+        mock_battle.return_value = {"error": "Failed to analyze the battle"}
+        
+        response = test_client.get(
+            f"{settings.API_V1_STR}/pokemon/battle?pokemon1=Bulbasaur&pokemon2=Ivysaur"
+        )
+        
+        assert response.status_code == status.HTTP_502_BAD_GATEWAY
+        assert response.json()["detail"] == "Failed to analyze the battle"
+    
+    @patch('app.api.routers.pokemon.cached_battle')
+    @patch('app.api.routers.pokemon.cached_research_batch')
+    def test_battle_endpoint_incomplete_research(self, mock_research, mock_battle, test_client):
+        """Test that research with an incomplete stat block is reported instead of failing with a 500."""
+        research = {
+            "name": "bulbasaur",
+            "pokemon_details": [],
+            "research_queries": [],
+            "base_stats": {},
+            "types": ["grass", "poison"],
+            "abilities": ["overgrow"],
+            "height": 0.7,
+            "weight": 6.9
+        }
+        mock_research.return_value = [research, research]
+        mock_battle.return_value = {
+            "pokemon_1": "Bulbasaur",
+            "pokemon_2": "Ivysaur",
+            "analysis": "Analysis",
+            "reasoning": "Reasoning",
+            "winner": "Ivysaur"
+        }
+        
+        response = test_client.get(
+            f"{settings.API_V1_STR}/pokemon/battle?pokemon1=Bulbasaur&pokemon2=Ivysaur"
+        )
+        
+        assert response.status_code == status.HTTP_502_BAD_GATEWAY
+        assert "pokemon1.base_stats.hp" in response.json()["detail"]
     
     def test_chat_invalid_request(self, test_client):
         """Test the chat endpoint with an invalid request."""
@@ -341,6 +446,37 @@ class TestPokemonRouter:
         # Assertions
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         
+    @patch('app.api.routers.pokemon.process_query')
+    def test_chat_supervisor_error(self, mock_process_query, test_client):
+        """Test that a supervisor error dict is returned in the response instead of failing validation."""
+        with patch('app.api.routers.pokemon.use_langgraph', False):
+            mock_process_query.return_value = {"error": "Failed to process query"}
+            
+            response = test_client.post(
+                f"{settings.API_V1_STR}/pokemon/chat",
+                json={"message": "Test message"}
+            )
+            
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == {"response": {"supervisor_result": {"error": "Failed to process query"}}}
+    
+    @patch('app.api.routers.pokemon.process_query')
+    def test_chat_incomplete_supervisor_result(self, mock_process_query, test_client):
+        """Test that a supervisor result that fails validation is reported as a bad gateway."""
+        with patch('app.api.routers.pokemon.use_langgraph', False):
+            mock_process_query.return_value = {
+                "reflection": {"reasoning": "Some reasoning"},
+                "is_pokemon_query": False
+            }
+            
+            response = test_client.post(
+                f"{settings.API_V1_STR}/pokemon/chat",
+                json={"message": "Test message"}
+            )
+            
+            assert response.status_code == status.HTTP_502_BAD_GATEWAY
+            assert "supervisor_result.answer" in response.json()["detail"]
+    
     @patch('app.api.routers.pokemon.process_query')
     def test_chat_internal_error(self, mock_process_query, test_client):
         """Test the chat endpoint when an internal error occurs."""
@@ -363,5 +499,235 @@ class TestPokemonRouter:
             
             # Verify mock was called correctly
             mock_process_query.assert_called_once()
-
-
+    
+    @patch('app.api.routers.pokemon.process_query')
+    @patch('app.services.pokemon.cache.research_pokemon')
+    def test_chat_pokemon_query_event_stream(self, mock_research, mock_process_query, test_client, research_pikachu_result):
+        """Test the chat endpoint streams research progress before the Pokemon data."""
+        with patch('app.api.routers.pokemon.use_langgraph', False):
+            mock_process_query.return_value = {
+                "answer": "Let me research Pikachu for you.",
+                "reflection": {"reasoning": "This is a Pokemon query about Pikachu."},
+                "is_pokemon_query": True,
+                "pokemon_names": ["pikachu"]
+            }
+            mock_research.return_value = research_pikachu_result
+            
+            response = test_client.post(
+                f"{settings.API_V1_STR}/pokemon/chat",
+                json={"message": "Tell me about Pikachu"},
+                headers={"Accept": "text/event-stream"}
+            )
+            
+            assert response.status_code == status.HTTP_200_OK
+            assert response.text.startswith(
+                'event: progress\ndata: {"stage":"supervisor"}\n\n'
+                'event: progress\ndata: {"stage":"researching","pokemon":["pikachu"]}\n\n'
+                'event: result\n'
+            )
+            assert response.text.endswith('event: done\ndata: {}\n\n')
+    
+    @patch('app.api.routers.pokemon.add_to_auto_dataset')
+    @patch('app.api.routers.pokemon.cached_research_batch')
+    @patch('app.api.routers.pokemon.run_with_langsmith')
+    @patch('app.api.routers.pokemon.create_langsmith_agent')
+    def test_battle_langgraph(self, mock_agent, mock_run, mock_research, mock_add_to_dataset, test_client):
+        """Test that a LangGraph battle is returned as a battle response, not the raw graph state."""
+        from langchain_core.messages import AIMessage
+        
+        def research(name, hp):
+            return {
+                "name": name,
+                "pokemon_details": [],
+                "research_queries": [],
+                "base_stats": {"hp": hp, "attack": 50, "defense": 50, "special_attack": 50, "special_defense": 50, "speed": 50},
+                "types": ["normal"],
+                "abilities": [],
+                "height": 1.0,
+                "weight": 10.0
+            }
+        
+        mock_run.return_value = {
+            "messages": [AIMessage(content="Snorlax wins.")],
+            "pokemon_research_data": {"Snorlax": research("snorlax", 160), "Eevee": research("eevee", 55)},
+            "battle_analysis_result": {
+                "pokemon_1": "Snorlax",
+                "pokemon_2": "Eevee",
+                "analysis": "Analysis",
+                "reasoning": "Reasoning",
+                "winner": "Snorlax"
+            }
+        }
+        
+        response = test_client.get(f"{settings.API_V1_STR}/pokemon/battle?pokemon1=Snorlax&pokemon2=Eevee")
+        
+        assert response.status_code == status.HTTP_200_OK
+        response_data = response.json()
+        assert set(response_data) == {"pokemon1", "pokemon2", "battle_analysis"}
+        assert response_data["pokemon1"]["base_stats"]["hp"] == 160
+        assert response_data["battle_analysis"]["winner"] == "Snorlax"
+        mock_research.assert_not_called()
+    
+    @patch('app.api.routers.pokemon.add_to_auto_dataset')
+    @patch('app.api.routers.pokemon.execute_tools')
+    @patch('app.api.routers.pokemon.process_search_results')
+    @patch('app.api.routers.pokemon.run_with_langsmith')
+    @patch('app.api.routers.pokemon.create_langsmith_agent')
+    def test_chat_langgraph_search_single_pass(
+        self, mock_agent, mock_run, mock_process_search, mock_execute_tools, mock_add_to_dataset, test_client
+    ):
+        """Test that a LangGraph search answer is returned without a second search pass."""
+        from langchain_core.messages import AIMessage
+        
+        langsmith_settings = settings.model_copy(update={"LANGSMITH_API_KEY": "test-key"})
+        with patch('app.api.routers.pokemon.use_langgraph', True), \
+             patch('app.api.routers.pokemon.settings', langsmith_settings):
+            mock_run.return_value = {
+                "messages": [AIMessage(content="Searching for the weather.")],
+                "pokemon_research_data": {},
+                "battle_analysis_result": None,
+                "search_results": {"weather": [{"url": "https://example.com", "content": "Sunny"}]}
+            }
+            mock_process_search.return_value = {"answer": "It is sunny.", "sources": []}
+            
+            response = test_client.post(
+                f"{settings.API_V1_STR}/pokemon/chat",
+                json={"message": "What is the weather?"}
+            )
+            
+            assert response.status_code == status.HTTP_200_OK
+            response_data = response.json()["response"]
+            assert response_data["supervisor_result"]["needs_search"] is True
+            assert response_data["final_answer"]["answer"] == "It is sunny."
+            mock_process_search.assert_called_once()
+            mock_execute_tools.assert_not_called()
+            
+            # Dataset logging runs as a background task instead of inside the agent run
+            assert mock_run.call_args.kwargs["auto_create_dataset"] is False
+            mock_add_to_dataset.assert_called_once_with("What is the weather?", mock_run.return_value)
+    
+    @patch('app.api.routers.pokemon.add_to_auto_dataset')
+    def test_auto_dataset_skipped_without_langsmith_key(self, mock_add_to_dataset):
+        """Test that no dataset task is scheduled when LangSmith is not configured."""
+        background_tasks = BackgroundTasks()
+        no_langsmith_settings = settings.model_copy(update={"LANGSMITH_API_KEY": ""})
+        
+        with patch('app.api.routers.pokemon.settings', no_langsmith_settings):
+            _schedule_auto_dataset(background_tasks, "What is the weather?", {"messages": []})
+        
+        assert background_tasks.tasks == []
+    
+    @patch('app.api.routers.pokemon.process_query')
+    def test_chat_served_from_cache(self, mock_process_query, test_client):
+        """Test that a repeated question is answered from the chat cache."""
+        chat_cache = SemanticCache()
+        test_client.app.dependency_overrides[get_chat_cache] = lambda: chat_cache
+        
+        with patch('app.api.routers.pokemon.use_langgraph', False):
+            mock_process_query.return_value = {
+                "answer": "This is a general answer.",
+                "reflection": {"reasoning": "Some reasoning"},
+                "is_pokemon_query": False
+            }
+            
+            first = test_client.post(f"{settings.API_V1_STR}/pokemon/chat", json={"message": "Who made Pokemon?"})
+            second = test_client.post(f"{settings.API_V1_STR}/pokemon/chat", json={"message": "who made pokemon? "})
+            
+            assert first.status_code == second.status_code == status.HTTP_200_OK
+            assert second.json() == first.json()
+            mock_process_query.assert_called_once()
+    
+    @patch('app.api.routers.pokemon.cached_research_batch')
+    @patch('app.api.routers.pokemon.process_query')
+    def test_chat_cache_never_shares_pokemon_results(self, mock_process_query, mock_research, test_client):
+        """Test that near-identical questions about different Pokemon never share a cached answer."""
+        # Every message embeds to the same vector, so any semantic entry would match
+        embeddings = MagicMock()
+        embeddings.embed_query.return_value = [1.0, 0.0]
+        chat_cache = SemanticCache(embeddings=embeddings, threshold=0.9)
+        test_client.app.dependency_overrides[get_chat_cache] = lambda: chat_cache
+        
+        def research(names, llm):
+            return [{"name": name, "types": ["electric"]} for name in names]
+        
+        mock_research.side_effect = research
+        
+        with patch('app.api.routers.pokemon.use_langgraph', False):
+            for name in ("pikachu", "raichu"):
+                mock_process_query.return_value = {
+                    "answer": f"Let me research {name} for you.",
+                    "reflection": {"reasoning": f"This is a Pokemon query about {name}."},
+                    "is_pokemon_query": True,
+                    "pokemon_names": [name]
+                }
+                
+                response = test_client.post(
+                    f"{settings.API_V1_STR}/pokemon/chat", json={"message": f"Tell me about {name}"}
+                )
+                
+                assert response.status_code == status.HTTP_200_OK
+                assert list(response.json()) == [name.capitalize()]
+        
+        assert mock_process_query.call_count == 2
+    
+    @patch('app.api.routers.pokemon.stream_search_results')
+    @patch('app.api.routers.pokemon.execute_tools')
+    @patch('app.api.routers.pokemon.process_query')
+    def test_chat_search_query_event_stream(self, mock_process_query, mock_execute_tools, mock_stream, test_client):
+        """Test the chat endpoint streams progress and search answer tokens as server-sent events."""
+        with patch('app.api.routers.pokemon.use_langgraph', False):
+            mock_process_query.return_value = {
+                "answer": "",
+                "reflection": {"reasoning": "Needs current information"},
+                "is_pokemon_query": False,
+                "needs_search": True
+            }
+            search_data = {"weather": [{"url": "https://example.com", "content": "Sunny"}]}
+            mock_execute_tools.return_value = [MagicMock(artifact=search_data)]
+            
+            async def fake_stream(query, data, llm):
+                yield {"event": "token", "data": {"content": "Sun"}}
+                yield {"event": "token", "data": {"content": "ny"}}
+                yield {"event": "final_answer", "data": {"answer": "Sunny", "sources": []}}
+            
+            mock_stream.side_effect = fake_stream
+            
+            response = test_client.post(
+                f"{settings.API_V1_STR}/pokemon/chat",
+                json={"message": "What is the weather?"},
+                headers={"Accept": "text/event-stream"}
+            )
+            
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = [
+                (event.split("\n")[0], orjson.loads(event.split("\n")[1][len("data: "):]))
+                for event in response.text.strip().split("\n\n")
+            ]
+            assert events[:4] == [
+                ("event: progress", {"stage": "supervisor"}),
+                ("event: progress", {"stage": "searching"}),
+                ("event: token", {"content": "Sun"}),
+                ("event: token", {"content": "ny"})
+            ]
+            assert events[4][0] == "event: result"
+            assert events[4][1]["response"]["final_answer"] == {"answer": "Sunny", "sources": []}
+            assert events[5] == ("event: done", {})
+            assert mock_stream.call_args.args[1] == search_data
+    
+    def test_parse_search_data(self):
+        """Test parsing of the different search tool response formats."""
+        # Plain JSON
+        assert _loose_parse('[{"url": "https://example.com"}]') == [{"url": "https://example.com"}]
+        
+        # Python literal with single quotes
+        assert _loose_parse("[{'url': 'https://example.com'}]") == [{"url": "https://example.com"}]
+        
+        # Python literal with an apostrophe inside a string
+        assert _loose_parse("[{'content': \"Pikachu's tail\"}]") == [{"content": "Pikachu's tail"}]
+        
+        # Unparseable input is rejected, and the router keeps the raw text
+        with pytest.raises(ValueError):
+            _loose_parse("no results")
+        with pytest.raises(ValueError):
+            _loose_parse('Results: {"results": [1, 2]} done')
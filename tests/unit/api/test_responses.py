@@ -0,0 +1,63 @@
+"""
+Tests for the API response classes.
+
+This module contains tests for MessagePack rendering and content negotiation.
+"""
+
+import ormsgpack
+from fastapi.responses import ORJSONResponse
+from starlette.requests import Request
+
+from app.api.responses import (
+    MSGPACK_MEDIA_TYPE,
+    MsgPackResponse,
+    accepts_msgpack,
+    etag_matches,
+    negotiated_response
+)
+
+def _make_request(accept: str, if_none_match: str = None) -> Request:
+    """Build a bare request with the given Accept and If-None-Match headers."""
+    headers = [(b"accept", accept.encode("latin-1"))]
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode("latin-1")))
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": headers
+    })
+
+class TestResponses:
+    """Tests for the API response classes."""
+
+    def test_msgpack_response_render(self):
+        """Test MsgPackResponse encodes its content as MessagePack."""
+        content = {"name": "pikachu", "base_stats": {"hp": 35}}
+        response = MsgPackResponse(content=content)
+
+        assert response.media_type == MSGPACK_MEDIA_TYPE
+        assert ormsgpack.unpackb(response.body) == content
+
+    def test_negotiated_response(self):
+        """Test negotiated_response honors the Accept header and defaults to JSON."""
+        content = {"winner": "bulbasaur"}
+
+        msgpack_request = _make_request(MSGPACK_MEDIA_TYPE)
+        assert accepts_msgpack(msgpack_request)
+        assert isinstance(negotiated_response(msgpack_request, content), MsgPackResponse)
+
+        json_request = _make_request("text/html,application/json")
+        assert not accepts_msgpack(json_request)
+        assert isinstance(negotiated_response(json_request, content), ORJSONResponse)
+
+    def test_etag_matches(self):
+        """Test weak comparison, tag lists and the wildcard in If-None-Match."""
+        etag = '"abc"'
+
+        assert etag_matches(_make_request("*/*", '"abc"'), etag)
+        assert etag_matches(_make_request("*/*", 'W/"abc"'), etag)
+        assert etag_matches(_make_request("*/*", '"xyz", W/"abc"'), etag)
+        assert etag_matches(_make_request("*/*", "*"), etag)
+        assert not etag_matches(_make_request("*/*", '"xyz"'), etag)
+        assert not etag_matches(_make_request("*/*"), etag)
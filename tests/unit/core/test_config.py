@@ -0,0 +1,44 @@
+"""
+Tests for the application settings.
+
+This module contains tests for reading settings from the environment.
+"""
+
+import pytest
+
+from app.core.config import Settings
+
+@pytest.fixture
+def clean_langchain_env(monkeypatch):
+    """Remove LangChain and LangSmith variables so each test sets its own."""
+    for key in (
+        "LANGCHAIN_TRACING_V2", "LANGCHAIN_ENDPOINT", "LANGCHAIN_PROJECT",
+        "LANGSMITH_TRACING", "LANGSMITH_ENDPOINT", "LANGSMITH_PROJECT"
+    ):
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+class TestSettings:
+    """Tests for the application settings."""
+    
+    def test_langchain_settings_default_to_langsmith(self, clean_langchain_env):
+        """Test that unset LangChain settings follow the LangSmith settings."""
+        clean_langchain_env.setenv("LANGSMITH_TRACING", "false")
+        clean_langchain_env.setenv("LANGSMITH_PROJECT", "test-project")
+        
+        settings = Settings(_env_file=None)
+        
+        assert settings.LANGCHAIN_TRACING_V2 is False
+        assert settings.LANGCHAIN_PROJECT == "test-project"
+        assert settings.LANGCHAIN_ENDPOINT == settings.LANGSMITH_ENDPOINT
+    
+    def test_langchain_settings_read_from_env(self, clean_langchain_env):
+        """Test that LangChain settings set in the environment are not overridden."""
+        clean_langchain_env.setenv("LANGSMITH_PROJECT", "test-project")
+        clean_langchain_env.setenv("LANGCHAIN_PROJECT", "legacy-project")
+        clean_langchain_env.setenv("LANGCHAIN_ENDPOINT", "https://example.com")
+        
+        settings = Settings(_env_file=None)
+        
+        assert settings.LANGCHAIN_PROJECT == "legacy-project"
+        assert settings.LANGCHAIN_ENDPOINT == "https://example.com"
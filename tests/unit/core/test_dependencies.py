@@ -0,0 +1,69 @@
+"""
+Tests for the FastAPI dependencies.
+
+This module contains tests for the shared client dependencies.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.config import settings
+from app.core.dependencies import create_llm, create_supervisor_cache, get_llm, get_search_wrapper, get_tool_executor
+
+class TestDependencies:
+    """Tests for the shared client dependencies."""
+
+    def test_lifespan_creates_shared_clients(self):
+        """Test that startup stores a single LLM, search wrapper and tool executor on app.state."""
+        llm = MagicMock()
+        search_wrapper = MagicMock()
+
+        with patch('app.main.create_llm', return_value=llm), \
+             patch('app.main.create_search_wrapper', return_value=search_wrapper), \
+             TestClient(app):
+            request = MagicMock()
+            request.app = app
+
+            assert get_llm(request) is llm
+            assert get_search_wrapper(request) is search_wrapper
+            assert get_tool_executor(request, search_wrapper) is app.state.tool_executor
+
+    @patch('app.core.dependencies.create_llm')
+    def test_get_llm_without_startup(self, mock_create_llm):
+        """Test that get_llm creates a client when none was created at startup."""
+        request = MagicMock()
+        request.app.state = MagicMock(spec=[])
+
+        assert get_llm(request) is mock_create_llm.return_value
+        mock_create_llm.assert_called_once()
+
+    def test_create_llm_singleton(self):
+        """Test that the language model is created once per process."""
+        create_llm.cache_clear()
+        try:
+            assert create_llm() is create_llm()
+        finally:
+            create_llm.cache_clear()
+    
+    def test_supervisor_cache_exact_only(self):
+        """Test that the supervisor cache never matches near-duplicate queries by embedding."""
+        semantic_settings = settings.model_copy(update={"CHAT_CACHE_SEMANTIC": True})
+        with patch('app.core.dependencies.settings', semantic_settings):
+            cache = create_supervisor_cache()
+        
+        assert cache.embeddings is None
+    
+    def test_shutdown_closes_llm_clients(self):
+        """Test that shutdown closes the language model's pooled HTTP clients."""
+        create_llm.cache_clear()
+        try:
+            with TestClient(app):
+                llm = create_llm()
+            
+            assert llm.http_client.is_closed
+            assert llm.http_async_client.is_closed
+            assert create_llm.cache_info().currsize == 0
+        finally:
+            create_llm.cache_clear()
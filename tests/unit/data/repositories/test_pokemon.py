@@ -7,13 +7,34 @@ This module contains tests for the Pokemon repository functions.
 import pytest
 from unittest.mock import patch, MagicMock
 
-from app.data.repositories.pokemon import fetch_pokemon_data
+from app.data.repositories.pokemon import fetch_pokemon_data, clear_pokemon_cache, close_cache_db
+
+PIKACHU_API_RESPONSE = {
+    "name": "pikachu",
+    "stats": [{"base_stat": stat} for stat in (35, 55, 40, 50, 50, 90)],
+    "types": [{"type": {"name": "electric"}}],
+    "abilities": [
+        {"ability": {"name": "static"}},
+        {"ability": {"name": "lightning-rod"}}
+    ],
+    "height": 4,
+    "weight": 60,
+    "sprites": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png"}
+}
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish each test with an empty Pokemon data cache."""
+    clear_pokemon_cache()
+    yield
+    clear_pokemon_cache()
+    close_cache_db()
 
 class TestPokemonRepository:
     """Tests for the Pokemon repository."""
     
-    @patch('app.data.repositories.pokemon.requests.get')
-    def test_fetch_pokemon_data_success(self, mock_get, pokemon_pikachu_data):
+    @patch('app.data.repositories.pokemon.get_http_client')
+    def test_fetch_pokemon_data_success(self, mock_client, pokemon_pikachu_data):
         """Test successful fetch of Pokemon data."""
         # Setup mock response
         mock_response = MagicMock()
@@ -37,6 +58,7 @@ class TestPokemonRepository:
             "sprites": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png"}
         }
         mock_response.raise_for_status.return_value = None
+        mock_get = mock_client.return_value.get
         mock_get.return_value = mock_response
         
         # Call the function
@@ -46,13 +68,14 @@ class TestPokemonRepository:
         assert result == pokemon_pikachu_data
         mock_get.assert_called_once()
         
-    @patch('app.data.repositories.pokemon.requests.get')
-    def test_fetch_pokemon_data_http_error(self, mock_get):
+    @patch('app.data.repositories.pokemon.get_http_client')
+    def test_fetch_pokemon_data_http_error(self, mock_client):
         """Test HTTP error when fetching Pokemon data."""
         # Setup mock response
-        from requests.exceptions import HTTPError
+        from httpx import HTTPError
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = HTTPError("404 Client Error: Not Found")
+        mock_get = mock_client.return_value.get
         mock_get.return_value = mock_response
         
         # Call the function
@@ -63,13 +86,14 @@ class TestPokemonRepository:
         assert "Failed to fetch data for nonexistent_pokemon" in result["error"]
         mock_get.assert_called_once()
         
-    @patch('app.data.repositories.pokemon.requests.get')
-    def test_fetch_pokemon_data_key_error(self, mock_get):
+    @patch('app.data.repositories.pokemon.get_http_client')
+    def test_fetch_pokemon_data_key_error(self, mock_client):
         """Test key error when processing Pokemon data."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.json.return_value = {"incomplete": "data"}  # Missing required keys
         mock_response.raise_for_status.return_value = None
+        mock_get = mock_client.return_value.get
         mock_get.return_value = mock_response
         
         # Call the function
@@ -80,8 +104,8 @@ class TestPokemonRepository:
         assert "Failed to process data for pikachu" in result["error"]
         mock_get.assert_called_once()
         
-    @patch('app.data.repositories.pokemon.requests.get')
-    def test_fetch_pokemon_data_name_normalization(self, mock_get):
+    @patch('app.data.repositories.pokemon.get_http_client')
+    def test_fetch_pokemon_data_name_normalization(self, mock_client):
         """Test that Pokemon names are normalized before API call."""
         # Setup mock response
         mock_response = MagicMock()
@@ -105,6 +129,7 @@ class TestPokemonRepository:
             "sprites": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png"}
         }
         mock_response.raise_for_status.return_value = None
+        mock_get = mock_client.return_value.get
         mock_get.return_value = mock_response
         
         # Call the function with mixed case and spaces
@@ -112,3 +137,72 @@ class TestPokemonRepository:
         
         # Assertions
         mock_get.assert_called_once_with(f"{pytest.importorskip('app.core.config').settings.POKEMON_API_BASE_URL}/pikachu")
+        
+    def test_get_http_client_reused(self):
+        """Test that the shared HTTP client is reused until it is closed."""
+        from app.data.repositories.pokemon import get_http_client, close_http_client
+        
+        client = get_http_client()
+        assert get_http_client() is client
+        
+        close_http_client()
+        assert client.is_closed
+        assert get_http_client() is not client
+        
+    @patch('app.data.repositories.pokemon.get_http_client')
+    def test_fetch_pokemon_data_cached(self, mock_client, pokemon_pikachu_data):
+        """Test that repeat fetches with different casing skip the API."""
+        mock_get = mock_client.return_value.get
+        mock_get.return_value.json.return_value = PIKACHU_API_RESPONSE
+        
+        assert fetch_pokemon_data("pikachu") == pokemon_pikachu_data
+        assert fetch_pokemon_data(" Pikachu ") == pokemon_pikachu_data
+        mock_get.assert_called_once()
+        
+    @patch('app.data.repositories.pokemon.get_http_client')
+    def test_fetch_pokemon_data_errors_not_cached(self, mock_client):
+        """Test that failed fetches are retried on the next call."""
+        from httpx import HTTPError
+        mock_get = mock_client.return_value.get
+        mock_get.return_value.raise_for_status.side_effect = HTTPError("503 Service Unavailable")
+        
+        fetch_pokemon_data("pikachu")
+        fetch_pokemon_data("pikachu")
+        
+        assert mock_get.call_count == 2
+        
+    @patch('app.data.repositories.pokemon.get_http_client')
+    def test_fetch_pokemon_data_persisted(self, mock_client, tmp_path, pokemon_pikachu_data):
+        """Test that fetched data survives a cleared in-memory cache when persistence is enabled."""
+        mock_get = mock_client.return_value.get
+        mock_get.return_value.json.return_value = PIKACHU_API_RESPONSE
+        
+        from app.core.config import settings
+        persistent_settings = settings.model_copy(update={"POKEMON_CACHE_PATH": str(tmp_path / "pokemon.sqlite3")})
+        
+        with patch('app.data.repositories.pokemon.settings', persistent_settings):
+            fetch_pokemon_data("pikachu")
+            clear_pokemon_cache()
+            
+            assert fetch_pokemon_data("pikachu") == pokemon_pikachu_data
+            mock_get.assert_called_once()
+    
+    @patch('app.data.repositories.pokemon.sqlite3.connect')
+    @patch('app.data.repositories.pokemon.get_http_client')
+    def test_persistent_cache_connection_reused(self, mock_client, mock_connect, tmp_path):
+        """Test that the persistent cache opens one connection and creates its table once."""
+        mock_get = mock_client.return_value.get
+        mock_get.return_value.json.return_value = PIKACHU_API_RESPONSE
+        mock_connect.return_value.execute.return_value.fetchone.return_value = None
+        
+        from app.core.config import settings
+        persistent_settings = settings.model_copy(update={"POKEMON_CACHE_PATH": str(tmp_path / "pokemon.sqlite3")})
+        
+        with patch('app.data.repositories.pokemon.settings', persistent_settings):
+            fetch_pokemon_data("pikachu")
+            clear_pokemon_cache()
+            fetch_pokemon_data("pikachu")
+        
+        mock_connect.assert_called_once_with(persistent_settings.POKEMON_CACHE_PATH, check_same_thread=False)
+        statements = [call.args[0] for call in mock_connect.return_value.execute.call_args_list]
+        assert sum(statement.startswith("CREATE TABLE") for statement in statements) == 1
@@ -0,0 +1,27 @@
+"""
+Tests for the agent schemas.
+
+This module contains tests for the constraints on the agent schemas.
+"""
+
+from app.data.schemas.pokemon import SupervisorAgent
+
+class TestSupervisorAgent:
+    """Tests for the supervisor agent schema."""
+
+    def test_pokemon_names_limited_in_schema(self):
+        """Test that the two-name limit is part of the schema sent to the model."""
+        schema = SupervisorAgent.model_json_schema()
+
+        assert schema["properties"]["pokemon_names"]["anyOf"][0]["maxItems"] == 2
+
+    def test_pokemon_names_truncated(self):
+        """Test that extra names are dropped instead of rejecting the answer."""
+        result = SupervisorAgent.model_validate({
+            "answer": "Let me compare them.",
+            "reflection": {"reasoning": "A battle query.", "answer": "Research them."},
+            "is_pokemon_query": True,
+            "pokemon_names": ["pikachu", "bulbasaur", "charmander"]
+        })
+
+        assert result.pokemon_names == ["pikachu", "bulbasaur"]
@@ -0,0 +1,40 @@
+"""
+Tests for the agent prompt templates.
+
+This module contains tests for the prompt templates used by the agents.
+"""
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from app.services.agents.prompts import supervisor_prompt_template, researcher_agent_template, expert_agent_template
+
+class TestPrompts:
+    """Tests for the agent prompt templates."""
+    
+    def test_supervisor_prompt_static_prefix(self):
+        """Test that the supervisor instructions do not change between requests."""
+        first = supervisor_prompt_template.format_messages(
+            messages=[HumanMessage(content="Who is Pikachu?")], time="2024-01-01 00:00:00"
+        )
+        second = supervisor_prompt_template.format_messages(
+            messages=[HumanMessage(content="What is the weather?")], time="2024-06-01 12:30:00"
+        )
+        
+        # The instructions come first and are identical; the time follows the messages
+        assert first[0].content == second[0].content
+        assert "{time}" not in first[0].content
+        assert first[1].content == "Who is Pikachu?"
+        assert first[2].content == "Current time: 2024-01-01 00:00:00"
+    
+    @pytest.mark.parametrize("template", [researcher_agent_template, expert_agent_template])
+    def test_agent_prompt_time_last(self, template):
+        """Test that the agent instructions lead and the current time trails the messages."""
+        messages = template.format_messages(
+            messages=[HumanMessage(content="Analyze Pikachu")], time="2024-01-01 00:00:00"
+        )
+        
+        assert "{time}" not in messages[0].content
+        assert "2024-01-01" not in messages[0].content
+        assert messages[1].content == "Analyze Pikachu"
+        assert messages[-1].content == "Current time: 2024-01-01 00:00:00"
@@ -0,0 +1,110 @@
+"""
+Tests for the supervisor agent service.
+
+This module contains tests for the supervisor agent chain.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.data.schemas.pokemon import SupervisorAgent, Reflection
+from app.services.agents.prompts import SUPERVISOR_PROMPT_CACHE
+from app.services.agents.supervisor import (
+    supervisor_chain, process_query, extract_pokemon_names, _loose_parse, _prepare_search_answer, MAX_SEARCH_RESULTS
+)
+from app.utils.helpers.semantic_cache import SemanticCache
+
+class TestSupervisor:
+    """Tests for the supervisor agent service."""
+    
+    def test_supervisor_chain_built_once_per_llm(self):
+        """Test that the chain is compiled once per language model and reused."""
+        llm = MagicMock()
+        other_llm = MagicMock()
+        
+        chain = supervisor_chain(llm)
+        
+        assert supervisor_chain(llm) is chain
+        assert supervisor_chain(other_llm) is not chain
+        llm.bind.assert_called_once()
+    
+    def test_supervisor_chain_sends_prompt_cache_key(self):
+        """Test that supervisor requests carry the agent's prompt cache key."""
+        llm = MagicMock()
+        
+        supervisor_chain(llm)
+        
+        assert llm.bind.call_args.kwargs["extra_body"] == SUPERVISOR_PROMPT_CACHE
+    
+    @patch('app.services.agents.supervisor.supervisor_chain')
+    def test_process_query_cached(self, mock_supervisor_chain):
+        """Test that a repeated query is answered from the cache without calling the model."""
+        mock_supervisor_chain.return_value.ainvoke = AsyncMock(return_value=[SupervisorAgent(
+            answer="Paris",
+            reflection=Reflection(reasoning="General knowledge", answer="Paris")
+        )])
+        cache = SemanticCache()
+        
+        first = asyncio.run(process_query("What is the capital of France?", MagicMock(), MagicMock(), cache))
+        second = asyncio.run(process_query("what is the capital of France?  ", MagicMock(), MagicMock(), cache))
+        
+        assert second == first
+        assert first["answer"] == "Paris"
+        mock_supervisor_chain.return_value.ainvoke.assert_awaited_once()
+    
+    def test_extract_pokemon_names(self):
+        """Test that capitalized words other than common words are extracted in order."""
+        assert extract_pokemon_names("Who wins, Pikachu or Bulbasaur? The Pikachu!") == ["Pikachu", "Bulbasaur", "Pikachu"]
+        assert extract_pokemon_names("what is the weather?") == []
+    
+    @pytest.mark.parametrize("text", [
+        '{"query": [{"url": "https://example.com", "content": "Sunny"}]}',
+        "{'query': [{'url': 'https://example.com', 'content': 'Sunny'}]}",
+        "{'query': [{'url': \"https://example.com\", 'content': \"Sunny\", \"live\": true}]}"
+    ])
+    def test_loose_parse(self, text):
+        """Test that JSON, Python literals and single-quoted keys are all parsed."""
+        parsed = _loose_parse(text)
+        
+        assert parsed["query"][0]["url"] == "https://example.com"
+        assert parsed["query"][0]["content"] == "Sunny"
+    
+    def test_loose_parse_invalid(self):
+        """Test that unparseable text raises a ValueError."""
+        with pytest.raises(ValueError):
+            _loose_parse("not a payload")
+    
+    def test_prepare_search_answer_formats_weather(self):
+        """Test that weather payloads in search results are formatted as readable lines."""
+        weather = (
+            '{"location": {"name": "Beijing", "country": "China"}, "current": {"temp_c": 20, "temp_f": 68, '
+            '"condition": {"text": "Sunny"}, "wind_kph": 5, "wind_dir": "N", "humidity": 40, "last_updated": "2024-01-01 12:00"}}'
+        )
+        search_results = {"weather in Beijing": [{"url": "https://weather.example.com/beijing", "content": weather}]}
+        
+        prepared = _prepare_search_answer("Weather in Beijing?", search_results)
+        
+        assert prepared["sources"][0]["title"] == "weather.example.com"
+        assert prepared["sources"][0]["snippet"] == (
+            "Location: Beijing, China\n"
+            "Temperature: 20°C / 68°F\n"
+            "Condition: Sunny\n"
+            "Wind: 5 km/h N\n"
+            "Humidity: 40%\n"
+            "Last Updated: 2024-01-01 12:00\n"
+        )
+    
+    def test_prepare_search_answer_caps_results(self):
+        """Test that only the first results are formatted and returned as sources."""
+        search_results = {
+            "first query": [{"url": f"https://example.com/{i}", "content": f"Result {i}"} for i in range(4)],
+            "second query": [{"url": f"https://example.org/{i}", "content": f"Result {i}"} for i in range(4)]
+        }
+        
+        prepared = _prepare_search_answer("Anything?", search_results)
+        
+        assert len(prepared["sources"]) == MAX_SEARCH_RESULTS
+        assert prepared["sources"][-1]["url"] == "https://example.org/0"
+        assert "https://example.org/1" not in prepared["messages"][0].content
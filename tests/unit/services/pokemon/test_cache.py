@@ -0,0 +1,117 @@
+"""
+Tests for the Pokemon research cache.
+
+This module contains tests for the cached research and battle wrappers.
+"""
+
+import threading
+import time
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from app.services.pokemon.cache import (
+    cached_research,
+    cached_research_batch,
+    cached_battle,
+    clear_research_cache,
+    clear_battle_cache
+)
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish each test with empty caches."""
+    clear_research_cache()
+    clear_battle_cache()
+    yield
+    clear_research_cache()
+    clear_battle_cache()
+
+class TestResearchCache:
+    """Tests for the Pokemon research cache."""
+
+    @patch('app.services.pokemon.cache.research_pokemon')
+    def test_cached_research_reuses_result(self, mock_research, mock_llm, research_pikachu_result):
+        """Test that repeat lookups with different casing hit the cache."""
+        mock_research.return_value = research_pikachu_result
+
+        first = cached_research("Pikachu", mock_llm)
+        second = cached_research(" pikachu ", mock_llm)
+
+        assert first == research_pikachu_result
+        assert second is first
+        mock_research.assert_called_once_with("Pikachu", mock_llm)
+
+    @patch('app.services.pokemon.cache.research_pokemon')
+    def test_cached_research_skips_errors(self, mock_research, mock_llm):
+        """Test that error results are not cached."""
+        mock_research.return_value = {"error": "Failed to fetch data for missingno"}
+
+        cached_research("missingno", mock_llm)
+        result = cached_research("missingno", mock_llm)
+
+        assert "error" in result
+        assert mock_research.call_count == 2
+
+    @patch('app.services.pokemon.cache.research_pokemon')
+    def test_cached_research_coalesces_concurrent_misses(self, mock_research, mock_llm, research_pikachu_result):
+        """Test that concurrent lookups of the same Pokemon run the research once."""
+        release = threading.Event()
+
+        def slow_research(pokemon_name, llm):
+            release.wait(timeout=5)
+            return research_pikachu_result
+
+        mock_research.side_effect = slow_research
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(cached_research, "pikachu", mock_llm) for _ in range(4)]
+            # Wait until the first lookup is running before letting it finish
+            while mock_research.call_count == 0:
+                time.sleep(0.01)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert all(result is results[0] for result in results)
+        mock_research.assert_called_once()
+
+    @patch('app.services.pokemon.cache.research_pokemon_batch')
+    @patch('app.services.pokemon.cache.research_pokemon')
+    def test_cached_research_batch_researches_misses_together(self, mock_research, mock_batch, mock_llm, research_pikachu_result):
+        """Test that cached Pokemon are reused and the misses are researched in one batch."""
+        mock_research.return_value = research_pikachu_result
+        cached_research("pikachu", mock_llm)
+
+        bulbasaur = {**research_pikachu_result, "name": "bulbasaur"}
+        charmander = {**research_pikachu_result, "name": "charmander"}
+        mock_batch.return_value = {"Bulbasaur": bulbasaur, "Charmander": charmander}
+
+        results = cached_research_batch(["Pikachu", "Bulbasaur", "Charmander"], mock_llm)
+
+        assert results == [research_pikachu_result, bulbasaur, charmander]
+        mock_batch.assert_called_once_with(["Bulbasaur", "Charmander"], mock_llm)
+
+        # Everything is cached now
+        assert cached_research_batch(["bulbasaur", "charmander"], mock_llm) == [bulbasaur, charmander]
+        mock_batch.assert_called_once()
+        mock_research.assert_called_once()
+
+    @patch('app.services.pokemon.cache.analyze_pokemon_battle')
+    def test_cached_battle_unordered_pair(self, mock_battle, mock_llm):
+        """Test that a matchup is analyzed once regardless of argument order."""
+        mock_battle.return_value = {
+            "pokemon_1": "Pikachu",
+            "pokemon_2": "Bulbasaur",
+            "analysis": "Analysis of the battle between Pikachu and Bulbasaur",
+            "reasoning": "Reasoning for the battle outcome",
+            "winner": "Bulbasaur"
+        }
+
+        first = cached_battle("Pikachu", "Bulbasaur", {}, mock_llm)
+        second = cached_battle("bulbasaur", "pikachu", {}, mock_llm)
+
+        mock_battle.assert_called_once()
+        assert first["winner"] == second["winner"] == "Bulbasaur"
+        assert second["pokemon_1"] == "Bulbasaur"
+        assert second["pokemon_2"] == "Pikachu"
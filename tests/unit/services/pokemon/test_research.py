@@ -7,8 +7,8 @@ This module contains tests for the Pokemon research service functions.
 import pytest
 from unittest.mock import patch, MagicMock
 
-from app.services.pokemon.research import research_pokemon, analyze_pokemon_battle
-from app.data.schemas.pokemon import ResearchPokemon, PokemonExpertAnalystAgent
+from app.services.pokemon.research import research_pokemon, research_pokemon_batch, analyze_pokemon_battle, _simplify, _apply_api_data
+from app.data.schemas.pokemon import ResearchPokemon, ResearchPokemonBatch, PokemonExpertAnalystAgent
 
 class TestPokemonResearch:
     """Tests for the Pokemon research service."""
@@ -64,6 +64,54 @@ class TestPokemonResearch:
         mock_fetch.assert_called_once_with("pikachu")
         mock_chain.invoke.assert_called_once()
         
+    @patch('app.services.pokemon.research.fetch_pokemon_data')
+    @patch('app.services.pokemon.research.researcher_agent_template')
+    def test_research_pokemon_batch(self, mock_template, mock_fetch, mock_llm, pokemon_pikachu_data, pokemon_bulbasaur_data):
+        """Test that several Pokemon are researched with a single chain call."""
+        mock_fetch.side_effect = lambda pokemon_name: {
+            "pikachu": pokemon_pikachu_data,
+            "bulbasaur": pokemon_bulbasaur_data
+        }.get(pokemon_name.lower(), {"error": f"Failed to fetch data for {pokemon_name}"})
+        
+        mock_chain = MagicMock()
+        mock_template.__or__.return_value = mock_chain
+        mock_chain.__or__.return_value = mock_chain
+        
+        # The agent returns the Pokemon in a different order than requested
+        mock_chain.invoke.return_value = [ResearchPokemonBatch(pokemon=[
+            ResearchPokemon(name="Bulbasaur", pokemon_details=["Grass starter"], research_queries=[]),
+            ResearchPokemon(name="Pikachu", pokemon_details=["Electric mouse"], research_queries=[])
+        ])]
+        
+        result = research_pokemon_batch(["Pikachu", "Bulbasaur", "missingno"], mock_llm)
+        
+        assert list(result) == ["Pikachu", "Bulbasaur", "missingno"]
+        assert result["Pikachu"]["pokemon_details"] == ["Electric mouse"]
+        assert result["Pikachu"]["base_stats"] == pokemon_pikachu_data["base_stats"]
+        assert result["Bulbasaur"]["types"] == pokemon_bulbasaur_data["types"]
+        assert "error" in result["missingno"]
+        mock_chain.invoke.assert_called_once()
+        
+    def test_simplify_normalizes_research(self, pokemon_pikachu_data):
+        """Test that research results take the lowercase API data and default missing fields."""
+        research = ResearchPokemon(
+            name="Pikachu",
+            pokemon_details=["Pikachu is an Electric-type Pokémon."],
+            research_queries=[],
+            types=["Electric"],
+            abilities=["Static", "Lightning-Rod"]
+        )
+        
+        assert _simplify(research)["base_stats"] == {}
+        
+        _apply_api_data(research, pokemon_pikachu_data)
+        result = _simplify(research)
+        
+        assert result["name"] == "pikachu"
+        assert result["types"] == ["electric"]
+        assert result["abilities"] == ["static", "lightning-rod"]
+        assert result["height"] == pokemon_pikachu_data["height"]
+        
     @patch('app.services.pokemon.research.fetch_pokemon_data')
     def test_research_pokemon_api_error(self, mock_fetch, mock_llm):
         """Test error handling when the Pokemon API returns an error."""
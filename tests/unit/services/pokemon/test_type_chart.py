@@ -0,0 +1,55 @@
+"""
+Tests for the Pokemon type chart.
+
+This module contains tests for the type effectiveness lookups and the battle heuristic.
+"""
+
+import pytest
+
+from app.services.pokemon.type_chart import EFFECTIVENESS, TYPES, type_multiplier, predict_battle
+
+def _research(types, total):
+    """Build minimal research results with the given types and base stat total."""
+    return {"types": types, "base_stats": {"hp": total}}
+
+class TestTypeChart:
+    """Tests for the Pokemon type chart."""
+
+    def test_chart_shape(self):
+        """Test that the chart covers every attacking and defending type."""
+        assert EFFECTIVENESS.shape == (len(TYPES), len(TYPES))
+
+    @pytest.mark.parametrize("attacker, defender, expected", [
+        (["water"], ["fire"], 2.0),
+        (["electric"], ["ground"], 0.0),
+        (["electric"], ["grass", "poison"], 0.5),
+        (["ice"], ["dragon", "flying"], 4.0),
+        (["grass", "poison"], ["electric"], 1.0),
+        (["Fire", "Flying"], ["grass", "bug"], 4.0),
+        (["unknown"], ["fire"], 1.0)
+    ])
+    def test_type_multiplier(self, attacker, defender, expected):
+        """Test that the attacker's most effective type is used."""
+        assert type_multiplier(attacker, defender) == expected
+
+    def test_predict_battle_clear_winner(self):
+        """Test that a clear type and stat advantage decides the battle."""
+        result = predict_battle({
+            "Squirtle": _research(["water"], 314),
+            "Charmander": _research(["fire"], 309)
+        })
+
+        assert result["winner"] == "Squirtle"
+        assert result["pokemon_1"] == "Squirtle"
+        assert result["pokemon_2"] == "Charmander"
+
+    def test_predict_battle_close_matchup(self):
+        """Test that close matchups are left to the expert agent."""
+        assert predict_battle({
+            "Pikachu": _research(["electric"], 320),
+            "Eevee": _research(["normal"], 325)
+        }) is None
+
+    def test_predict_battle_incomplete_data(self):
+        """Test that missing stats or types are left to the expert agent."""
+        assert predict_battle({"Pikachu": _research(["electric"], 320), "Eevee": {}}) is None
@@ -0,0 +1,29 @@
+"""
+Tests for the LangSmith integration.
+
+This module contains tests for the LangSmith run filters.
+"""
+
+from app.utils.helpers.langsmith_integration import _build_runs_filter
+
+class TestLangSmithIntegration:
+    """Tests for the LangSmith integration."""
+
+    def test_build_runs_filter_empty(self):
+        """Test that no filter is built without criteria."""
+        assert _build_runs_filter(None) is None
+        assert _build_runs_filter({}) is None
+
+    def test_build_runs_filter_endpoint(self):
+        """Test that the endpoint is matched against the run metadata."""
+        assert _build_runs_filter({"endpoint": "chat"}) == (
+            'and(eq(metadata_key, "endpoint"), eq(metadata_value, "chat"))'
+        )
+
+    def test_build_runs_filter_combined(self):
+        """Test that a Pokemon name matches either battle participant."""
+        runs_filter = _build_runs_filter({"endpoint": "battle", "pokemon_name": "pikachu"})
+
+        assert runs_filter.startswith('and(and(eq(metadata_key, "endpoint")')
+        assert 'or(and(eq(metadata_key, "pokemon1"), eq(metadata_value, "pikachu"))' in runs_filter
+        assert 'and(eq(metadata_key, "pokemon2"), eq(metadata_value, "pikachu"))' in runs_filter
@@ -0,0 +1,72 @@
+"""
+Tests for the semantic response cache.
+
+This module contains tests for the exact and semantic cache tiers.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from app.utils.helpers.semantic_cache import SemanticCache
+
+VECTORS = {
+    "who is pikachu?": [1.0, 0.0, 0.0],
+    "who is pikachu": [0.99, 0.1, 0.0],
+    "what is the weather?": [0.0, 1.0, 0.0],
+    "tell me about pikachu": [0.0, 0.0, 1.0],
+    "tell me about raichu": [0.0, 0.1, 0.99]
+}
+
+@pytest.fixture
+def mock_embeddings():
+    """
+    Create mock embeddings that map known messages to fixed vectors.
+    
+    Returns:
+        MagicMock: Mock embeddings with an embed_query method
+    """
+    embeddings = MagicMock()
+    embeddings.embed_query.side_effect = lambda message: VECTORS[message.lower()]
+    return embeddings
+
+class TestSemanticCache:
+    """Tests for the semantic response cache."""
+    
+    def test_exact_hit_normalizes_message(self):
+        """Test that messages differing only in case and whitespace share an entry."""
+        cache = SemanticCache()
+        cache.put("Who is Pikachu?", {"answer": "An electric mouse"})
+        
+        assert cache.get("  who is pikachu?  ") == {"answer": "An electric mouse"}
+        assert cache.get("Who is Bulbasaur?") is None
+    
+    def test_semantic_hit(self, mock_embeddings):
+        """Test that a near-duplicate message is served from the semantic tier."""
+        cache = SemanticCache(embeddings=mock_embeddings, threshold=0.9)
+        
+        assert cache.get("Who is Pikachu?") is None
+        cache.put("Who is Pikachu?", {"answer": "An electric mouse"})
+        
+        # The embedding computed on the miss is reused when storing
+        assert mock_embeddings.embed_query.call_count == 1
+        
+        assert cache.get("Who is Pikachu") == {"answer": "An electric mouse"}
+        assert cache.get("What is the weather?") is None
+    
+    def test_exact_only_entry(self, mock_embeddings):
+        """Test that an entry stored without the semantic tier only serves the same message."""
+        cache = SemanticCache(embeddings=mock_embeddings, threshold=0.9)
+        
+        assert cache.get("Tell me about Pikachu") is None
+        cache.put("Tell me about Pikachu", {"Pikachu": {"type": "electric"}}, semantic=False)
+        
+        assert cache.get("Tell me about Pikachu") == {"Pikachu": {"type": "electric"}}
+        assert cache.get("Tell me about Raichu") is None
+    
+    def test_clear(self, mock_embeddings):
+        """Test that clearing the cache removes both tiers."""
+        cache = SemanticCache(embeddings=mock_embeddings)
+        cache.put("Who is Pikachu?", {"answer": "An electric mouse"})
+        cache.clear()
+        
+        assert cache.get("Who is Pikachu?") is None
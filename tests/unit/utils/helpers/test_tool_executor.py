@@ -0,0 +1,45 @@
+"""
+Tests for the tool executor helpers.
+
+This module contains tests for executing search tools from the agent state.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.utils.helpers.tool_executor import execute_tools
+
+class TestToolExecutor:
+    """Tests for the tool executor helpers."""
+
+    def test_execute_tools_structured_result(self):
+        """Test that a structured supervisor result triggers a search and returns the raw output."""
+        search_output = [{"url": "https://example.com", "content": "Pikachu's tail"}]
+        tool_executor = MagicMock()
+        tool_executor.batch.return_value = [search_output]
+
+        state = [
+            HumanMessage(content="Latest Pokemon game?"),
+            AIMessage(content="", additional_kwargs={"structured": {"needs_search": True}})
+        ]
+        tool_messages = execute_tools(state, tool_executor)
+
+        tool_executor.batch.assert_called_once_with([{
+            "tool": "tavily_search_api_wrapper",
+            "tool_input": {"query": "Latest Pokemon game?"}
+        }])
+        assert len(tool_messages) == 1
+        assert tool_messages[0].artifact == {"Latest Pokemon game?": search_output}
+
+    def test_execute_tools_structured_no_search(self):
+        """Test that a structured result without search indicators runs no tools."""
+        tool_executor = MagicMock()
+
+        state = [
+            HumanMessage(content="Hello"),
+            AIMessage(content="", additional_kwargs={"structured": {"needs_search": False}})
+        ]
+
+        assert execute_tools(state, tool_executor) == []
+        tool_executor.batch.assert_not_called()